@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Agent Runtime - 모든 역할의 에이전트를 하나의 asyncio 이벤트 루프에서 실행
+
+  python3 agent_runtime.py                  # 역할별 워커 1개씩
+  python3 agent_runtime.py backend=4 qa=2   # 역할별 동시 실행 워커 수 지정
+  python3 agent_runtime.py --task-backend=memory --shared-dir=/dev/shm/claudeteam   # 영속성 없는 빠른 시뮬레이션
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from agent_simulator import AgentSimulator
+from task_handlers import run_task
+from config import load_config, strip_config_args
+from task_watcher import PendingTaskWatcher
+from mcp_server import SharedWorkspaceMCP
+from task_store import FileTaskStore
+from heartbeat import HEARTBEAT_INTERVAL, Heartbeat
+from transport import default_coalesce_key
+from metrics import REGISTRY
+from spec_store import apply_delta
+
+AGENT_TYPES = ["pm", "hardware", "backend", "frontend", "qa"]
+
+
+def _runtime_coalesce_key(channel, message):
+    """new_task는 깨우기 신호일 뿐이므로 채널별로 하나만 남김"""
+    if isinstance(message, dict) and message.get("type") == "new_task":
+        return (channel, "new_task")
+    return default_coalesce_key(channel, message)
+
+
+class AgentRuntime:
+    """역할별 워커 코루틴 실행기 (SharedWorkspaceMCP 인스턴스와 작업 저장소 공유)"""
+
+    def __init__(self, concurrency=None, base_dir=None, idle_interval=10, reap_interval=30, workspace=None,
+                 work_time=None, config=None):
+        self.config = config or (workspace.config if workspace else load_config(home=base_dir))
+        self.base_dir = self.config.home
+        self.concurrency = concurrency or {agent_type: 1 for agent_type in AGENT_TYPES}
+        self.idle_interval = idle_interval
+        self.reap_interval = reap_interval
+        self.work_time = work_time  # None이면 작업마다 5-15초 (AgentSimulator.work_time)
+        self.workspace = workspace or SharedWorkspaceMCP(config=self.config)
+        self.task_store = self.workspace.task_store
+        self.scheduler = self.workspace.scheduler
+        self._tasks_arrived = None
+        # 워커별 생존 신호 (신호마다 lease도 연장, 이벤트 루프가 멈추면 신호도 끊김)
+        self.heartbeat = Heartbeat(self.workspace.workspace_dir / "heartbeats", on_beat=self.task_store.renew_lease)
+        self.specs = {}  # 제품 → 마지막으로 받은 스펙 (spec_update 알림마다 변경분만 받아 갱신)
+
+    def _notify(self):
+        """새 작업 도착 - 대기 중인 모든 워커 깨우기"""
+        self._tasks_arrived.set()
+        self._tasks_arrived = asyncio.Event()
+
+    async def _watch_pending(self):
+        """pending 디렉토리 감시 (inotify는 이벤트 루프에 등록, 아니면 폴링)"""
+        if not isinstance(self.task_store, FileTaskStore):
+            # sqlite/memory 저장소는 pending 디렉토리가 없으므로 저장소 변경 알림으로 깨움
+            # (MCP I/O 스레드에서 호출될 수 있어 call_soon_threadsafe)
+            loop = asyncio.get_running_loop()
+
+            def on_change(event, task):
+                if event in ("created", "pending"):
+                    loop.call_soon_threadsafe(self._notify)
+
+            def on_batch(event, tasks):
+                on_change(event, None)  # 일괄 생성은 한 번만 깨움
+
+            self.task_store.add_listener(on_change, on_batch)
+            print(f"[RUNTIME] Task pickup mode: {self.config.task_backend} store events")
+            await asyncio.Future()
+        watcher = PendingTaskWatcher(self.workspace.workspace_dir / "tasks" / "pending")
+        print(f"[RUNTIME] Task pickup mode: {watcher.mode}")
+        loop = asyncio.get_running_loop()
+        try:
+            if watcher.mode == "inotify":
+                loop.add_reader(watcher.fileno(), lambda: watcher.drain() and self._notify())
+                await asyncio.Future()
+            else:
+                while True:
+                    if watcher.wait(0):
+                        self._notify()
+                    await asyncio.sleep(watcher.poll_interval)
+        finally:
+            if watcher.mode == "inotify":
+                loop.remove_reader(watcher.fileno())
+            watcher.close()
+
+    async def _watch_notifications(self):
+        """Redis 알림 구독 (다른 호스트에서 만든 작업도 바로 깨우기, Redis가 없으면 종료)"""
+        channels = [f"agent:{agent_type}_claude" for agent_type in self.concurrency] + ["broadcast"]
+        subscription = self.workspace.subscribe(channels, maxsize=100, coalesce_key=_runtime_coalesce_key)
+        if subscription is None:
+            return
+        async for channel, message in subscription:
+            if not isinstance(message, dict):
+                continue
+            if message.get("type") == "new_task":
+                self._notify()
+            elif message.get("type") == "spec_update":
+                await self._sync_spec(message.get("product"))
+
+    async def _sync_spec(self, product):
+        """알고 있는 버전 이후의 델타만 받아 로컬 스펙 갱신 (처음이거나 이력이 끊겼으면 전체)"""
+        known = self.specs.get(product)
+        if known is None:
+            spec = await self.workspace.get_product_spec(product)
+        else:
+            update = await self.workspace.get_product_spec(product, since_version=known.get("version", 0))
+            spec = update and update.get("spec")
+            if update and spec is None:
+                for delta in update["changes"]:
+                    apply_delta(known, delta)
+                spec = known
+        if spec is None:
+            return
+        self.specs[product] = spec
+        print(f"[RUNTIME] Spec updated: {product} v{spec.get('version', 0)}")
+
+    async def _reap_stale_leases(self):
+        """죽은 워커가 잡고 있던 작업 주기적으로 회수"""
+        while True:
+            for reaped in await asyncio.to_thread(self.task_store.reap_expired_leases):
+                print(f"[RUNTIME] Stale task {reaped['id']} → {reaped['status']} (retry {reaped['retries']})")
+            await asyncio.sleep(self.reap_interval)
+
+    async def _send_heartbeats(self):
+        """모든 워커의 생존 신호를 한 번에 갱신"""
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            await asyncio.to_thread(self.heartbeat.beat)
+
+    async def _run_task(self, agent, task):
+        """작업 본문 실행 - simulate는 이벤트 루프에서 대기만, 다른 핸들러는 스레드(풀이 있으면 프로세스 풀)에서"""
+        if task.get("handler", "simulate") == "simulate":
+            await asyncio.sleep(agent.work_time())
+            return run_task(agent.agent_type, task, 0)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(agent.executor, run_task, agent.agent_type, task, agent.work_time())
+
+    async def _worker(self, agent_type: str, index: int):
+        """AgentSimulator 동작을 블로킹 sleep 없이 실행하는 워커 코루틴
+
+        저장소/상태 파일 I/O는 스레드에서 (한 워커의 디스크 대기가 다른 워커를 막지 않도록)
+        """
+        worker_id = f"{agent_type}_claude-{socket.gethostname()}-{os.getpid()}-{index}"
+        agent = AgentSimulator(agent_type, config=self.config, idle_interval=self.idle_interval,
+                               worker_id=worker_id, task_store=self.task_store,
+                               scheduler=self.scheduler, status_writer=self.workspace.status_writer,
+                               work_time=self.work_time)
+        agent.update_status("Initializing")
+        self.heartbeat.register(worker_id, f"{agent_type}_claude")
+        next_idle_at = time.monotonic()
+
+        try:
+            while True:
+                # 확인 전에 이벤트를 잡아 두어야 확인~대기 사이에 온 알림을 놓치지 않음
+                tasks_arrived = self._tasks_arrived
+                try:
+                    await asyncio.to_thread(self.task_store.renew_lease, worker_id)
+
+                    task = await asyncio.to_thread(agent.claim_next_task)
+                    if task:
+                        try:
+                            result = await self._run_task(agent, task)
+                        except Exception as e:
+                            await asyncio.to_thread(agent.fail_task, task, e)
+                            continue
+                        await asyncio.to_thread(agent.finish_task, task, result)
+                        continue
+
+                    if time.monotonic() >= next_idle_at:
+                        await asyncio.to_thread(agent.idle_behavior)
+                        next_idle_at = time.monotonic() + self.idle_interval
+
+                    try:
+                        await asyncio.wait_for(tasks_arrived.wait(), max(next_idle_at - time.monotonic(), 0))
+                    except asyncio.TimeoutError:
+                        pass
+                except Exception as e:
+                    print(f"[{agent_type.upper()}] Error: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            self.workspace.status_writer.flush()
+            self.heartbeat.unregister(worker_id)
+            self.task_store.release_lease(worker_id)
+
+    async def run(self):
+        """모든 워커 실행"""
+        await self.workspace.connect_redis()
+        self._tasks_arrived = asyncio.Event()
+        REGISTRY.start_dumping(self.workspace.workspace_dir / "metrics" / f"runtime-{socket.gethostname()}-{os.getpid()}.prom")
+
+        workers = [
+            self._worker(agent_type, index)
+            for agent_type, count in self.concurrency.items()
+            for index in range(count)
+        ]
+        print(f"[RUNTIME] {len(workers)} agents started: "
+              + ", ".join(f"{agent_type}×{count}" for agent_type, count in self.concurrency.items()))
+        await asyncio.gather(self._watch_pending(), self._watch_notifications(), self._reap_stale_leases(),
+                             self._send_heartbeats(), *workers)
+
+
+def parse_concurrency(args):
+    """["backend=4", "qa"] → {"backend": 4, "qa": 1}"""
+    concurrency = {}
+    for arg in args:
+        agent_type, _, count = arg.partition("=")
+        if agent_type not in AGENT_TYPES:
+            raise ValueError(f"Unknown agent type: {agent_type}")
+        concurrency[agent_type] = int(count or 1)
+    return concurrency or None
+
+
+if __name__ == "__main__":
+    try:
+        runtime = AgentRuntime(concurrency=parse_concurrency(strip_config_args(sys.argv[1:])),
+                               config=load_config(sys.argv[1:]))
+    except ValueError as e:
+        print(e)
+        print("Usage: agent_runtime.py [<agent_type>[=<workers>] ...] [--home=<dir>] [--shared-dir=<dir>]"
+              " [--task-backend=file|sqlite|memory] [--config=<file>]")
+        print("Agent types: " + ", ".join(AGENT_TYPES))
+        sys.exit(1)
+    try:
+        asyncio.run(runtime.run())
+    except KeyboardInterrupt:
+        print("[RUNTIME] Shutting down...")
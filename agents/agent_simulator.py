@@ -4,20 +4,71 @@ AI Agent Simulator - 실제 Claude 대신 시뮬레이션 동작
 """
 
 import json
+import os
+import socket
+import threading
 import time
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import random
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from task_watcher import PendingTaskWatcher, StoreTaskWatcher
+from task_handlers import run_task
+from codec import read_record, write_record
+from config import load_config, strip_config_args
+from task_store import FileTaskStore, LeaseLostError, MemoryTaskStore
+from task_queue import TaskScheduler
+from status_writer import StatusWriter
+from daily_stats import DailyStats
+from heartbeat import Heartbeat
+from metrics import LATENCY_BUCKETS, REGISTRY, histogram
+
+TASK_WAIT = histogram("claudeteam_task_wait_seconds", "작업 생성(pending)부터 claim(in_progress)까지", ["agent"])
+TASK_DURATION = histogram("claudeteam_task_duration_seconds", "claim부터 완료/실패 처리까지", ["agent", "outcome"])
+FILE_IO = histogram("claudeteam_file_io_seconds", "에이전트 파일 읽기/쓰기 시간", ["op"], buckets=LATENCY_BUCKETS)
+TASK_CLAIM = FILE_IO.labels("task_claim")
+TASK_TRANSITION = FILE_IO.labels("task_transition")
+STATUS_WRITE = FILE_IO.labels("update_status")
+
 class AgentSimulator:
-    def __init__(self, agent_type):
+    def __init__(self, agent_type, base_dir=None, idle_interval=10, worker_id=None, task_store=None,
+                 pool_workers=0, scheduler=None, status_writer=None, work_time=None, config=None,
+                 now=None, rng=None):
         self.agent_type = agent_type
-        self.base_dir = Path("/home/jyjjeon/claudeteam-startup")
-        self.shared_dir = self.base_dir / "shared-workspace"
+        # 작업 공간 위치/저장소 백엔드 (base_dir을 주면 그 아래 shared-workspace 사용)
+        self.config = config or load_config(home=base_dir)
+        self.base_dir = self.config.home
+        self.idle_interval = idle_interval  # 자율 동작 주기 (초)
+        self.work_seconds = work_time  # 작업 시뮬레이션 시간 고정값 (None이면 5-15초 무작위)
+        # 시각/난수 (discrete_sim.py는 가상 시계와 seed 고정 Random을 넘김)
+        self.now = now or datetime.now
+        self.rng = rng or random
+        self.shared_dir = self.config.shared_dir
         self.workspace = self.base_dir / f"{agent_type}-workspace"
         self.workspace.mkdir(parents=True, exist_ok=True)
         
+        # 같은 역할의 워커를 여러 개 띄울 수 있도록 워커별 ID로 작업을 claim
+        self.worker_id = worker_id or f"{agent_type}_claude-{socket.gethostname()}-{os.getpid()}"
+        if task_store is None:
+            # 직접 연 저장소의 상태 변경도 일일 보고서 집계에 기록
+            task_store = self.config.open_task_store()
+            DailyStats(self.shared_dir / "reports" / "activity").attach(task_store)
+        self.task_store = task_store
+        # 우선순위 큐 (aging/마감 시한 반영, 저장소가 바뀔 때만 동기화)
+        self.scheduler = scheduler or TaskScheduler(self.task_store, assigned_to=f"{agent_type}_claude")
+        # 상태 파일 기록 (변경 없는 쓰기 생략, 짧은 간격의 업데이트는 병합)
+        self.status_writer = status_writer or StatusWriter(self.shared_dir / "status")
+        
+        # pool_workers > 0 이면 작업 본문을 프로세스 풀에서 실행 (CPU 작업을 여러 코어로 분산)
+        self.pool_workers = pool_workers
+        self.executor = ProcessPoolExecutor(max_workers=pool_workers) if pool_workers > 0 else None
+        self._pool_slots = threading.BoundedSemaphore(pool_workers) if pool_workers > 0 else None
+        self._started = {}  # 작업 ID → claim 시각 (처리 시간/추적용)
+        
         # 에이전트별 동작 정의
         self.agent_behaviors = {
             "pm": self.pm_behavior,
@@ -29,28 +80,62 @@ class AgentSimulator:
     
     def run(self):
         """에이전트 실행"""
-        print(f"[{self.agent_type.upper()}] Agent started at {datetime.now()}")
+        print(f"[{self.agent_type.upper()}] Agent started at {self.now()}")
         
         # 상태 업데이트
         self.update_status("Initializing")
         
+        # 새 작업 도착 이벤트 대기 (inotify → Redis → 폴링)
+        if isinstance(self.task_store, FileTaskStore):
+            watcher = PendingTaskWatcher(
+                self.shared_dir / "tasks" / "pending",
+                redis_channel=f"agent:{self.agent_type}_claude"
+            )
+        else:
+            # sqlite/memory 저장소는 pending 디렉토리가 없으므로 저장소 변경 알림으로 깨움
+            watcher = StoreTaskWatcher(
+                self.task_store, assigned_to=f"{self.agent_type}_claude",
+                redis_channel=f"agent:{self.agent_type}_claude",
+                shared=not isinstance(self.task_store, MemoryTaskStore)
+            )
+        print(f"[{self.agent_type.upper()}] Task pickup mode: {watcher.mode}")
+        next_idle_at = time.monotonic()
+        stop_metrics = REGISTRY.start_dumping(self.shared_dir / "metrics" / f"{self.worker_id}.prom")
+        # 생존 신호 (별도 스레드 - 작업 처리 중에도 신호와 lease 연장이 계속되고, 프로세스가 죽으면 함께 끊김)
+        heartbeat = Heartbeat(self.shared_dir / "heartbeats", on_beat=self.task_store.renew_lease)
+        heartbeat.register(self.worker_id, f"{self.agent_type}_claude")
+        heartbeat.start()
+        
         # 작업 확인 및 수행 루프
         while True:
             try:
-                # 작업 확인
-                tasks = self.get_pending_tasks()
+                self.task_store.renew_lease(self.worker_id)
+                
+                # 프로세스 풀이 가득 차 있으면 빈 자리가 날 때까지 대기 (빈 자리는 process_task가 반납)
+                if self.executor and not self._pool_slots.acquire(timeout=self.idle_interval):
+                    continue
+                
+                # 작업 확인 (유효 우선순위가 가장 높은 작업)
+                task = self.next_task()
                 
-                if tasks:
-                    task = tasks[0]  # 우선순위가 가장 높은 작업
+                if task:
                     self.process_task(task)
-                else:
-                    # 에이전트별 자율 동작
-                    if self.agent_type in self.agent_behaviors:
-                        self.agent_behaviors[self.agent_type]()
-                    else:
-                        self.update_status("Idle")
+                    continue  # 대기 없이 다음 작업 확인
                 
-                time.sleep(10)  # 10초마다 체크
+                if self.executor:
+                    self._pool_slots.release()
+                
+                # 에이전트별 자율 동작 (idle_interval마다)
+                if time.monotonic() >= next_idle_at:
+                    # 죽은 워커가 잡고 있던 작업 회수
+                    for reaped in self.task_store.reap_expired_leases():
+                        print(f"[{self.agent_type.upper()}] Stale task {reaped['id']} → {reaped['status']}"
+                              f" (retry {reaped['retries']})")
+                    self.idle_behavior()
+                    next_idle_at = time.monotonic() + self.idle_interval
+                
+                # 작업이 들어오거나 다음 자율 동작 시점까지 대기
+                watcher.wait(next_idle_at - time.monotonic())
                 
             except KeyboardInterrupt:
                 print(f"[{self.agent_type.upper()}] Shutting down...")
@@ -58,39 +143,153 @@ class AgentSimulator:
             except Exception as e:
                 print(f"[{self.agent_type.upper()}] Error: {e}")
                 time.sleep(5)
+        
+        watcher.close()
+        heartbeat.stop()
+        stop_metrics.set()
+        self.status_writer.flush()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        self.task_store.release_lease(self.worker_id)
     
     def get_pending_tasks(self):
-        """대기 중인 작업 조회"""
-        tasks = []
-        pending_dir = self.shared_dir / "tasks" / "pending"
-        
-        if pending_dir.exists():
-            for task_file in pending_dir.glob("*.json"):
-                task = json.loads(task_file.read_text())
-                if task.get("assigned_to") == f"{self.agent_type}_claude":
-                    tasks.append(task)
-        
-        return sorted(tasks, key=lambda x: x.get("priority", 0), reverse=True)
+        """대기 중인 작업 조회 (처리될 순서대로)"""
+        self.scheduler.sync()
+        return self.scheduler.ordered(f"{self.agent_type}_claude")
+    
+    def next_task(self):
+        """대기열에서 다음 작업 꺼내기"""
+        self.scheduler.sync()
+        return self.scheduler.pop(f"{self.agent_type}_claude")
     
     def process_task(self, task):
         """작업 처리"""
-        task_id = task["id"]
-        print(f"[{self.agent_type.upper()}] Processing task: {task['title']}")
+        if not self.start_task(task):
+            if self.executor:
+                self._pool_slots.release()
+            return
         
-        # 작업을 진행 중으로 이동
-        self.move_task(task_id, "pending", "in_progress")
-        self.update_status(f"Working on: {task['title']}")
+        # 프로세스 풀 모드: 작업 본문만 풀로 보내고 완료/실패 처리는 콜백에서
+        if self.executor:
+            future = self.executor.submit(run_task, self.agent_type, task, self.work_time())
+            future.add_done_callback(lambda f: self._on_pool_task_done(task, f))
+            return
         
         # 작업 시뮬레이션 (5-15초)
-        work_time = random.randint(5, 15)
-        time.sleep(work_time)
+        try:
+            result = run_task(self.agent_type, task, self.work_time())
+        except Exception as e:
+            self.fail_task(task, e)
+            return
         
-        # 작업 완료
-        self.move_task(task_id, "in_progress", "completed")
+        self.finish_task(task, result)
+    
+    def _on_pool_task_done(self, task, future):
+        """프로세스 풀 작업 완료 콜백 (예외는 작업 상태로 기록)"""
+        try:
+            error = future.exception()
+            if error:
+                self.fail_task(task, error)
+            else:
+                self.finish_task(task, future.result())
+        except Exception as e:
+            print(f"[{self.agent_type.upper()}] Error: {e}")
+        finally:
+            self._pool_slots.release()
+    
+    def claim_next_task(self):
+        """우선순위 순으로 claim을 시도해 처음 성공한 작업 반환"""
+        task = self.next_task()
+        while task:
+            if self.start_task(task):
+                return task
+            task = self.next_task()
+        return None
+    
+    def start_task(self, task):
+        """작업 시작 - 진행 중으로 이동 (다른 워커가 먼저 가져갔으면 False)"""
+        # 원자적 claim: pending → in_progress/<worker_id>/
+        claimed_at = self.now()
+        started = time.perf_counter()
+        claimed = self.task_store.claim(task["id"], self.worker_id, updated_at=claimed_at.isoformat())
+        self._observe_store(TASK_CLAIM, "task_claim", started, task)
+        if not claimed:
+            return False
+        self._started[task["id"]] = (time.time(), time.perf_counter())
+        try:
+            TASK_WAIT.observe((claimed_at - datetime.fromisoformat(task["created_at"])).total_seconds(),
+                              self.agent_type)
+        except (KeyError, TypeError, ValueError):
+            pass
+        print(f"[{self.agent_type.upper()}] Processing task: {task['title']}")
+        self.update_status(f"Working on: {task['title']}")
+        return True
+    
+    def work_time(self):
+        """작업 시뮬레이션 시간 (초)"""
+        if self.work_seconds is not None:
+            return self.work_seconds
+        return self.rng.randint(5, 15)
+    
+    def _observe_task(self, task, outcome):
+        """claim부터 지금까지의 처리 시간 기록 (추적이 켜져 있으면 process_task span도)"""
+        started = self._started.pop(task["id"], None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started[1]
+        TASK_DURATION.observe(elapsed, self.agent_type, outcome)
+        REGISTRY.tracer.record_span("process_task", started[0], elapsed, agent=self.agent_type,
+                                    task_id=task["id"], outcome=outcome)
+    
+    def _observe_store(self, child, span, started, task):
+        """저장소 호출(claim/transition) 시간 기록 - 호출당 수백 µs라 타이머 객체 대신 perf_counter 두 번"""
+        elapsed = time.perf_counter() - started
+        child.observe(elapsed)
+        if REGISTRY.tracer.enabled:
+            REGISTRY.tracer.record_span(span, time.time() - elapsed, elapsed, agent=self.agent_type,
+                                        task_id=task["id"])
+    
+    def _transition(self, task, new_status, **fields):
+        """worker 소유 작업의 상태 변경 (lease를 잃었으면 LeaseLostError)"""
+        started = time.perf_counter()
+        try:
+            return self.task_store.transition(task["id"], new_status, worker_id=self.worker_id,
+                                              updated_at=self.now().isoformat(), **fields)
+        finally:
+            self._observe_store(TASK_TRANSITION, "task_transition", started, task)
+    
+    def finish_task(self, task, result=None):
+        """작업 완료 처리 및 리포트 생성"""
+        # lease가 만료되어 다른 워커에게 넘어갔으면 결과 버림
+        try:
+            self._transition(task, "completed")
+        except LeaseLostError:
+            print(f"[{self.agent_type.upper()}] Lost lease on task: {task['title']}")
+            self._observe_task(task, "lease_lost")
+            return
+        self._observe_task(task, "completed")
         self.update_status("Task completed")
         
         # 결과 리포트 생성
-        self.create_task_report(task)
+        self.create_task_report(task, result)
+    
+    def fail_task(self, task, error):
+        """작업 실패 - 예외를 작업 상태(blocked)에 기록"""
+        print(f"[{self.agent_type.upper()}] Task failed: {task['title']} ({error!r})")
+        try:
+            self._transition(task, "blocked", error=repr(error))
+        except LeaseLostError:
+            self._observe_task(task, "lease_lost")
+            return
+        self._observe_task(task, "blocked")
+        self.update_status(f"Blocked: {task['title']}")
+    
+    def idle_behavior(self):
+        """대기 중 에이전트별 자율 동작"""
+        if self.agent_type in self.agent_behaviors:
+            self.agent_behaviors[self.agent_type]()
+        else:
+            self.update_status("Idle")
     
     def move_task(self, task_id, from_status, to_status):
         """작업 상태 변경"""
@@ -98,12 +297,12 @@ class AgentSimulator:
         to_path = self.shared_dir / "tasks" / to_status / f"{task_id}.json"
         
         if from_path.exists():
-            task = json.loads(from_path.read_text())
+            task = read_record(from_path)
             task["status"] = to_status
-            task["updated_at"] = datetime.now().isoformat()
+            task["updated_at"] = self.now().isoformat()
             
             to_path.parent.mkdir(parents=True, exist_ok=True)
-            to_path.write_text(json.dumps(task, indent=2))
+            write_record(to_path, task)
             from_path.unlink()
     
     def update_status(self, status_text):
@@ -111,23 +310,24 @@ class AgentSimulator:
         status = {
             "agent": f"{self.agent_type}_claude",
             "current_task": status_text,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.now().isoformat()
         }
-        
-        status_dir = self.shared_dir / "status"
-        status_dir.mkdir(parents=True, exist_ok=True)
-        status_file = status_dir / f"{self.agent_type}_claude.json"
-        status_file.write_text(json.dumps(status, indent=2))
+        with STATUS_WRITE.time():
+            self.status_writer.update(status["agent"], status)
     
-    def create_task_report(self, task):
-        """작업 완료 리포트 생성"""
-        report = {
+    def task_report(self, task, result=None):
+        """작업 완료 리포트 내용"""
+        return {
             "task_id": task["id"],
             "task_title": task["title"],
             "completed_by": f"{self.agent_type}_claude",
-            "completed_at": datetime.now().isoformat(),
-            "results": f"Successfully completed {task['title']}"
+            "completed_at": self.now().isoformat(),
+            "results": (result or {}).get("results", f"Successfully completed {task['title']}")
         }
+    
+    def create_task_report(self, task, result=None):
+        """작업 완료 리포트 생성"""
+        report = self.task_report(task, result)
         
         reports_dir = self.shared_dir / "reports"
         reports_dir.mkdir(parents=True, exist_ok=True)
@@ -138,7 +338,7 @@ class AgentSimulator:
     
     def pm_behavior(self):
         """PM 에이전트 자율 동작"""
-        if random.random() < 0.3:  # 30% 확률로 제안서 생성
+        if self.rng.random() < 0.3:  # 30% 확률로 제안서 생성
             self.create_product_proposal()
         else:
             self.update_status("Market research")
@@ -146,15 +346,15 @@ class AgentSimulator:
     def create_product_proposal(self):
         """제품 제안서 생성"""
         products = ["Smart Lock", "Pet Tracker", "Plant Monitor", "Energy Meter"]
-        product = random.choice(products)
+        product = self.rng.choice(products)
         
         proposal = {
             "product_name": product,
             "category": "IoT/SmartHome",
             "target_customer": "Tech-savvy homeowners",
-            "price": f"₩{random.randint(30, 100)*1000:,}",
-            "development_time": f"{random.randint(4, 12)} weeks",
-            "created_at": datetime.now().isoformat()
+            "price": f"₩{self.rng.randint(30, 100)*1000:,}",
+            "development_time": f"{self.rng.randint(4, 12)} weeks",
+            "created_at": self.now().isoformat()
         }
         
         proposals_dir = self.base_dir / "pm-workspace" / "proposals"
@@ -182,10 +382,20 @@ class AgentSimulator:
         self.update_status("Running tests")
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        agent_type = sys.argv[1]
-        simulator = AgentSimulator(agent_type)
+    config = load_config(sys.argv[1:])
+    args = [arg for arg in strip_config_args(sys.argv[1:]) if not arg.startswith("--")]
+    pool_workers = next((int(arg.split("=", 1)[1]) for arg in sys.argv[1:] if arg.startswith("--pool=")), 0)
+    work_time = next((float(arg.split("=", 1)[1]) for arg in sys.argv[1:] if arg.startswith("--work-time=")), None)
+    
+    if args:
+        agent_type = args[0]
+        worker_id = args[1] if len(args) > 1 else None
+        if config.task_backend == "memory":
+            print(f"[{agent_type.upper()}] memory task store is private to this process - use agent_runtime.py to share it")
+        simulator = AgentSimulator(agent_type, worker_id=worker_id, pool_workers=pool_workers, work_time=work_time,
+                                   config=config)
         simulator.run()
     else:
-        print("Usage: agent_simulator.py <agent_type>")
+        print("Usage: agent_simulator.py <agent_type> [worker_id] [--pool=<workers>] [--work-time=<seconds>]"
+              " [--home=<dir>] [--shared-dir=<dir>] [--task-backend=file|sqlite|memory] [--config=<file>]")
         print("Agent types: pm, hardware, backend, frontend, qa")
\ No newline at end of file
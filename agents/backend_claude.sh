@@ -2,8 +2,8 @@
 # Backend Claude - Server Developer Agent
 
 AGENT_NAME="backend_claude"
-WORKSPACE="/home/jyjjeon/claudeteam-startup/engineering/backend"
-SHARED="/home/jyjjeon/claudeteam-startup/shared-workspace"
+WORKSPACE="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/engineering/backend"
+SHARED="${CLAUDETEAM_SHARED_DIR:-${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/shared-workspace}"
 
 # 작업 공간 준비
 mkdir -p $WORKSPACE/{api,database,mqtt,cloud,tests}
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Discrete Event Simulation - 가상 시계로 팀 활동을 빨리 감기
+
+  python3 discrete_sim.py --days 7                                   # 일주일 (시간당 작업 60개, 역할별 1명)
+  python3 discrete_sim.py --days 30 --tasks-per-hour 20000 --agents backend=4 qa=2 --seed 7 --out /tmp/sim
+
+- AgentSimulator의 작업 처리(claim → 완료/실패 → 리포트)와 역할별 자율 동작을 그대로 호출하되,
+  시간은 이벤트 힙의 가상 시계로만 흐른다 (sleep 없음). 같은 --seed/--start면 같은 결과
+- 작업 시간은 실제 에이전트처럼 5-15초 (--work-time으로 고정 가능), 자율 동작은 쉬는 동안 idle_interval마다
+- 산출물은 실제 실행과 같은 위치/형식: 활동 로그(reports/activity), 매일 18시 일일 보고서,
+  매시 30분 보관(archive), 상태 파일, PM 제안서. 작업 리포트 파일은 보관 정책처럼 최근 --keep-reports개만 남김
+- 작업 저장소는 MemoryTaskStore, 지표 수집은 끔 (처리 시간 히스토그램이 가상 시간과 맞지 않음)
+"""
+
+import argparse
+import heapq
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from agent_simulator import AgentSimulator
+from config import Config
+from daily_stats import DailyStats, _as_date, _empty_bucket
+from job_scheduler import CronSchedule
+from mcp_server import SharedWorkspaceMCP
+from metrics import REGISTRY
+from status_writer import StatusWriter
+from task_handlers import run_task
+from task_queue import TaskScheduler
+from task_store import MemoryTaskStore, write_atomic
+
+AGENT_TYPES = ["pm", "hardware", "backend", "frontend", "qa"]
+
+# 이벤트 종류 (힙 항목: (가상 시각, 순번, 종류, 대상))
+ARRIVAL, FINISH, IDLE, JOB = range(4)
+
+# 활동 로그 한 줄 인코더 (json.dumps는 호출마다 인코더를 새로 만듦)
+_encode_line = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class SimClock:
+    """가상 시계 (epoch 초) - 같은 시각의 datetime은 한 번만 만듦"""
+
+    def __init__(self, start):
+        self.t = start.timestamp()
+        self._now_t = None
+        self._now = None
+
+    def time(self):
+        return self.t
+
+    def now(self):
+        if self._now_t != self.t:
+            self._now_t, self._now = self.t, datetime.fromtimestamp(self.t)
+        return self._now
+
+
+class SimDailyStats(DailyStats):
+    """가상 시각 기준 활동 집계 - 로그 줄은 모아서 쓰고 집계는 메모리에 바로 반영 (파일을 다시 읽지 않음)"""
+
+    def __init__(self, stats_dir, now, buffer_lines=20000):
+        super().__init__(stats_dir, now)
+        self.buffer_lines = buffer_lines
+        self._lines = defaultdict(list)
+        self._buffered = 0
+
+    def record(self, event, task):
+        now = self.now()
+        key = now.date().isoformat()
+        entry = {"at": now.isoformat(), "event": event, "task": task}
+        self._lines[key].append(_encode_line(entry))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _empty_bucket(key)
+        self._apply(bucket, entry)
+        self._buffered += 1
+        if self._buffered >= self.buffer_lines:
+            self.flush()
+
+    def record_many(self, event, tasks):
+        for task in tasks:
+            self.record(event, task)
+
+    def day(self, day=None):
+        key = _as_date(day, self.now).isoformat()
+        return self._buckets.setdefault(key, _empty_bucket(key))
+
+    def flush(self):
+        for key, lines in self._lines.items():
+            with open(self._path(key), "a") as f:
+                f.write("\n".join(lines) + "\n")
+        self._lines.clear()
+        self._buffered = 0
+
+    def forget_before(self, day):
+        """보고서를 이미 만든 지난 날짜의 집계 버림 (메모리 제한)"""
+        for key in [key for key in self._buckets if key < day]:
+            del self._buckets[key]
+
+
+class SimStatusWriter(StatusWriter):
+    """상태는 모아 두었다가 flush()에서만 기록 (가상 시간에서는 쓰기 병합 창이 의미 없음)"""
+
+    def update(self, agent, status):
+        with self._lock:
+            self._pending[agent] = status
+        return False
+
+
+class SimAgent(AgentSimulator):
+    """시뮬레이션용 에이전트 - 작업 리포트는 최근 것만 메모리에 두었다가 끝에 기록"""
+
+    def __init__(self, *args, reports=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reports = reports
+        self.current = None  # 처리 중인 작업
+        self.next_idle_at = 0.0  # 다음 자율 동작 가상 시각
+        self.tick_scheduled = False
+
+    def create_task_report(self, task, result=None):
+        self.reports.append(self.task_report(task, result))
+
+
+class _NullOutput:
+    """에이전트 로그 버림 (작업마다 print 하므로)"""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class TeamSimulation:
+    """가상 시계 이벤트 루프 - 작업 도착(포아송), 에이전트 처리/자율 동작, MCP 서버 정기 작업"""
+
+    def __init__(self, out_dir, concurrency=None, start=None, seed=1, tasks_per_hour=60.0,
+                 priority_weights=(1, 1, 1, 1, 1), work_time=None, fail_rate=0.0, idle_interval=10,
+                 keep_reports=500):
+        self.out_dir = Path(out_dir)
+        self.concurrency = concurrency or {agent_type: 1 for agent_type in AGENT_TYPES}
+        self.start = start or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.clock = SimClock(self.start)
+        self.rng = random.Random(seed)
+        self.tasks_per_hour = tasks_per_hour
+        self.priority_weights = list(priority_weights)
+        self.fail_rate = fail_rate
+        self.idle_interval = idle_interval
+
+        config = Config(home=self.out_dir, shared_dir=self.out_dir / "shared-workspace", task_backend="memory")
+        self.task_store = MemoryTaskStore()
+        self.scheduler = TaskScheduler(clock=self.clock.time)
+        self.daily_stats = SimDailyStats(config.shared_dir / "reports" / "activity", self.clock.now)
+        self.daily_stats.attach(self.task_store)
+        # 일일 보고서/보관은 MCP 서버 코드 그대로 사용
+        self.workspace = SharedWorkspaceMCP(
+            config=config, task_store=self.task_store, io_workers=0, scheduler=self.scheduler,
+            daily_stats=self.daily_stats, status_writer=SimStatusWriter(config.shared_dir / "status"))
+        self.reports = deque(maxlen=keep_reports)
+        self.agents = [
+            SimAgent(agent_type, config=config, worker_id=f"{agent_type}_claude-sim-{index}",
+                     task_store=self.task_store, scheduler=self.scheduler,
+                     status_writer=self.workspace.status_writer, idle_interval=idle_interval,
+                     work_time=work_time, now=self.clock.now, rng=self.rng, reports=self.reports)
+            for agent_type, count in self.concurrency.items()
+            for index in range(count)
+        ]
+        self.roles = list(self.concurrency)
+        self._idle = defaultdict(list)  # 역할 → 쉬고 있는 에이전트
+        self._events = []
+        self._seq = 0
+        self.created = 0
+        self.outcomes = defaultdict(int)
+        self.events = 0
+
+    def _schedule(self, at, kind, target):
+        self._seq += 1
+        heapq.heappush(self._events, (at, self._seq, kind, target))
+
+    def _add_job(self, cron, func):
+        """MCP 서버와 같은 cron 식으로 가상 시각에 실행"""
+        schedule = CronSchedule(cron)
+        self._schedule(schedule.next_after(self.clock.now()).timestamp(), JOB, (schedule, func))
+
+    def _next_arrival(self):
+        self._schedule(self.clock.t + self.rng.expovariate(self.tasks_per_hour / 3600), ARRIVAL, None)
+
+    def _arrive(self):
+        """새 작업 생성 (SharedWorkspaceMCP.create_task와 같은 저장소 기록 + 대기열 추가)"""
+        self.created += 1
+        role = self.rng.choice(self.roles)
+        now = self.clock.now().isoformat()
+        task = {
+            "id": f"sim_{self.created:09d}", "type": role, "title": f"시뮬레이션 작업 {self.created}",
+            "description": "discrete_sim", "assigned_to": f"{role}_claude", "created_by": "pm_claude",
+            "status": "pending", "priority": self.rng.choices(range(1, 6), self.priority_weights)[0],
+            "created_at": now, "updated_at": now,
+        }
+        self.task_store.create(task)
+        self.scheduler.push(task)
+        idle = self._idle[role]
+        if idle:
+            self._dispatch(idle.pop())
+        self._next_arrival()
+
+    def _dispatch(self, agent):
+        """다음 작업 claim, 없으면 쉬면서 자율 동작 예약"""
+        task = agent.claim_next_task()
+        agent.current = task
+        if task:
+            self._schedule(self.clock.t + agent.work_time(), FINISH, agent)
+            return
+        self._idle[agent.agent_type].append(agent)
+        if not agent.tick_scheduled:
+            agent.tick_scheduled = True
+            self._schedule(max(agent.next_idle_at, self.clock.t), IDLE, agent)
+
+    def _finish(self, agent):
+        task, agent.current = agent.current, None
+        try:
+            if self.fail_rate and self.rng.random() < self.fail_rate:
+                raise RuntimeError("simulated failure")
+            # 기본 simulate 핸들러는 sleep뿐이므로 가상 시간으로 대신함
+            result = None if task.get("handler", "simulate") == "simulate" else run_task(agent.agent_type, task, 0)
+        except Exception as e:
+            agent.fail_task(task, e)
+            self.outcomes["blocked"] += 1
+        else:
+            agent.finish_task(task, result)
+            self.outcomes["completed"] += 1
+        self._dispatch(agent)
+
+    def _idle_tick(self, agent):
+        agent.tick_scheduled = False
+        if agent.current is not None:
+            return
+        if self.clock.t >= agent.next_idle_at:
+            agent.idle_behavior()
+            agent.next_idle_at = self.clock.t + self.idle_interval
+        agent.tick_scheduled = True
+        self._schedule(agent.next_idle_at, IDLE, agent)
+
+    def _daily_report(self):
+        day = self.clock.now().date().isoformat()
+        self.workspace._build_daily_report(day)
+        self.daily_stats.forget_before(day)
+
+    def _archive(self):
+        self.workspace.archive_old_records()
+
+    def run(self, duration):
+        """duration(timedelta)만큼 가상 시간 진행, 결과 요약 반환"""
+        until = self.clock.t + duration.total_seconds()
+        for agent in self.agents:
+            agent.update_status("Initializing")
+            self._dispatch(agent)
+        self._next_arrival()
+        self._add_job("0 18 * * *", self._daily_report)
+        self._add_job("30 * * * *", self._archive)
+
+        metrics_enabled, REGISTRY.enabled = REGISTRY.enabled, False
+        stdout, sys.stdout = sys.stdout, _NullOutput()
+        started = time.perf_counter()
+        heap = self._events
+        try:
+            while heap and heap[0][0] <= until:
+                at, _, kind, target = heapq.heappop(heap)
+                self.clock.t = at
+                self.events += 1
+                if kind == FINISH:
+                    self._finish(target)
+                elif kind == ARRIVAL:
+                    self._arrive()
+                elif kind == IDLE:
+                    self._idle_tick(target)
+                else:
+                    schedule, func = target
+                    func()
+                    self._schedule(schedule.next_after(self.clock.now()).timestamp(), JOB, target)
+            self.clock.t = until
+            self._write_outputs()
+        finally:
+            sys.stdout = stdout
+            REGISTRY.enabled = metrics_enabled
+        elapsed = time.perf_counter() - started
+        return self.summary(elapsed)
+
+    def _write_outputs(self):
+        """버퍼에 남은 활동 로그/상태/최근 작업 리포트 기록"""
+        self.daily_stats.flush()
+        self.workspace.status_writer.flush()
+        reports_dir = self.workspace.workspace_dir / "reports"
+        for report in self.reports:
+            write_atomic(reports_dir / f"{report['task_id']}_report.json", json.dumps(report, indent=2))
+
+    def summary(self, elapsed):
+        simulated = self.clock.t - self.start.timestamp()
+        finished = self.outcomes["completed"] + self.outcomes["blocked"]
+        return {
+            "start": self.start.isoformat(),
+            "end": self.clock.now().isoformat(),
+            "simulated_hours": round(simulated / 3600, 2),
+            "agents": self.concurrency,
+            "tasks_created": self.created,
+            "tasks_completed": self.outcomes["completed"],
+            "tasks_blocked": self.outcomes["blocked"],
+            "tasks_pending": self.task_store.count("pending"),
+            "archived_tasks": self.workspace.archive.count("tasks"),
+            "events": self.events,
+            "wall_seconds": round(elapsed, 2),
+            "speedup": round(simulated / elapsed) if elapsed else None,
+            "tasks_per_wall_minute": round(finished / elapsed * 60) if elapsed else None,
+            "queues": self.scheduler.metrics(),
+            "output": str(self.workspace.workspace_dir),
+        }
+
+
+def parse_agents(values):
+    """["backend=4", "qa"] → {"backend": 4, "qa": 1}"""
+    concurrency = {}
+    for value in values:
+        agent_type, _, count = value.partition("=")
+        if agent_type not in AGENT_TYPES:
+            raise ValueError(f"Unknown agent type: {agent_type}")
+        concurrency[agent_type] = int(count or 1)
+    return concurrency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=float, default=7, help="시뮬레이션할 가상 기간 (일)")
+    parser.add_argument("--start", help="가상 시작 시각 (ISO, 기본: 오늘 0시)")
+    parser.add_argument("--tasks-per-hour", type=float, default=60, help="가상 시간당 새 작업 수 (포아송 도착)")
+    parser.add_argument("--agents", nargs="+", default=AGENT_TYPES, help="역할[=에이전트 수] (기본: 역할별 1명)")
+    parser.add_argument("--priority-weights", type=float, nargs=5, default=[1, 1, 1, 1, 1], metavar="W",
+                        help="우선순위 1..5 가중치")
+    parser.add_argument("--work-time", type=float, help="작업당 가상 처리 시간 (초, 기본: 5-15초 무작위)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="blocked로 끝나는 작업 비율")
+    parser.add_argument("--idle-interval", type=float, default=10, help="자율 동작 주기 (가상 초)")
+    parser.add_argument("--keep-reports", type=int, default=500, help="파일로 남길 최근 작업 리포트 수")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", help="산출물 디렉토리 (기본: 새 임시 디렉토리)")
+    args = parser.parse_args()
+    try:
+        concurrency = parse_agents(args.agents)
+    except ValueError as e:
+        parser.error(str(e))
+
+    out_dir = Path(args.out) if args.out else Path(tempfile.mkdtemp(prefix="claudeteam_sim_"))
+    simulation = TeamSimulation(
+        out_dir, concurrency=concurrency, start=datetime.fromisoformat(args.start) if args.start else None,
+        seed=args.seed, tasks_per_hour=args.tasks_per_hour, priority_weights=args.priority_weights,
+        work_time=args.work_time, fail_rate=args.fail_rate, idle_interval=args.idle_interval,
+        keep_reports=args.keep_reports,
+    )
+    print(f"[SIM] {args.days}일 시뮬레이션 → {out_dir}")
+    print(json.dumps(simulation.run(timedelta(days=args.days)), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
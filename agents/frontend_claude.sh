@@ -2,8 +2,8 @@
 # Frontend Claude - UI/UX Developer Agent
 
 AGENT_NAME="frontend_claude"
-WORKSPACE="/home/jyjjeon/claudeteam-startup/engineering/frontend"
-SHARED="/home/jyjjeon/claudeteam-startup/shared-workspace"
+WORKSPACE="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/engineering/frontend"
+SHARED="${CLAUDETEAM_SHARED_DIR:-${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/shared-workspace}"
 
 # 작업 공간 준비
 mkdir -p $WORKSPACE/{web-app,mobile-app,design,components}
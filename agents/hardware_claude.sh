@@ -2,8 +2,8 @@
 # Hardware Claude - Hardware Engineer Agent
 
 AGENT_NAME="hardware_claude"
-WORKSPACE="/home/jyjjeon/claudeteam-startup/engineering/hardware"
-SHARED="/home/jyjjeon/claudeteam-startup/shared-workspace"
+WORKSPACE="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/engineering/hardware"
+SHARED="${CLAUDETEAM_SHARED_DIR:-${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/shared-workspace}"
 
 # 작업 공간 준비
 mkdir -p $WORKSPACE/{schematics,firmware,3d-models,testing,datasheets}
@@ -2,8 +2,8 @@
 # PM Claude - Product Manager Agent
 
 AGENT_NAME="pm_claude"
-WORKSPACE="/home/jyjjeon/claudeteam-startup/pm-workspace"
-SHARED="/home/jyjjeon/claudeteam-startup/shared-workspace"
+WORKSPACE="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/pm-workspace"
+SHARED="${CLAUDETEAM_SHARED_DIR:-${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/shared-workspace}"
 
 # 작업 공간 준비
 mkdir -p $WORKSPACE/{market-research,proposals,roadmap,competitors}
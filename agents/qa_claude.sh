@@ -2,8 +2,8 @@
 # QA Claude - Quality Assurance Agent
 
 AGENT_NAME="qa_claude"
-WORKSPACE="/home/jyjjeon/claudeteam-startup/qa"
-SHARED="/home/jyjjeon/claudeteam-startup/shared-workspace"
+WORKSPACE="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/qa"
+SHARED="${CLAUDETEAM_SHARED_DIR:-${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/shared-workspace}"
 
 # 작업 공간 준비
 mkdir -p $WORKSPACE/{test-plans,automation,reports,ci-cd,docs}
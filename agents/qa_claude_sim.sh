@@ -1,7 +1,7 @@
 #!/bin/bash
 # QA Claude Simulator
 
-AGENT_DIR="/home/jyjjeon/claudeteam-startup/agents"
+AGENT_DIR="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}/agents"
 cd $AGENT_DIR
 
 echo "Starting QA Claude Agent Simulator..."
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Task Handlers - 작업 본문 실행 함수
+
+프로세스 풀에서도 실행되므로 모두 모듈 수준 함수이고, 인자와 반환값은 pickle 가능한 dict만 사용한다.
+작업의 "handler" 필드로 핸들러를 고르며, 없으면 simulate를 사용한다.
+"""
+
+import hashlib
+import time
+from typing import Dict
+
+
+def simulate_work(task: Dict, work_time: float) -> Dict:
+    """기존 시뮬레이션 - work_time초 대기"""
+    time.sleep(work_time)
+    return {"results": f"Successfully completed {task['title']}"}
+
+
+def checksum_work(task: Dict, work_time: float) -> Dict:
+    """CPU 작업 시뮬레이션 - 작업 본문을 cost회 반복 해싱 (리포트 생성/스펙 검증 대용)"""
+    digest = f"{task['id']}:{task['description']}".encode()
+    for _ in range(int(task.get("cost", 100_000))):
+        digest = hashlib.sha256(digest).digest()
+    return {"results": f"Checksum of {task['title']}: {digest.hex()[:16]}"}
+
+
+TASK_HANDLERS = {
+    "simulate": simulate_work,
+    "checksum": checksum_work,
+}
+
+
+def run_task(agent_type: str, task: Dict, work_time: float) -> Dict:
+    """작업 본문 실행 (예외는 호출한 쪽에서 작업 상태로 기록)"""
+    handler_name = task.get("handler", "simulate")
+    handler = TASK_HANDLERS.get(handler_name)
+    if handler is None:
+        raise ValueError(f"Unknown task handler: {handler_name}")
+    return handler(task, work_time)
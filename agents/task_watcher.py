@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Pending Task Watcher - 새 작업이 들어올 때까지 대기 (inotify → Redis → 폴링)
+
+pending 디렉토리가 없는 sqlite/memory 저장소는 StoreTaskWatcher (저장소 변경 알림 + Redis/버전 폴링)
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    """inotify를 지원하는 libc 로드 (Linux 전용)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class PendingTaskWatcher:
+    """pending 디렉토리 변경 이벤트 대기
+
+    1) inotify로 디렉토리 감시
+    2) 불가능하면 Redis `agent:<name>` 채널 구독
+    3) 둘 다 안 되면 디렉토리 mtime 폴링
+    """
+
+    def __init__(self, pending_dir: Path, redis_channel: str = None,
+                 redis_url: str = "redis://localhost", poll_interval: float = 1.0):
+        self.pending_dir = Path(pending_dir)
+        self.pending_dir.mkdir(parents=True, exist_ok=True)
+        self.poll_interval = poll_interval
+        self.mode = "poll"
+
+        self._fd = None
+        self._pubsub = None
+        self._last_mtime = self._dir_mtime()
+
+        if self._init_inotify():
+            self.mode = "inotify"
+        elif redis_channel and self._init_redis(redis_url, redis_channel):
+            self.mode = "redis"
+
+    def _init_inotify(self) -> bool:
+        libc = _load_libc()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+        wd = libc.inotify_add_watch(fd, str(self.pending_dir).encode(), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wd < 0:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def _init_redis(self, redis_url: str, channel: str) -> bool:
+        try:
+            import redis
+            client = redis.Redis.from_url(redis_url)
+            client.ping()
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(channel)
+            return True
+        except Exception:
+            self._pubsub = None
+            return False
+
+    def _dir_mtime(self):
+        try:
+            return self.pending_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def fileno(self):
+        """inotify 모드의 파일 디스크립터 (asyncio add_reader 등록용)"""
+        return self._fd
+
+    def drain(self) -> bool:
+        """쌓인 inotify 이벤트를 모두 읽고, 작업 파일 이벤트가 있었는지 반환"""
+        found = False
+        while True:
+            try:
+                buf = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return found
+            offset = 0
+            while offset < len(buf):
+                _, _, _, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+                # 임시 파일(.xxx.tmp) 쓰기는 무시
+                if name.endswith(b".json") and not name.startswith(b"."):
+                    found = True
+
+    def wait(self, timeout: float) -> bool:
+        """새 작업 이벤트가 오거나 timeout이 지날 때까지 대기 (이벤트가 있었으면 True)"""
+        deadline = time.monotonic() + max(timeout, 0)
+        while True:
+            remaining = deadline - time.monotonic()
+
+            if self.mode == "inotify":
+                readable, _, _ = select.select([self._fd], [], [], max(remaining, 0))
+                if readable and self.drain():
+                    return True
+            elif self.mode == "redis":
+                try:
+                    if self._pubsub.get_message(timeout=max(remaining, 0)):
+                        return True
+                except Exception:
+                    # Redis 연결이 끊기면 폴링으로 전환
+                    self._pubsub = None
+                    self.mode = "poll"
+            else:
+                time.sleep(max(min(self.poll_interval, remaining), 0))
+                mtime = self._dir_mtime()
+                if mtime != self._last_mtime:
+                    self._last_mtime = mtime
+                    return True
+
+            if time.monotonic() >= deadline:
+                return False
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+
+
+class StoreTaskWatcher:
+    """pending 디렉토리가 없는 저장소(sqlite/memory)의 새 작업 대기 - PendingTaskWatcher와 같은 인터페이스
+
+    1) 같은 프로세스의 변경은 저장소 알림(add_listener)으로 바로 깨움
+    2) 다른 프로세스의 변경은 Redis `agent:<name>` 채널, 안 되면 version(["pending"]) 폴링
+       (memory 저장소는 다른 프로세스가 쓸 수 없으므로 알림만)
+    """
+
+    def __init__(self, task_store, assigned_to: str = None, redis_channel: str = None,
+                 redis_url: str = "redis://localhost", poll_interval: float = 1.0, shared: bool = True):
+        self.task_store = task_store
+        self.assigned_to = assigned_to
+        self.poll_interval = poll_interval
+        self.mode = "store events"
+
+        self._event = threading.Event()
+        self._closed = False
+        self._pubsub = None
+        self._redis_thread = None
+        self._poll = False
+        self._last_version = None
+        task_store.add_listener(self._on_change, self._on_batch)
+
+        if shared:
+            if redis_channel and self._init_redis(redis_url, redis_channel):
+                self.mode = "store events + redis"
+            else:
+                self._poll = True
+                self._last_version = task_store.version(["pending"])
+                self.mode = "store events + poll"
+
+    def _mine(self, task) -> bool:
+        return self.assigned_to is None or task.get("assigned_to") == self.assigned_to
+
+    def _on_change(self, event, task):
+        if not self._closed and event in ("created", "pending") and self._mine(task):
+            self._event.set()
+
+    def _on_batch(self, event, tasks):
+        if not self._closed and event in ("created", "pending") and any(self._mine(task) for task in tasks):
+            self._event.set()
+
+    def _init_redis(self, redis_url: str, channel: str) -> bool:
+        try:
+            import redis
+            client = redis.Redis.from_url(redis_url)
+            client.ping()
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{channel: lambda message: self._event.set()})
+            self._redis_thread = self._pubsub.run_in_thread(sleep_time=self.poll_interval, daemon=True)
+            return True
+        except Exception:
+            self._pubsub = None
+            return False
+
+    def wait(self, timeout: float) -> bool:
+        """새 작업 알림이 오거나 timeout이 지날 때까지 대기 (알림이 있었으면 True)"""
+        deadline = time.monotonic() + max(timeout, 0)
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            if self._event.wait(min(self.poll_interval, remaining) if self._poll else remaining):
+                self._event.clear()
+                return True
+            if self._poll:
+                version = self.task_store.version(["pending"])
+                if version != self._last_version:
+                    self._last_version = version
+                    return True
+            if time.monotonic() >= deadline:
+                return False
+
+    def close(self):
+        self._closed = True
+        if self._redis_thread is not None:
+            self._redis_thread.stop()
+            self._redis_thread = None
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Claim Scaling Benchmark - 같은 역할 워커 N개의 처리량과 중복 처리 여부 측정
+
+  python3 benchmarks/claim_scaling.py --workers 1 2 4 8 --tasks 400 --work-ms 20
+  python3 benchmarks/claim_scaling.py --workers 4 --crash   # 죽은 워커의 lease 회수 확인
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from task_store import FileTaskStore, LeaseLostError
+
+LEASE_SECONDS = 1.0
+
+
+def worker(tasks_dir, worker_id, work_ms, results):
+    store = FileTaskStore(tasks_dir, lease_seconds=LEASE_SECONDS)
+    completed = []
+    while True:
+        store.renew_lease(worker_id)
+        pending = sorted(store.find(["pending"], assigned_to="backend_claude"),
+                         key=lambda t: t["priority"], reverse=True)
+        claimed = None
+        for task in pending:
+            claimed = store.claim(task["id"], worker_id)
+            if claimed:
+                break
+        if claimed:
+            time.sleep(work_ms / 1000)
+            try:
+                store.transition(claimed["id"], "completed", worker_id=worker_id)
+                completed.append(claimed["id"])
+            except LeaseLostError:
+                pass
+            continue
+        if store.reap_expired_leases():
+            continue
+        if store.count("in_progress") == 0 and not pending:
+            break
+        time.sleep(0.05)
+    results.put(completed)
+
+
+def crashing_worker(tasks_dir, worker_id):
+    """작업 몇 개를 claim한 뒤 완료하지 않고 죽는 워커"""
+    store = FileTaskStore(tasks_dir, lease_seconds=LEASE_SECONDS)
+    for task in store.find(["pending"])[:5]:
+        store.claim(task["id"], worker_id)
+    os._exit(1)
+
+
+def run(n_workers, n_tasks, work_ms, crash):
+    tasks_dir = Path(tempfile.mkdtemp(prefix="claim_bench_")) / "tasks"
+    store = FileTaskStore(tasks_dir)
+    now = datetime.now().isoformat()
+    for i in range(n_tasks):
+        store.create({
+            "id": f"bench_{i}", "type": "backend", "title": f"Bench {i}", "description": "",
+            "assigned_to": "backend_claude", "created_by": "ceo", "status": "pending",
+            "priority": i % 5 + 1, "created_at": now, "updated_at": now
+        })
+
+    if crash:
+        p = multiprocessing.Process(target=crashing_worker, args=(tasks_dir, "crashed-worker"))
+        p.start()
+        p.join()
+
+    results = multiprocessing.Queue()
+    started = time.perf_counter()
+    procs = [multiprocessing.Process(target=worker, args=(tasks_dir, f"w{i}", work_ms, results))
+             for i in range(n_workers)]
+    for p in procs:
+        p.start()
+    completed = [task_id for _ in procs for task_id in results.get()]
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - started
+
+    counts = Counter(completed)
+    return {
+        "workers": n_workers,
+        "tasks": n_tasks,
+        "completed_unique": len(counts),
+        "duplicates": sum(c - 1 for c in counts.values()),
+        "elapsed_s": round(elapsed, 3),
+        "tasks_per_s": round(len(completed) / elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tasks", type=int, default=400)
+    parser.add_argument("--work-ms", type=float, default=20)
+    parser.add_argument("--crash", action="store_true", help="시작 전에 작업 5개를 잡고 죽는 워커 추가")
+    args = parser.parse_args()
+
+    print(json.dumps([run(n, args.tasks, args.work_ms, args.crash) for n in args.workers], indent=2))
+
+
+if __name__ == "__main__":
+    main()
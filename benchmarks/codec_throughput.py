@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Codec Benchmark - 레코드 형식별 인코딩/디코딩 처리량과 파일 크기 비교
+
+  python3 benchmarks/codec_throughput.py --records 20000
+  python3 benchmarks/codec_throughput.py --codecs json marshal   # 일부 형식만
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from codec import decode, get_codec
+from mcp_server import Message, Task
+
+
+def sample_records(n):
+    """작업/메시지/상태 레코드를 섞은 샘플"""
+    now = datetime.now().isoformat()
+    records = []
+    for i in range(n):
+        kind = i % 3
+        if kind == 0:
+            records.append(("task", asdict(Task(
+                id=f"task_{i}", type="backend", title=f"API 엔드포인트 구현 {i}",
+                description="스마트 플러그 전력 사용량 조회 API 구현 및 테스트", assigned_to="backend_claude",
+                created_by="pm_claude", status="pending", priority=i % 5 + 1, created_at=now, updated_at=now,
+            ))))
+        elif kind == 1:
+            records.append(("message", asdict(Message(
+                from_agent="pm_claude", to_agent="backend_claude", subject=f"스펙 변경 {i}",
+                content="전력 측정 주기를 1초에서 5초로 변경합니다.", timestamp=now,
+            ))))
+        else:
+            records.append(("status", {"agent": "qa_claude", "current_task": f"Running tests {i}", "timestamp": now}))
+    return records
+
+
+def run(codec_name, records, rounds):
+    try:
+        codec = get_codec(codec_name)
+    except ImportError as e:
+        return {"codec": codec_name, "skipped": str(e)}
+
+    objs = [obj for _, obj in records]
+    encoded = [codec.encode(obj) for obj in objs]
+
+    # Task/Message 데이터클래스 왕복 확인
+    for (kind, obj), data in zip(records, encoded):
+        value = decode(data)
+        if kind == "task":
+            assert Task.from_dict(value) == Task(**obj)
+        elif kind == "message":
+            assert Message(**value) == Message(**obj)
+        else:
+            assert value == obj
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for obj in objs:
+            codec.encode(obj)
+    encode_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for data in encoded:
+            decode(data)
+    decode_s = time.perf_counter() - started
+
+    total = len(objs) * rounds
+    return {
+        "codec": codec_name,
+        "records": len(objs),
+        "encode_per_s": round(total / encode_s),
+        "decode_per_s": round(total / decode_s),
+        "avg_bytes": round(sum(map(len, encoded)) / len(encoded), 1),
+        "total_kb": round(sum(map(len, encoded)) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--codecs", nargs="+", default=["pretty", "json", "marshal", "msgpack"])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    records = sample_records(args.records)
+    print(json.dumps([run(name, records, args.rounds) for name in args.codecs], indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Event Loop Lag Benchmark - 동시 create_task/send_message 호출 중 이벤트 루프 지연 측정
+
+  python3 benchmarks/event_loop_lag.py                        # 작업 500개 + 메시지 500개 동시 호출
+  python3 benchmarks/event_loop_lag.py --slow-disk-ms 2       # 쓰기마다 2ms 걸리는 느린 디스크 흉내
+  python3 benchmarks/event_loop_lag.py --io-workers 4 8 16
+
+inline: 저장소 호출을 이벤트 루프에서 바로 실행 (io_workers=0, 기존 동작)
+offload: I/O 스레드 풀에서 실행 + 같은 tick의 메시지는 토픽별 append_batch 한 번으로 기록
+
+lag = 1ms 타이머가 예정보다 늦게 깨어난 시간 (다른 요청/알림이 그만큼 기다림)
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from mcp_server import Message, SharedWorkspaceMCP, Task
+
+AGENTS = ["pm_claude", "hardware_claude", "backend_claude", "frontend_claude", "qa_claude"]
+
+
+async def monitor_lag(stop, samples, interval=0.001):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - started - interval)
+
+
+def slow_down(obj, name, delay):
+    """obj.name 호출마다 delay초 블로킹 (느린 디스크/네트워크 파일시스템 흉내)"""
+    func = getattr(obj, name)
+
+    def slow(*args, **kwargs):
+        time.sleep(delay)
+        return func(*args, **kwargs)
+    setattr(obj, name, slow)
+
+
+async def run(io_workers, calls, slow_disk_ms):
+    with tempfile.TemporaryDirectory() as workspace:
+        server = SharedWorkspaceMCP(workspace_dir=Path(workspace), io_workers=io_workers)
+        if slow_disk_ms:
+            slow_down(server.task_store, "create", slow_disk_ms / 1000)
+            slow_down(server.message_log, "append_batch", slow_disk_ms / 1000)
+
+        stop, samples = asyncio.Event(), []
+        monitor = asyncio.create_task(monitor_lag(stop, samples))
+        await asyncio.sleep(0.01)
+
+        now = datetime.now().isoformat()
+        tasks = [Task(id=f"task_{i}", type="backend", title=f"작업 {i}", description="부하 테스트",
+                      assigned_to=AGENTS[i % len(AGENTS)], created_by="pm_claude", status="pending",
+                      priority=i % 5 + 1, created_at=now, updated_at=now) for i in range(calls)]
+        messages = [Message(from_agent="pm_claude", to_agent=AGENTS[i % len(AGENTS)], subject=f"메시지 {i}",
+                            content="부하 테스트", timestamp=now) for i in range(calls)]
+
+        started = time.perf_counter()
+        await asyncio.gather(*map(server.create_task, tasks), *map(server.send_message, messages))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        await monitor
+        server.message_log.close()
+
+    lag_ms = sorted(sample * 1000 for sample in samples)
+    return {
+        "mode": f"offload({io_workers})" if io_workers else "inline",
+        "calls": calls * 2,
+        "elapsed_s": round(elapsed, 3),
+        "calls_per_s": round(calls * 2 / elapsed),
+        "lag_p50_ms": round(statistics.median(lag_ms), 2),
+        "lag_p99_ms": round(lag_ms[int(len(lag_ms) * 0.99) - 1], 2),
+        "lag_max_ms": round(lag_ms[-1], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="create_task와 send_message 각각의 동시 호출 수")
+    parser.add_argument("--io-workers", type=int, nargs="+", default=[8])
+    parser.add_argument("--slow-disk-ms", type=float, default=0.0, help="작업 생성/메시지 기록마다 추가할 블로킹 시간")
+    args = parser.parse_args()
+
+    results = [asyncio.run(run(workers, args.calls, args.slow_disk_ms)) for workers in [0] + args.io_workers]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
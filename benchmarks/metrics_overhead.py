@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Metrics Overhead Benchmark - 지표 수집을 켰을 때와 껐을 때의 작업 처리 비용 비교
+
+  python3 benchmarks/metrics_overhead.py
+  python3 benchmarks/metrics_overhead.py --tasks 2000
+
+hooks: 관측 한 번의 비용 (ns)
+lifecycle_<backend>: claim → 작업 본문(대기 0) → 완료/리포트 기록, 작업 하나당 시간 (중앙값)
+    (claim/transition 저장소 호출 시간 관측 포함, file과 sqlite 저장소 각각)
+
+켜기/끄기는 같은 실행 안에서 번갈아 측정한다. 디스크 지연의 흔들림이 훅 비용보다 크면
+overhead_pct는 ±몇 %로 흔들리므로, 작업당 훅 비용 합을 작업 시간으로 나눈 hook_share_pct도 함께 출력한다.
+"""
+
+import argparse
+import functools
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "agents"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from agent_simulator import AgentSimulator
+from config import load_config
+from metrics import LATENCY_BUCKETS, REGISTRY, Registry
+from task_handlers import run_task
+
+
+def hook_costs(n=200_000):
+    registry = Registry(enabled=True)
+    hist = registry.histogram("bench_seconds", "bench", ["op"], buckets=LATENCY_BUCKETS)
+    counter = registry.counter("bench_total", "bench", ["op"])
+    child = hist.labels("read")
+    results = {}
+    for name, func in [
+        ("counter_inc", lambda: counter.inc("read")),
+        ("histogram_observe", lambda: hist.observe(0.0003, "read")),
+        ("child_observe", lambda: child.observe(0.0003)),
+        ("child_time", lambda: child.time().__enter__().__exit__(None, None, None)),
+        ("empty_call", lambda: None),
+    ]:
+        started = time.perf_counter()
+        for _ in range(n):
+            func()
+        results[name] = round((time.perf_counter() - started) / n * 1e9)
+    # 빈 lambda 호출 비용을 빼서 훅 자체 비용만
+    return {name: cost - results["empty_call"] for name, cost in results.items() if name != "empty_call"}
+
+
+def lifecycle(base_dir, tasks, backend="file"):
+    """작업마다 지표 수집을 번갈아 켜고 끄며 claim → 완료 처리 시간 측정"""
+    agent = AgentSimulator("backend", config=load_config(home=base_dir, task_backend=backend),
+                           worker_id="bench-worker")
+    now = datetime.now().isoformat()
+    for i in range(tasks):
+        agent.task_store.create({
+            "id": f"task_{i}", "type": "backend", "title": f"작업 {i}", "description": "bench",
+            "assigned_to": "backend_claude", "created_by": "pm_claude", "status": "pending",
+            "priority": 3, "created_at": now, "updated_at": now,
+        })
+
+    timings = {True: [], False: []}
+    for i in range(tasks):
+        REGISTRY.enabled = enabled = i % 2 == 1
+        started = time.perf_counter()
+        task = agent.claim_next_task()
+        agent.finish_task(task, run_task("backend", task, 0))
+        timings[enabled].append(time.perf_counter() - started)
+    agent.status_writer.flush()
+    return timings
+
+
+def compare(name, func, count, hook_ns):
+    # 한 실행 안에서 켜기/끄기를 번갈아 측정해 디스크 캐시/CPU 주파수 변화가 양쪽에 같이 반영되도록 함
+    with tempfile.TemporaryDirectory() as base_dir:
+        timings = func(base_dir, count)
+    REGISTRY.enabled = True
+    off, on = statistics.median(timings[False]), statistics.median(timings[True])
+    return {
+        "benchmark": name,
+        "count": count,
+        "off_us": round(off * 1e6, 1),
+        "on_us": round(on * 1e6, 1),
+        "overhead_pct": round((on - off) / off * 100, 2),
+        # 측정 잡음(디스크)이 훅 비용보다 크므로, 작업당 훅 비용 합 / 작업 시간도 함께 표시
+        "hook_share_pct": round(hook_ns / 1e9 / off * 100, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000)
+    args = parser.parse_args()
+
+    hooks = hook_costs()
+    # 작업 하나: 대기 시간 + 처리 시간 관측, claim/transition 관측, 상태 기록 구간 2회
+    hook_ns = 2 * hooks["histogram_observe"] + 2 * hooks["child_observe"] + 2 * hooks["child_time"]
+    results = [{"benchmark": "hooks", "ns": hooks}] + [
+        compare(f"lifecycle_{backend}", functools.partial(lifecycle, backend=backend), args.tasks, hook_ns)
+        for backend in ["file", "sqlite"]
+    ]
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Notify Throughput Benchmark - 실시간 알림(pub/sub) 처리량 측정
+
+  python3 benchmarks/notify_throughput.py                       # 가짜 브로커 (Redis 불필요)
+  python3 benchmarks/notify_throughput.py --latency-ms 0.2      # 배치마다 왕복 0.2ms 흉내
+  python3 benchmarks/notify_throughput.py --redis redis://localhost
+
+batched: 같은 tick의 알림을 모아 한 번에 전송 (기본 동작)
+unbatched: 알림마다 전송 완료를 기다림 (기존 publish 호출당 round trip과 같음)
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from transport import FakeBroker, FakeTransport, RedisTransport
+
+AGENTS = ["pm_claude", "hardware_claude", "backend_claude", "frontend_claude", "qa_claude"]
+
+
+async def produce(transport, producer, count, batched):
+    for i in range(count):
+        transport.publish(f"agent:{AGENTS[i % len(AGENTS)]}", {"type": "new_task", "task_id": f"{producer}_{i}"})
+        if batched:
+            # 다른 producer에게 양보 (실제 서버에서 여러 요청이 같은 tick에 섞이는 상황)
+            await asyncio.sleep(0)
+        else:
+            await transport.flush()
+
+
+async def run(backend, transport, notifications, producers, batched, received=None):
+    per_producer = notifications // producers
+    started = time.perf_counter()
+    await asyncio.gather(*(produce(transport, p, per_producer, batched) for p in range(producers)))
+    await transport.flush()
+    elapsed = time.perf_counter() - started
+    stats = transport.stats()
+    result = {
+        "backend": backend,
+        "mode": "batched" if batched else "unbatched",
+        "notifications": per_producer * producers,
+        "elapsed_s": round(elapsed, 3),
+        "notifications_per_s": round(stats["sent"] / elapsed),
+        "batches": stats["batches"],
+        "dropped": stats["dropped"],
+    }
+    if received is not None:
+        result["received"] = sum(subscription.received for subscription in received)
+    return result
+
+
+async def main_async(args):
+    results = []
+    for batched in (False, True):
+        transport = FakeTransport(FakeBroker(), latency=args.latency_ms / 1000, max_pending=args.notifications)
+        subscriptions = [transport.subscribe([f"agent:{agent}"], maxsize=args.notifications) for agent in AGENTS]
+        results.append(await run("fake", transport, args.notifications, args.producers, batched, subscriptions))
+
+    if args.redis:
+        for batched in (False, True):
+            try:
+                transport = RedisTransport(args.redis, max_pending=args.notifications)
+            except ImportError as e:
+                results.append({"backend": "redis", "skipped": str(e)})
+                break
+            if not await transport.connect():
+                results.append({"backend": "redis", "skipped": f"cannot connect to {args.redis}"})
+                break
+            results.append(await run("redis", transport, args.notifications, args.producers, batched))
+            await transport.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--notifications", type=int, default=20000)
+    parser.add_argument("--producers", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="가짜 브로커의 배치당 왕복 시간")
+    parser.add_argument("--redis", help="실제 Redis URL (예: redis://localhost)")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main_async(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Pickup Latency Benchmark - 작업 생성부터 에이전트 픽업까지의 지연 측정
+
+  python3 benchmarks/pickup_latency.py --mode event --tasks 50
+  python3 benchmarks/pickup_latency.py --mode poll --tasks 20   # 기존 10초 폴링 루프
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "agents"))
+
+from agent_simulator import AgentSimulator
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+class MeasuringSimulator(AgentSimulator):
+    """픽업 시점만 기록하고 작업은 즉시 완료 처리"""
+
+    def __init__(self, *args, created_at=None, picked=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created_at = created_at
+        self.picked = picked
+
+    def process_task(self, task):
+        self.picked[task["id"]] = time.monotonic() - self.created_at[task["id"]]
+        self.move_task(task["id"], "pending", "completed")
+
+    def update_status(self, status_text):
+        pass
+
+    def legacy_run(self):
+        """기존 방식: 10초마다 pending 디렉토리 재스캔"""
+        while True:
+            tasks = self.get_pending_tasks()
+            if tasks:
+                self.process_task(tasks[0])
+            time.sleep(10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["event", "poll"], default="event")
+    parser.add_argument("--tasks", type=int, default=30)
+    parser.add_argument("--max-gap", type=float, default=2.0, help="작업 생성 간격 상한 (초)")
+    args = parser.parse_args()
+
+    base_dir = Path(tempfile.mkdtemp(prefix="pickup_bench_"))
+    created_at, picked = {}, {}
+    sim = MeasuringSimulator("backend", base_dir=base_dir, created_at=created_at, picked=picked)
+    pending_dir = sim.shared_dir / "tasks" / "pending"
+    pending_dir.mkdir(parents=True, exist_ok=True)
+
+    target = sim.run if args.mode == "event" else sim.legacy_run
+    threading.Thread(target=target, daemon=True).start()
+    time.sleep(0.5)
+
+    for i in range(args.tasks):
+        time.sleep(random.uniform(0, args.max_gap))
+        task_id = f"bench_{i}"
+        task = {
+            "id": task_id, "type": "backend", "title": f"Bench {i}", "description": "",
+            "assigned_to": "backend_claude", "created_by": "ceo", "status": "pending",
+            "priority": 3, "created_at": datetime.now().isoformat(), "updated_at": datetime.now().isoformat()
+        }
+        created_at[task_id] = time.monotonic()
+        (pending_dir / f"{task_id}.json").write_text(json.dumps(task, indent=2))
+
+    deadline = time.monotonic() + (15 if args.mode == "event" else 10 * args.tasks + 15)
+    while len(picked) < args.tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    latencies = list(picked.values())
+    print(json.dumps({
+        "mode": args.mode,
+        "tasks": args.tasks,
+        "picked": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Pipeline Load Benchmark - 작업 할당부터 처리/메시지까지 워크스페이스 전체 경로 부하 측정
+
+  python3 benchmarks/pipeline_load.py                                  # 작업 400개, 역할별 에이전트 1개, 작업 시간 0
+  python3 benchmarks/pipeline_load.py --tasks 2000 --agents backend=4 qa=2 --work-ms 5
+  python3 benchmarks/pipeline_load.py --priority-weights 1 1 2 4 8     # 우선순위 1..5 가중치 (높은 우선순위 위주)
+  python3 benchmarks/pipeline_load.py --output run.json --baseline base.json --max-regression 20
+  python3 benchmarks/pipeline_load.py --task-backend memory --tmp-dir /dev/shm   # 인메모리 저장소 + tmpfs
+
+단계 (모두 임시 디렉토리에서 실행):
+  assign    CEODashboard._assign_task           (작업의 절반)
+  create    SharedWorkspaceMCP.create_task      (나머지 절반)
+  process   AgentSimulator.process_task         (역할별 에이전트 스레드, 각자 작업 저장소를 열어 claim 경쟁 -
+                                                 memory 백엔드는 서버 저장소 하나를 공유)
+  update    SharedWorkspaceMCP.update_task_status (완료 작업 → review)
+  send      SharedWorkspaceMCP.send_message
+  receive   SharedWorkspaceMCP.get_messages     (에이전트별로 빌 때까지)
+
+단계별 처리량, 호출 지연 백분위(ms), 단계가 끝난 시점의 최대 RSS(MB)를 JSON으로 출력한다.
+--baseline을 주면 단계별 처리량이 --max-regression % 넘게 떨어졌을 때 종료 코드 1.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import io
+import json
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "agents"))
+sys.path.insert(0, str(ROOT / "infrastructure"))
+
+from agent_simulator import AgentSimulator
+from config import Config
+from mcp_server import Message, SharedWorkspaceMCP, Task
+from task_store import TASK_BACKENDS
+
+AGENT_TYPES = ["pm", "hardware", "backend", "frontend", "qa"]
+
+
+def load_dashboard():
+    """ceo-dashboard.py (파일 이름에 - 가 있어 import 문으로는 불러올 수 없음)"""
+    spec = importlib.util.spec_from_file_location("ceo_dashboard", ROOT / "ceo-dashboard.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.CEODashboard
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def peak_rss_mb():
+    # Linux의 ru_maxrss 단위는 KB
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def summarize(phase, latencies, elapsed, **extra):
+    ms = [value * 1000 for value in latencies]
+    result = {
+        "phase": phase,
+        "count": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(len(latencies) / elapsed, 1) if elapsed > 0 else None,
+    }
+    for pct in (50, 90, 99):
+        value = percentile(ms, pct)
+        result[f"p{pct}_ms"] = round(value, 3) if value is not None else None
+    result["max_ms"] = round(max(ms), 3) if ms else None
+    result["peak_rss_mb"] = peak_rss_mb()
+    result.update(extra)
+    return result
+
+
+def timed_calls(calls):
+    """calls: 인자 없는 함수 목록 → (호출별 지연, 전체 시간)"""
+    latencies = []
+    started = time.perf_counter()
+    for call in calls:
+        call_started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - call_started)
+    return latencies, time.perf_counter() - started
+
+
+async def timed_awaits(factories):
+    latencies = []
+    started = time.perf_counter()
+    for factory in factories:
+        call_started = time.perf_counter()
+        await factory()
+        latencies.append(time.perf_counter() - call_started)
+    return latencies, time.perf_counter() - started
+
+
+class LoadAgent(AgentSimulator):
+    """완료/실패 시점을 기록하는 에이전트 (처리 경로는 AgentSimulator 그대로)"""
+
+    def __init__(self, *args, finished=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.finished = finished
+        self.claimed_at = {}
+
+    def start_task(self, task):
+        if not super().start_task(task):
+            return False
+        self.claimed_at[task["id"]] = time.perf_counter()
+        return True
+
+    def finish_task(self, task, result=None):
+        super().finish_task(task, result)
+        self._record(task)
+
+    def fail_task(self, task, error):
+        super().fail_task(task, error)
+        self._record(task)
+
+    def _record(self, task):
+        now = time.perf_counter()
+        self.finished.append((task["id"], now - self.claimed_at.pop(task["id"]), datetime.now()))
+
+
+def run_agents(config, task_store, agents, work_time, expected, timeout):
+    """역할별 에이전트 스레드로 pending 작업을 모두 처리"""
+    finished, threads, stop = [], [], threading.Event()
+
+    def loop(agent):
+        while not stop.is_set():
+            task = agent.next_task()
+            if task:
+                agent.process_task(task)
+            else:
+                time.sleep(0.001)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for agent_type, count in agents.items():
+            for index in range(count):
+                agent = LoadAgent(agent_type, config=config, task_store=task_store,
+                                  worker_id=f"load-{agent_type}-{index}", work_time=work_time, finished=finished)
+                threads.append(threading.Thread(target=loop, args=(agent,), daemon=True))
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        while len(finished) < expected and time.perf_counter() - started < timeout:
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return finished, elapsed
+
+
+def make_tasks(args, agents):
+    """(담당자, 우선순위) 목록 - 에이전트가 있는 역할에 돌아가며 배정"""
+    rng = random.Random(args.seed)
+    roles = [f"{agent_type}_claude" for agent_type in agents]
+    priorities = rng.choices(range(1, 6), weights=args.priority_weights, k=args.tasks)
+    return [(roles[i % len(roles)], priority) for i, priority in enumerate(priorities)]
+
+
+async def run(args, base_dir):
+    agents = args.agents
+    plan = make_tasks(args, agents)
+    half = len(plan) // 2
+    results = []
+    config = Config(home=base_dir, shared_dir=base_dir / "shared-workspace", task_backend=args.task_backend)
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = SharedWorkspaceMCP(config=config)
+    # memory 저장소는 프로세스 안에서 인스턴스를 공유해야 보임 (file/sqlite는 구성 요소마다 따로 열어 실제 배치와 같게)
+    shared_store = server.task_store if args.task_backend == "memory" else None
+
+    # assign: CEO 대시보드 작업 할당
+    with contextlib.redirect_stdout(io.StringIO()):
+        dashboard = load_dashboard()(config=config, task_store=shared_store)
+    latencies, elapsed = timed_calls(
+        lambda agent=agent, priority=priority, i=i: dashboard._assign_task(agent, f"부하 작업 {i}: 할당", priority)
+        for i, (agent, priority) in enumerate(plan[:half])
+    )
+    assigned = dashboard.task_store.count("pending")
+    # 같은 타임스탬프로 만든 작업 ID가 겹치면 뒤 작업이 앞 작업을 덮어씀
+    results.append(summarize("assign", latencies, elapsed, lost=half - assigned))
+
+    # create: MCP 서버 작업 생성
+    now = datetime.now().isoformat()
+    tasks = [
+        Task(id=f"load_{i}", type=agent.split("_")[0], title=f"부하 작업 {i}", description="MCP 생성",
+             assigned_to=agent, created_by="pm_claude", status="pending", priority=priority,
+             created_at=now, updated_at=now)
+        for i, (agent, priority) in enumerate(plan[half:])
+    ]
+    latencies, elapsed = await timed_awaits(lambda task=task: server.create_task(task) for task in tasks)
+    results.append(summarize("create", latencies, elapsed))
+
+    # process: 에이전트 처리
+    expected = assigned + len(tasks)
+    finished, elapsed = await asyncio.to_thread(run_agents, config, shared_store, agents, args.work_ms / 1000,
+                                                expected, args.timeout)
+    results.append(summarize("process", [duration for _, duration, _ in finished], elapsed,
+                             agents=sum(agents.values()), unfinished=expected - len(finished)))
+
+    # update: 완료 작업을 review로
+    completed = [task for task in server.task_store.find(["completed"])]
+    with contextlib.redirect_stdout(io.StringIO()):
+        latencies, elapsed = await timed_awaits(
+            lambda task=task: server.update_task_status(task["id"], "review", task["assigned_to"])
+            for task in completed
+        )
+    results.append(summarize("update", latencies, elapsed))
+
+    # send/receive: 에이전트 간 메시지
+    recipients = [f"{agent_type}_claude" for agent_type in agents]
+    messages = [
+        Message(from_agent="pm_claude", to_agent=recipients[i % len(recipients)], subject=f"메시지 {i}",
+                content="부하 테스트", timestamp=datetime.now().isoformat())
+        for i in range(args.messages)
+    ]
+    latencies, elapsed = await timed_awaits(lambda message=message: server.send_message(message)
+                                            for message in messages)
+    results.append(summarize("send", latencies, elapsed))
+
+    latencies, received = [], 0
+    started = time.perf_counter()
+    for recipient in recipients:
+        while True:
+            call_started = time.perf_counter()
+            batch = await server.get_messages(recipient)
+            latencies.append(time.perf_counter() - call_started)
+            received += len(batch)
+            if not batch:
+                break
+    results.append(summarize("receive", latencies, time.perf_counter() - started, messages=received))
+    return results
+
+
+def check_regressions(results, baseline, max_regression):
+    """기준 실행 대비 단계별 처리량 하락 (max_regression % 초과만)"""
+    base = {phase["phase"]: phase for phase in baseline.get("phases", [])}
+    regressions = []
+    for phase in results:
+        before = base.get(phase["phase"], {}).get("throughput_per_s")
+        after = phase["throughput_per_s"]
+        if before and after is not None and after < before * (1 - max_regression / 100):
+            regressions.append({"phase": phase["phase"], "baseline_per_s": before, "per_s": after,
+                                "change_pct": round((after - before) / before * 100, 1)})
+    return regressions
+
+
+def parse_agents(values):
+    """["backend=4", "qa"] → {"backend": 4, "qa": 1}"""
+    agents = {}
+    for value in values:
+        agent_type, _, count = value.partition("=")
+        if agent_type not in AGENT_TYPES:
+            raise argparse.ArgumentTypeError(f"Unknown agent type: {agent_type}")
+        agents[agent_type] = int(count or 1)
+    return agents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=400)
+    parser.add_argument("--agents", nargs="+", default=AGENT_TYPES, help="역할[=에이전트 수] (기본: 역할별 1개)")
+    parser.add_argument("--priority-weights", type=float, nargs=5, default=[1, 1, 1, 1, 1],
+                        metavar="W", help="우선순위 1..5 가중치")
+    parser.add_argument("--work-ms", type=float, default=0.0, help="작업당 처리 시간 (기본 0, 실제 에이전트는 5-15초)")
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--task-backend", choices=TASK_BACKENDS, default="file")
+    parser.add_argument("--tmp-dir", help="임시 작업 공간을 만들 위치 (예: /dev/shm)")
+    parser.add_argument("--timeout", type=float, default=600, help="process 단계 최대 대기 (초)")
+    parser.add_argument("--output", help="결과 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="허용하는 처리량 하락 (%%)")
+    args = parser.parse_args()
+    try:
+        args.agents = parse_agents(args.agents)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    with tempfile.TemporaryDirectory(prefix="pipeline_load_", dir=args.tmp_dir) as base_dir:
+        phases = asyncio.run(run(args, Path(base_dir)))
+
+    report = {
+        "config": {"tasks": args.tasks, "agents": args.agents, "priority_weights": args.priority_weights,
+                   "work_ms": args.work_ms, "messages": args.messages, "seed": args.seed,
+                   "task_backend": args.task_backend, "tmp_dir": args.tmp_dir},
+        "phases": phases,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    regressions = []
+    if args.baseline:
+        regressions = check_regressions(phases, json.loads(Path(args.baseline).read_text()), args.max_regression)
+        report["regressions"] = regressions
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(text)
+    print(text)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Process Pool Scaling Benchmark - 프로세스 풀 워커 수에 따른 CPU 작업 처리량 측정
+
+  python3 benchmarks/process_pool_scaling.py --pool 0 1 2 4 --tasks 40 --cost 200000
+  (--pool 0 은 기존 단일 스레드 처리)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "agents"))
+
+from agent_simulator import AgentSimulator
+
+
+def run_config(pool_workers, n_tasks, cost, results):
+    base_dir = Path(tempfile.mkdtemp(prefix="pool_bench_"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim = AgentSimulator("qa", base_dir=base_dir, pool_workers=pool_workers)
+    now = datetime.now().isoformat()
+    for i in range(n_tasks):
+        sim.task_store.create({
+            "id": f"bench_{i}", "type": "qa", "title": f"Validate spec {i}", "description": "x" * 256,
+            "assigned_to": "qa_claude", "created_by": "ceo", "status": "pending",
+            "priority": random.randint(1, 5), "created_at": now, "updated_at": now,
+            "handler": "checksum", "cost": cost
+        })
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        threading.Thread(target=sim.run, daemon=True).start()
+        while sim.task_store.count("completed") + sim.task_store.count("blocked") < n_tasks:
+            time.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    if sim.executor:
+        sim.executor.shutdown()
+
+    results.put({
+        "pool_workers": pool_workers,
+        "tasks": n_tasks,
+        "elapsed_s": round(elapsed, 3),
+        "tasks_per_s": round(n_tasks / elapsed, 2),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pool", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--tasks", type=int, default=40)
+    parser.add_argument("--cost", type=int, default=200_000, help="작업당 sha256 반복 횟수")
+    args = parser.parse_args()
+
+    rows = []
+    for pool_workers in args.pool:
+        results = multiprocessing.Queue()
+        proc = multiprocessing.Process(target=run_config, args=(pool_workers, args.tasks, args.cost, results))
+        proc.start()
+        rows.append(results.get())
+        proc.join()
+    print(json.dumps({"cpu_count": os.cpu_count(), "runs": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,96 @@
 CEO Dashboard - ClaudeTeam AI 스타트업 관리 인터페이스
 """
 
+import csv
+import heapq
+import itertools
 import json
 import sys
 import os
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List
 import subprocess
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "infrastructure"))
+
+from codec import read_record
+from message_log import BROADCAST_TOPIC, MessageLog
+from config import Config, load_config, strip_config_args
+from task_store import TaskStore, new_task_id
+from task_query import TaskQuery
+from task_queue import TaskScheduler
+from status_writer import read_team_status
+from heartbeat import read_heartbeats, unresponsive_agents
+from notification_store import PRIORITIES, URGENT_PRIORITIES, NotificationStore
+from daily_stats import DailyStats
+from archive import ARCHIVE_KINDS, Archive
+
+def read_task_rows(lines):
+    """작업 목록 줄 스트림 → (줄 번호, dict)
+
+    첫 줄이 "{"로 시작하면 JSONL, 아니면 CSV (첫 줄은 헤더: agent,description,priority,deadline)
+    """
+    lines = iter(lines)
+    first = next(lines, None)
+    while first is not None and not first.strip():
+        first = next(lines, None)
+    if first is None:
+        return
+    lines = itertools.chain([first], lines)
+    if first.lstrip().startswith("{"):
+        for line_no, line in enumerate(lines, 1):
+            if line.strip():
+                try:
+                    yield line_no, json.loads(line)
+                except ValueError as e:
+                    print(f"⚠️ {line_no}번째 줄 건너뜀: {e}")
+    else:
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, {key.strip(): value.strip() for key, value in row.items() if key and value}
+
+def parse_options(args: List[str]) -> Dict[str, str]:
+    """["--limit=5", "--all"] → {"limit": "5", "all": ""}"""
+    options = {}
+    for arg in args:
+        if not arg.startswith("--"):
+            raise ValueError(f"알 수 없는 인자: {arg}")
+        key, _, value = arg[2:].partition("=")
+        options[key] = value
+    return options
+
+def parse_task_query(args: List[str]):
+    """tasks 명령 옵션 → (TaskQuery, 전체 출력 여부)"""
+    options = parse_options(args)
+    fields = {"agent": "assigned_to", "since": "created_after", "until": "created_before",
+              "updated-since": "updated_after", "updated-until": "updated_before",
+              "text": "text", "sort": "sort", "cursor": "cursor"}
+    query = {}
+    for key, value in options.items():
+        if key in fields:
+            query[fields[key]] = value
+        elif key == "status":
+            query["statuses"] = value.split(",")
+        elif key == "priority":
+            low, _, high = value.partition("-")
+            query["min_priority"], query["max_priority"] = int(low), int(high or low)
+        elif key == "limit":
+            query["limit"] = int(value)
+        elif key != "all":
+            raise ValueError(f"알 수 없는 옵션: --{key}")
+    agent = query.get("assigned_to")
+    if agent and not agent.endswith("_claude"):
+        query["assigned_to"] = f"{agent}_claude"
+    query.setdefault("limit", 20)
+    return TaskQuery(**query), "all" in options
+
 class CEODashboard:
-    def __init__(self):
-        self.base_dir = Path("/home/jyjjeon/claudeteam-startup")
-        self.shared_dir = self.base_dir / "shared-workspace"
+    def __init__(self, base_dir: Path = None, config: Config = None, task_store: TaskStore = None):
+        # 작업 공간 위치/저장소 백엔드 (base_dir을 주면 그 아래 shared-workspace 사용)
+        self.config = config or load_config(home=base_dir)
+        self.base_dir = self.config.home
+        self.shared_dir = self.config.shared_dir
         self.ceo_dir = self.base_dir / "ceo-office"
         
         # CEO 디렉토리 생성
@@ -22,6 +100,14 @@ class CEODashboard:
         (self.ceo_dir / "reports").mkdir(parents=True, exist_ok=True)
         (self.ceo_dir / "approvals").mkdir(parents=True, exist_ok=True)
         (self.ceo_dir / "decisions").mkdir(parents=True, exist_ok=True)
+        
+        if task_store is None:
+            task_store = self.config.open_task_store()
+            DailyStats(self.shared_dir / "reports" / "activity").attach(task_store)
+        self.task_store = task_store
+        self.message_log = MessageLog(self.shared_dir / "messages" / "log")
+        self.archive = Archive(self.shared_dir / "archive")
+        self.notifications = NotificationStore(self.shared_dir / "ceo-office" / "notifications")
     
     def show_status(self):
         """전체 상태 요약"""
@@ -31,19 +117,40 @@ class CEODashboard:
         
         # 팀 상태
         print("\n📊 팀 상태:")
-        status_dir = self.shared_dir / "status"
-        if status_dir.exists():
-            for status_file in status_dir.glob("*.json"):
-                agent = status_file.stem
-                data = json.loads(status_file.read_text())
-                print(f"  • {agent}: {data.get('current_task', 'Idle')}")
+        # 생존 신호가 모두 끊긴 에이전트는 마지막 상태 앞에 표시
+        unresponsive = unresponsive_agents(read_heartbeats(self.shared_dir / "heartbeats"))
+        for agent, data in sorted(read_team_status(self.shared_dir / "status").items()):
+            current = data.get('current_task', 'Idle')
+            if agent in unresponsive:
+                current = f"⚠️ 응답 없음 ({unresponsive[agent]:.0f}초 전 마지막 신호) - {current}"
+            print(f"  • {agent}: {current}")
         
         # 작업 현황
         print("\n📋 작업 현황:")
-        for status in ["pending", "in_progress", "completed"]:
-            task_count = len(list((self.shared_dir / "tasks" / status).glob("*.json")))
+        for status in ["pending", "in_progress", "completed", "dead_letter"]:
+            # 저장소 인덱스 기준 (in_progress는 워커별 claim 포함), completed는 보관된 작업까지 포함
+            task_count = self.task_store.count(status)
+            if status == "completed":
+                task_count += self.archive.count("tasks")
+            if status == "dead_letter" and not task_count:
+                continue  # 반복 실패로 포기한 작업이 있을 때만 (./ceo-dashboard.py retry <ID>로 재시도)
             print(f"  • {status.capitalize()}: {task_count}")
         
+        # 에이전트별 대기열 (aging 반영 순서)
+        scheduler = TaskScheduler(self.task_store)
+        scheduler.sync()
+        queues = {agent: m for agent, m in scheduler.metrics().items() if m["depth"]}
+        if queues:
+            print("\n📥 대기열:")
+            for agent, metrics in queues.items():
+                head = scheduler.ordered(agent, 1)[0]
+                print(f"  • {agent}: {metrics['depth']}건 (다음: {head['title']})")
+        
+        # 읽지 않은 긴급 알림 (수만 - ./ceo-dashboard.py notifications 로 확인)
+        urgent = {p: count for p, count in self.notifications.unread_count().items() if count}
+        if urgent:
+            print("\n🚨 읽지 않은 긴급 알림: " + ", ".join(f"{p} {count}건" for p, count in urgent.items()))
+        
         # 승인 대기
         print("\n⏳ 승인 대기 사항:")
         inbox = self.ceo_dir / "inbox"
@@ -51,7 +158,7 @@ class CEODashboard:
             approvals = list(inbox.glob("*.json"))
             if approvals:
                 for approval_file in approvals[:3]:  # 최대 3개만 표시
-                    data = json.loads(approval_file.read_text())
+                    data = read_record(approval_file)
                     print(f"  • {data.get('subject', 'Unknown')}")
             else:
                 print("  • 없음")
@@ -161,10 +268,11 @@ class CEODashboard:
         self._assign_task(agent, task_description, priority=3)
         print(f"✅ {agent}에게 작업이 할당되었습니다.")
     
-    def _assign_task(self, agent: str, description: str, priority: int = 3):
-        """작업 생성 및 할당"""
+    def _new_task(self, agent: str, description: str, priority: int = 3, deadline: str = None) -> Dict:
+        """CEO가 만드는 작업 레코드 (deadline: ISO 시각, 마감 임박시 우선 처리)"""
+        now = datetime.now().isoformat()
         task = {
-            "id": f"task_{datetime.now().timestamp()}",
+            "id": new_task_id(),
             "type": agent.split("_")[0],  # pm, hardware, backend, frontend, qa
             "title": description.split(":")[0] if ":" in description else description[:50],
             "description": description,
@@ -172,25 +280,179 @@ class CEODashboard:
             "created_by": "ceo",
             "status": "pending",
             "priority": priority,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now,
+            "updated_at": now
         }
+        if deadline:
+            task["deadline"] = deadline
+        return task
+    
+    def _assign_task(self, agent: str, description: str, priority: int = 3, deadline: str = None):
+        """작업 생성 및 할당"""
+        # 에이전트 스케줄러는 저장소의 pending 작업에서 대기열을 동기화
+        self.task_store.create(self._new_task(agent, description, priority, deadline))
+    
+    def assign_batch(self, lines, batch_size: int = 1000) -> int:
+        """JSONL/CSV 줄 스트림에서 작업을 읽어 batch_size개씩 한 번에 저장 (생성한 작업 수 반환)"""
+        created = skipped = 0
+        batch = []
+        for line_no, row in read_task_rows(lines):
+            try:
+                agent = row.get("agent") or row.get("assigned_to")
+                description = row.get("description") or row.get("task") or row.get("title")
+                if not agent or not description:
+                    raise ValueError("agent와 description이 필요합니다")
+                if not agent.endswith("_claude"):
+                    agent = f"{agent}_claude"
+                batch.append(self._new_task(agent, description, int(row.get("priority") or 3),
+                                            row.get("deadline") or None))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                skipped += 1
+                print(f"⚠️ {line_no}번째 줄 건너뜀: {e}")
+                continue
+            if len(batch) >= batch_size:
+                self.task_store.create_many(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            self.task_store.create_many(batch)
+            created += len(batch)
+        print(f"✅ 작업 {created}개 할당" + (f" ({skipped}줄 건너뜀)" if skipped else ""))
+        return created
+    
+    def view_notifications(self, show_all: bool = False, limit: int = 20):
+        """읽지 않은 알림 보기 (기본은 critical/high만, 우선순위 순) 후 읽음 처리"""
+        priorities = PRIORITIES if show_all else URGENT_PRIORITIES
+        total = sum(self.notifications.unread_count(priorities).values())
+        items = self.notifications.unread(priorities, limit)
+        
+        print("\n🔔 읽지 않은 알림:" if show_all else "\n🚨 읽지 않은 긴급 알림:")
+        for item in items:
+            repeated = f" (외 {item['repeated']}건 반복)" if item.get("repeated") else ""
+            print(f"  • [{item['priority']}] {item['timestamp'][:16]} {item['message']}{repeated}")
+        if not items:
+            print("  • 없음")
+        elif total > len(items):
+            print(f"  … 외 {total - len(items)}건 (오래된 알림은 archive notifications)")
+        self.notifications.mark_read(priorities)
+    
+    def watch(self):
+        """실시간 알림 보기 (CEO 긴급 알림 + 전체 공지, Ctrl+C로 종료)"""
+        # status 등 일회성 명령의 시작 시간에 영향이 없도록 여기서만 import (asyncio만 30ms 남짓)
+        import asyncio
+        from transport import DEFAULT_REDIS_URL
+        
+        try:
+            asyncio.run(self._watch(os.environ.get("CLAUDETEAM_REDIS_URL", DEFAULT_REDIS_URL)))
+        except KeyboardInterrupt:
+            pass
+    
+    async def _watch(self, url: str):
+        from transport import open_transport
+        
+        transport = await open_transport(url)
+        if transport is None or not transport.connected:
+            print("Redis를 사용할 수 없어 실시간 알림을 볼 수 없습니다.")
+            return
+        
+        subscription = transport.subscribe(["ceo:urgent", "broadcast"], maxsize=50)
+        print("\n🔔 실시간 알림 대기 중 (Ctrl+C 종료)")
+        try:
+            async for channel, message in subscription:
+                if isinstance(message, dict) and message.get("type") == "spec_update":
+                    print(f"  📄 [{channel}] 스펙 업데이트: {message.get('product')}")
+                elif isinstance(message, dict):
+                    print(f"  🚨 [{channel}] {message.get('priority', '')} {message.get('message', message)}")
+                else:
+                    print(f"  • [{channel}] {message}")
+        finally:
+            metrics = subscription.metrics()
+            print(f"\n수신 {metrics['received']}건 / 표시 {metrics['delivered']}건 / "
+                  f"합침 {metrics['coalesced']}건 / 버림 {metrics['dropped']}건")
+            await transport.close()
+    
+    def serve(self, port: int = 8765):
+        """상주형 대시보드 (로컬 HTTP/JSON, Ctrl+C로 종료)"""
+        # status 등 일회성 명령의 시작 시간에 영향이 없도록 여기서만 import
+        import asyncio
+        from dashboard_server import DashboardModel, serve
+        from transport import DEFAULT_REDIS_URL
+        
+        model = DashboardModel(self.shared_dir, self.ceo_dir, self.task_store)
+        try:
+            asyncio.run(serve(model, port=port, redis_url=os.environ.get("CLAUDETEAM_REDIS_URL", DEFAULT_REDIS_URL)))
+        except KeyboardInterrupt:
+            pass
+    
+    def list_tasks(self, query: TaskQuery, all_pages: bool = False):
+        """조건에 맞는 작업 목록 (한 페이지씩, all_pages면 끝까지 이어서 출력)"""
+        tasks = self.task_store.iter_query(query) if all_pages else None
+        page = None if all_pages else self.task_store.query(query)
         
-        task_file = self.shared_dir / "tasks" / "pending" / f"{task['id']}.json"
-        task_file.parent.mkdir(parents=True, exist_ok=True)
-        task_file.write_text(json.dumps(task, indent=2))
+        print("\n📋 작업 목록:")
+        shown = 0
+        for task in tasks if all_pages else page["tasks"]:
+            shown += 1
+            print(f"  • [{task['status']}] P{task.get('priority', '-')} {task['assigned_to']}: {task['title']}"
+                  f" ({(task.get('created_at') or '')[:16]}, {task['id']})")
+        if not shown:
+            print("  • 없음")
+        if page and page["next_cursor"]:
+            print(f"\n  다음 페이지: --cursor={page['next_cursor']}")
     
-    def view_reports(self):
-        """보고서 보기"""
+    def retry_task(self, task_id: str):
+        """dead_letter 작업을 재시도 횟수를 초기화해 다시 대기열로"""
+        task = self.task_store.get(task_id)
+        if not task or task["status"] != "dead_letter":
+            print(f"❌ dead_letter 상태의 작업이 아닙니다: {task_id}")
+            return
+        self.task_store.transition(task_id, "pending", retries=0, updated_at=datetime.now().isoformat())
+        print(f"✅ 작업을 다시 대기열에 넣었습니다: {task['title']} ({task['assigned_to']})")
+    
+    def view_reports(self, since: str = None, limit: int = 5):
+        """보고서 보기 (since가 없으면 최근 limit개, 있으면 그 날짜부터 limit개)"""
         reports_dir = self.shared_dir / "reports"
         reports_dir.mkdir(parents=True, exist_ok=True)
         
-        print("\n📊 최근 보고서:")
-        reports = sorted(reports_dir.glob("*.json"), reverse=True)[:5]
+        # 파일 이름(daily_YYYY-MM-DD.json)이 날짜 순이므로 전체를 정렬하지 않고 필요한 만큼만 고름
+        with os.scandir(reports_dir) as entries:
+            names = (entry.name for entry in entries
+                     if entry.name.startswith("daily_") and entry.name.endswith(".json")
+                     and (since is None or entry.name[6:-5] >= since))
+            reports = heapq.nsmallest(limit + 1, names) if since else heapq.nlargest(limit, names)
+        more = since is not None and len(reports) > limit
+        reports = reports[:limit]
+        
+        print(f"\n📊 {since} 이후 보고서:" if since else "\n📊 최근 보고서:")
+        for name in reports:
+            size = (reports_dir / name).stat().st_size
+            print(f"  • {name[6:-5]} ({size / 1024:.1f} KB)")
+        if not reports:
+            print("  • 없음")
+        if more:
+            next_day = (date.fromisoformat(reports[-1][6:-5]) + timedelta(days=1)).isoformat()
+            print(f"\n  다음 페이지: --since={next_day}")
+        
+        archived = sum(count for day, count in self.archive.bundles("reports").items() if since is None or day >= since)
+        if archived:
+            print(f"  • 보관된 보고서 {archived}건 (./ceo-dashboard.py archive reports)")
+    
+    def view_archive(self, kind: str = None, record_id: str = None):
+        """보관된 작업/보고서/알림 보기"""
+        if kind is None:
+            print("\n🗄️ 보관소:")
+            for kind, stats in self.archive.stats().items():
+                print(f"  • {kind}: {stats['count']}건 / 묶음 {stats['bundles']}개 / {stats['bytes'] // 1024}KB")
+            return
+        
+        if record_id:
+            record = self.archive.get(kind, record_id)
+            print(json.dumps(record, indent=2, ensure_ascii=False) if record else f"{record_id}: 보관된 기록이 없습니다.")
+            return
         
-        for report_file in reports:
-            report = json.loads(report_file.read_text())
-            print(f"  • {report_file.stem}: {report.get('date', 'N/A')}")
+        print(f"\n🗄️ 보관된 {kind}:")
+        for day, count in self.archive.bundles(kind).items():
+            print(f"  • {day}: {count}건")
     
     def send_message(self, agent: str, message: str):
         """에이전트에게 메시지 전송"""
@@ -203,24 +465,24 @@ class CEODashboard:
             "requires_ceo_approval": False
         }
         
-        msg_file = self.shared_dir / "messages" / f"{agent}_{datetime.now().timestamp()}.json"
-        msg_file.parent.mkdir(parents=True, exist_ok=True)
-        msg_file.write_text(json.dumps(msg, indent=2))
+        self.message_log.append(BROADCAST_TOPIC if agent == "all" else agent, msg)
         
         print(f"✉️ {agent}에게 메시지를 전송했습니다.")
     
     def emergency_meeting(self, topic: str):
-        """긴급 회의 소집"""
+        """긴급 회의 소집 (전체 공지 한 번 기록)"""
         print(f"\n🚨 긴급 회의 소집: {topic}")
         
-        agents = ["pm_claude", "hardware_claude", "backend_claude", "frontend_claude", "qa_claude"]
-        for agent in agents:
-            self.send_message(agent, f"URGENT MEETING: {topic}. Please review and prepare your status.")
+        self.send_message("all", f"URGENT MEETING: {topic}. Please review and prepare your status.")
         
         print("모든 에이전트에게 긴급 회의 알림을 전송했습니다.")
 
 def main():
-    dashboard = CEODashboard()
+    config = load_config(sys.argv[1:])
+    sys.argv[1:] = strip_config_args(sys.argv[1:])
+    if config.task_backend == "memory":
+        print("⚠️ memory 작업 저장소는 프로세스 안에서만 보입니다 (다른 프로세스의 작업은 보이지 않음)")
+    dashboard = CEODashboard(config=config)
     
     if len(sys.argv) < 2:
         dashboard.show_status()
@@ -228,9 +490,18 @@ def main():
         print("  ./ceo-dashboard.py status          - 전체 상태 확인")
         print("  ./ceo-dashboard.py proposals       - 제품 제안서 검토")
         print("  ./ceo-dashboard.py assign <agent> <task> - 작업 할당")
+        print("  ./ceo-dashboard.py assign-batch [file|-] - JSONL/CSV 작업 목록 일괄 할당 (기본: stdin)")
         print("  ./ceo-dashboard.py message <agent> <msg> - 메시지 전송")
         print("  ./ceo-dashboard.py meeting <topic> - 긴급 회의")
-        print("  ./ceo-dashboard.py reports         - 보고서 보기")
+        print("  ./ceo-dashboard.py reports [--since=YYYY-MM-DD] [--limit=N] - 보고서 보기")
+        print("  ./ceo-dashboard.py tasks [--agent=] [--status=a,b] [--priority=4-5] [--since=] [--until=]")
+        print("                          [--text=] [--sort=-priority] [--limit=20] [--cursor=] [--all] - 작업 조회")
+        print("  ./ceo-dashboard.py retry <task_id> - dead_letter 작업 다시 대기열로 (목록: tasks --status=dead_letter)")
+        print("  ./ceo-dashboard.py notifications [--all] [--limit=20] - 읽지 않은 긴급 알림 (--all: 전체 우선순위)")
+        print("  ./ceo-dashboard.py watch           - 실시간 알림 보기")
+        print("  ./ceo-dashboard.py archive [종류] [ID] - 보관된 작업/보고서/알림 보기")
+        print("  ./ceo-dashboard.py serve [port]    - 상주형 대시보드 (http://127.0.0.1:8765/status)")
+        print("  공통 옵션: --home=<dir> --shared-dir=<dir> --task-backend=file|sqlite|memory --config=<file>")
         return
     
     command = sys.argv[1]
@@ -243,6 +514,13 @@ def main():
         agent = sys.argv[2]
         task = " ".join(sys.argv[3:])
         dashboard.assign_task(agent, task)
+    elif command == "assign-batch":
+        source = sys.argv[2] if len(sys.argv) >= 3 else "-"
+        if source == "-":
+            dashboard.assign_batch(sys.stdin)
+        else:
+            with open(source, newline="") as f:
+                dashboard.assign_batch(f)
     elif command == "message" and len(sys.argv) >= 4:
         agent = sys.argv[2]
         message = " ".join(sys.argv[3:])
@@ -251,7 +529,32 @@ def main():
         topic = " ".join(sys.argv[2:])
         dashboard.emergency_meeting(topic)
     elif command == "reports":
-        dashboard.view_reports()
+        try:
+            options = parse_options(sys.argv[2:])
+            dashboard.view_reports(options.get("since"), int(options.get("limit") or 5))
+        except ValueError as e:
+            print(f"잘못된 옵션입니다: {e}")
+    elif command == "tasks":
+        try:
+            query, all_pages = parse_task_query(sys.argv[2:])
+        except ValueError as e:
+            print(f"잘못된 옵션입니다: {e}")
+        else:
+            dashboard.list_tasks(query, all_pages)
+    elif command == "retry" and len(sys.argv) >= 3:
+        dashboard.retry_task(sys.argv[2])
+    elif command == "notifications":
+        try:
+            options = parse_options(sys.argv[2:])
+            dashboard.view_notifications("all" in options, int(options.get("limit") or 20))
+        except ValueError as e:
+            print(f"잘못된 옵션입니다: {e}")
+    elif command == "watch":
+        dashboard.watch()
+    elif command == "serve":
+        dashboard.serve(int(sys.argv[2]) if len(sys.argv) >= 3 else 8765)
+    elif command == "archive" and (len(sys.argv) < 3 or sys.argv[2] in ARCHIVE_KINDS):
+        dashboard.view_archive(*sys.argv[2:4])
     else:
         print("잘못된 명령입니다.")
 
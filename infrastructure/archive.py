@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Archive - 오래된 완료 작업/보고서/CEO 알림을 날짜별 압축 묶음으로 보관
+
+archive/
+    index.json                    종류별 레코드 수, 날짜별 묶음 크기 (카운터만)
+    ids.db                        ID → 묶음 날짜 (SQLite, (kind, id) 기본 키)
+    <kind>/<YYYY-MM-DD>.jsonl.gz  그날의 레코드 ({"id", "record"} JSON 한 줄씩, gzip)
+
+- archive_tasks()/archive_files()는 hot 디렉토리에 최근 keep개만 남기고 나머지를 묶음으로 옮긴다
+- 묶음 추가 → index 교체 → ids.db 커밋 → 원본 삭제 순서라, 중간에 죽으면 다음 실행에서 같은
+  레코드가 한 번 더 추가될 수 있다 (get()은 ids.db 기준, records()는 ID로 중복 제거)
+- index.json은 카운터만 두므로 보관된 레코드가 늘어도 크기가 일정하고, ID 조회는 ids.db 한 번
+- 묶음에는 gzip 멤버를 이어 붙이므로 기존 내용을 다시 압축하지 않는다
+- 보관된 레코드 수는 index에 있으므로 대시보드 카운트는 파일 수와 상관없이 일정 시간
+- 예전 index.json의 "ids" 맵은 처음 열 때 ids.db로 옮김
+"""
+
+import fcntl
+import gzip
+import json
+import sqlite3
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from codec import read_record
+from task_store import TaskStore, write_atomic
+
+ARCHIVE_KINDS = ["tasks", "reports", "notifications"]
+
+
+def _day(timestamp: Optional[str]) -> str:
+    """ISO 시각 → 묶음 날짜 (없거나 잘못된 값이면 오늘)"""
+    try:
+        return datetime.fromisoformat(timestamp).date().isoformat()
+    except (TypeError, ValueError):
+        return datetime.now().date().isoformat()
+
+
+class Archive:
+    """날짜별 압축 묶음 + index"""
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = Path(archive_dir)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.archive_dir / "index.json"
+        self._lock = threading.RLock()
+        self._index: Dict[str, Dict] = {}
+        self._index_mtime = None
+        self.conn = sqlite3.connect(str(self.archive_dir / "ids.db"), check_same_thread=False,
+                                    isolation_level=None, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS ids (
+                kind TEXT NOT NULL,
+                id TEXT NOT NULL,
+                day TEXT NOT NULL,
+                PRIMARY KEY (kind, id)
+            ) WITHOUT ROWID
+        """)
+        self._migrate_ids()
+
+    def _bundle_path(self, kind: str, day: str) -> Path:
+        return self.archive_dir / kind / f"{day}.jsonl.gz"
+
+    @contextmanager
+    def _locked(self):
+        """index 갱신은 프로세스 간 잠금 안에서 (서버와 대시보드가 동시에 보관해도 안전)"""
+        with self._lock, open(self.archive_dir / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _migrate_ids(self):
+        """예전 index.json의 ID → 날짜 맵을 ids.db로 옮기고 index에는 카운터만 남김"""
+        if not any("ids" in entry for entry in self._load_index().values()):
+            return
+        with self._locked():
+            index = json.loads(json.dumps(self._load_index()))
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for kind, entry in index.items():
+                    self.conn.executemany("INSERT OR REPLACE INTO ids (kind, id, day) VALUES (?, ?, ?)",
+                                          [(kind, record_id, day) for record_id, day in entry.pop("ids", {}).items()])
+                write_atomic(self.index_file, json.dumps(index, ensure_ascii=False))
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """index.json (바뀌었을 때만 다시 읽음)"""
+        try:
+            mtime = self.index_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if mtime != self._index_mtime:
+            self._index = json.loads(self.index_file.read_text())
+            self._index_mtime = mtime
+        return self._index
+
+    def add(self, kind: str, records: List[Tuple[str, str, Any]]) -> int:
+        """(ID, 날짜, 레코드) 목록을 날짜별 묶음에 추가하고 새로 보관된 레코드 수 반환"""
+        by_day = defaultdict(list)
+        for record_id, day, record in records:
+            by_day[day].append((record_id, record))
+
+        added = 0
+        with self._locked():
+            index = json.loads(json.dumps(self._load_index()))
+            entry = index.setdefault(kind, {"count": 0, "bundles": {}})
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for day, items in sorted(by_day.items()):
+                    path = self._bundle_path(kind, day)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    lines = "".join(json.dumps({"id": record_id, "record": record}, ensure_ascii=False) + "\n"
+                                    for record_id, record in items)
+                    with gzip.open(path, "ab") as f:
+                        f.write(lines.encode())
+                    for record_id, _ in items:
+                        cursor = self.conn.execute("INSERT OR IGNORE INTO ids (kind, id, day) VALUES (?, ?, ?)",
+                                                   (kind, record_id, day))
+                        if cursor.rowcount:
+                            entry["count"] += 1
+                            entry["bundles"][day] = entry["bundles"].get(day, 0) + 1
+                            added += 1
+                        else:
+                            self.conn.execute("UPDATE ids SET day = ? WHERE kind = ? AND id = ?",
+                                              (day, kind, record_id))
+                write_atomic(self.index_file, json.dumps(index, ensure_ascii=False))
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return added
+
+    def count(self, kind: str) -> int:
+        """보관된 레코드 수"""
+        return self._load_index().get(kind, {}).get("count", 0)
+
+    def bundles(self, kind: str) -> Dict[str, int]:
+        """날짜별 묶음의 레코드 수"""
+        return dict(sorted(self._load_index().get(kind, {}).get("bundles", {}).items()))
+
+    def _read_bundle(self, kind: str, day: str) -> Iterator[Dict]:
+        try:
+            with gzip.open(self._bundle_path(kind, day), "rt") as f:
+                for line in f:
+                    yield json.loads(line)
+        except FileNotFoundError:
+            return
+
+    def get(self, kind: str, record_id: str) -> Optional[Any]:
+        """ID로 보관된 레코드 조회 (ids.db로 묶음 하나만 읽음)"""
+        with self._lock:
+            row = self.conn.execute("SELECT day FROM ids WHERE kind = ? AND id = ?", (kind, record_id)).fetchone()
+        if row is None:
+            return None
+        day = row[0]
+        found = None
+        for line in self._read_bundle(kind, day):
+            if line["id"] == record_id:
+                found = line["record"]
+        return found
+
+    def records(self, kind: str, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """기간(YYYY-MM-DD, 양끝 포함) 안의 보관 레코드 → (ID, 레코드), 날짜순"""
+        for day in self.bundles(kind):
+            if (start and day < start) or (end and day > end):
+                continue
+            seen = set()
+            for line in self._read_bundle(kind, day):
+                if line["id"] not in seen:
+                    seen.add(line["id"])
+                    yield line["id"], line["record"]
+
+    def stats(self) -> Dict[str, Dict]:
+        """종류별 레코드 수, 묶음 수, 압축 크기"""
+        result = {}
+        for kind in ARCHIVE_KINDS:
+            bundles = self.bundles(kind)
+            size = sum(self._bundle_path(kind, day).stat().st_size
+                       for day in bundles if self._bundle_path(kind, day).exists())
+            result[kind] = {"count": self.count(kind), "bundles": len(bundles), "bytes": size}
+        return result
+
+
+def archive_tasks(archive: Archive, store: TaskStore, keep: int = 500) -> int:
+    """완료 작업 중 최근 keep개만 저장소에 남기고 나머지는 보관 (완료 날짜별 묶음)"""
+    completed = sorted(store.find(["completed"]), key=lambda task: task.get("updated_at") or "", reverse=True)
+    old = completed[keep:]
+    if not old:
+        return 0
+    archive.add("tasks", [(task["id"], _day(task.get("updated_at")), task) for task in old])
+    for task in old:
+        store.remove(task["id"])
+    return len(old)
+
+
+def archive_files(archive: Archive, kind: str, directory: Path, pattern: str = "*.json", keep: int = 100) -> int:
+    """디렉토리에서 최근 keep개 파일만 남기고 나머지는 보관 (파일 수정 날짜별 묶음, ID는 파일 이름)"""
+    files = []
+    for path in Path(directory).glob(pattern):
+        try:
+            files.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    files.sort(reverse=True)
+
+    records, archived = [], []
+    for mtime, path in files[keep:]:
+        try:
+            record = read_record(path)
+        except (FileNotFoundError, ValueError, EOFError):
+            continue
+        records.append((path.stem, datetime.fromtimestamp(mtime).date().isoformat(), record))
+        archived.append(path)
+    if not records:
+        return 0
+    archive.add(kind, records)
+    for path in archived:
+        path.unlink(missing_ok=True)
+    return len(archived)
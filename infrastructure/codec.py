@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Codec - 작업/메시지/상태 레코드 직렬화
+
+- json: 들여쓰기 없는 compact JSON (기본값, 사람이 읽을 수 있음)
+- pretty: 기존 indent=2 JSON
+- marshal: 표준 라이브러리 marshal 바이너리 (가장 빠름, 같은 워크스페이스의 Python 프로세스끼리만)
+- msgpack: msgpack 바이너리 (msgpack 패키지가 설치된 경우)
+
+바이너리 레코드는 첫 바이트에 형식 태그가 붙으므로, 읽을 때는 설정과 상관없이
+형식을 자동으로 판별한다 (기존 pretty JSON 파일도 그대로 읽힘).
+파일 이름은 형식과 상관없이 기존대로 <id>.json 을 유지한다.
+"""
+
+import json
+import marshal
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+MARSHAL_TAG = b"\x01"
+MSGPACK_TAG = b"\x02"
+
+
+class Codec:
+    """레코드 인코더/디코더 인터페이스"""
+
+    name = ""
+
+    def encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    def __init__(self, indent: Optional[int] = None):
+        self.indent = indent
+        self.name = "pretty" if indent else "json"
+        self._separators = None if indent else (",", ":")
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, indent=self.indent, separators=self._separators,
+                          ensure_ascii=False).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MarshalCodec(Codec):
+    """marshal 바이너리 (신뢰할 수 있는 로컬 파일 전용 - 외부 입력에는 사용하지 말 것)"""
+
+    name = "marshal"
+
+    def encode(self, obj: Any) -> bytes:
+        return MARSHAL_TAG + marshal.dumps(obj, 4)
+
+    def decode(self, data: bytes) -> Any:
+        return marshal.loads(data[1:])
+
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def encode(self, obj: Any) -> bytes:
+        return MSGPACK_TAG + self._msgpack.packb(obj, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data[1:], raw=False)
+
+
+_CODECS: Dict[str, Codec] = {}
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """이름으로 코덱 조회 (없으면 CLAUDETEAM_CODEC 환경 변수, 기본 json)"""
+    name = name or os.environ.get("CLAUDETEAM_CODEC", "json")
+    if name not in _CODECS:
+        if name == "json":
+            _CODECS[name] = JsonCodec()
+        elif name == "pretty":
+            _CODECS[name] = JsonCodec(indent=2)
+        elif name == "marshal":
+            _CODECS[name] = MarshalCodec()
+        elif name == "msgpack":
+            _CODECS[name] = MsgpackCodec()
+        else:
+            raise ValueError(f"Unknown codec: {name}")
+    return _CODECS[name]
+
+
+def decode(data: bytes) -> Any:
+    """형식 태그로 코덱을 판별해 디코딩 (태그가 없으면 JSON)"""
+    if data[:1] == MARSHAL_TAG:
+        return get_codec("marshal").decode(data)
+    if data[:1] == MSGPACK_TAG:
+        return get_codec("msgpack").decode(data)
+    return json.loads(data)
+
+
+def read_record(path: Path) -> Any:
+    """레코드 파일 읽기 (모든 형식)"""
+    return decode(Path(path).read_bytes())
+
+
+def write_record(path: Path, obj: Any, codec: Optional[Codec] = None):
+    """레코드 파일 쓰기 (codec이 없으면 기본 코덱)"""
+    Path(path).write_bytes((codec or get_codec()).encode(obj))
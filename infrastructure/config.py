@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Config - 작업 공간 경로와 작업 저장소 백엔드 설정 (MCP 서버/에이전트/CEO 대시보드 공통)
+
+우선순위: 기본값 < 설정 파일 < 환경 변수 < 명령행
+
+  CLAUDETEAM_HOME          --home=<dir>          작업 공간 루트 (기본 /home/jyjjeon/claudeteam-startup)
+  CLAUDETEAM_SHARED_DIR    --shared-dir=<dir>    shared-workspace 위치 (기본 <home>/shared-workspace,
+                                                 tmpfs에 두려면 예: /dev/shm/claudeteam)
+  CLAUDETEAM_TASK_BACKEND  --task-backend=<name> 작업 저장소: file | sqlite | memory
+  CLAUDETEAM_CONFIG        --config=<file>       위 값을 담은 JSON 파일 ({"home": ..., "shared_dir": ..., "task_backend": ...})
+
+memory 백엔드는 프로세스 안에서만 보이므로 저장소를 task_store로 넘겨 공유하는 경우
+(agent_runtime.py, 벤치마크/시뮬레이션)에 쓴다.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from task_store import TASK_BACKENDS, TaskStore, open_task_store
+
+DEFAULT_HOME = "/home/jyjjeon/claudeteam-startup"
+
+# 설정 키 → (환경 변수, 명령행 옵션)
+SETTINGS = {
+    "home": ("CLAUDETEAM_HOME", "--home="),
+    "shared_dir": ("CLAUDETEAM_SHARED_DIR", "--shared-dir="),
+    "task_backend": ("CLAUDETEAM_TASK_BACKEND", "--task-backend="),
+}
+CONFIG_OPTION = "--config="
+
+
+@dataclass
+class Config:
+    home: Path
+    shared_dir: Path
+    task_backend: str = "file"
+
+    def open_task_store(self, **options) -> TaskStore:
+        """설정된 백엔드로 작업 저장소 생성"""
+        return open_task_store(self.shared_dir, self.task_backend, **options)
+
+
+def _cli_values(args: Sequence[str]) -> Dict[str, str]:
+    values = {}
+    for arg in args:
+        for key, (_, option) in SETTINGS.items():
+            if arg.startswith(option):
+                values[key] = arg[len(option):]
+        if arg.startswith(CONFIG_OPTION):
+            values["config"] = arg[len(CONFIG_OPTION):]
+    return values
+
+
+def strip_config_args(args: Sequence[str]) -> List[str]:
+    """명령행에서 설정 옵션을 뺀 나머지 인자"""
+    options = tuple(option for _, option in SETTINGS.values()) + (CONFIG_OPTION,)
+    return [arg for arg in args if not arg.startswith(options)]
+
+
+def load_config(args: Sequence[str] = (), environ: Optional[Mapping[str, str]] = None, **overrides) -> Config:
+    """설정 파일/환경 변수/명령행(args)을 합친 설정
+
+    overrides(None이 아닌 값)가 가장 우선하며, home만 지정하면 shared_dir도 그 아래로 정해진다
+    (base_dir 인자로 임시 디렉토리를 넘기는 벤치마크가 환경의 shared_dir을 따라가지 않도록).
+    """
+    environ = os.environ if environ is None else environ
+    cli = _cli_values(args)
+
+    values: Dict[str, str] = {}
+    config_file = cli.get("config") or environ.get("CLAUDETEAM_CONFIG")
+    if config_file:
+        values.update({key: value for key, value in json.loads(Path(config_file).expanduser().read_text()).items()
+                       if key in SETTINGS})
+    for key, (env_name, _) in SETTINGS.items():
+        if environ.get(env_name):
+            values[key] = environ[env_name]
+    values.update({key: value for key, value in cli.items() if key in SETTINGS})
+
+    overrides = {key: value for key, value in overrides.items() if value is not None}
+    if "home" in overrides and "shared_dir" not in overrides:
+        values.pop("shared_dir", None)
+    values.update(overrides)
+
+    home = Path(values.get("home") or DEFAULT_HOME).expanduser()
+    shared_dir = Path(values["shared_dir"]).expanduser() if values.get("shared_dir") else home / "shared-workspace"
+    task_backend = values.get("task_backend") or "file"
+    if task_backend not in TASK_BACKENDS:
+        raise ValueError(f"Unknown task store backend: {task_backend} (choose from {', '.join(TASK_BACKENDS)})")
+    return Config(home=home, shared_dir=shared_dir, task_backend=task_backend)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Daily Stats - 일별 작업 활동 집계 (증분 방식)
+
+작업 저장소의 변경 이벤트를 reports/activity/<날짜>.jsonl 에 한 줄씩 추가하고,
+읽을 때는 마지막으로 읽은 위치 이후만 반영한다. 보고서 생성 비용은 전체 이력이 아니라
+해당 기간의 활동량에 비례한다. 여러 프로세스가 같은 파일에 추가해도 된다 (O_APPEND).
+"""
+
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from task_store import TaskStore
+
+COUNTED_EVENTS = ["created", "in_progress", "review", "completed", "blocked", "dead_letter"]
+
+
+def _as_date(value: Union[str, date, None], now: Callable[[], datetime]) -> date:
+    """날짜 인자 → date (없으면 now() 기준 오늘 - 시뮬레이션은 가상 시계의 날짜)"""
+    if value is None:
+        return now().date()
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def _empty_bucket(day: str) -> Dict:
+    return {
+        "date": day,
+        "counts": {event: 0 for event in COUNTED_EVENTS},
+        "by_agent": {},
+        "completed": {},  # task_id -> task (같은 작업이 여러 번 완료되면 마지막 것)
+        "blocked": {},
+    }
+
+
+class DailyStats:
+    """일별 활동 버킷 (이벤트 로그 + 읽은 위치까지의 집계 캐시)"""
+
+    def __init__(self, stats_dir: Path, now: Optional[Callable[[], datetime]] = None):
+        self.stats_dir = Path(stats_dir)
+        self.now = now or datetime.now  # 이벤트 시각 (시뮬레이션은 가상 시계)
+        self.stats_dir.mkdir(parents=True, exist_ok=True)
+        self._buckets: Dict[str, Dict] = {}
+        self._offsets: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, task_store: TaskStore) -> "DailyStats":
+        """작업 저장소의 변경 이벤트를 기록하도록 등록"""
+        task_store.add_listener(self.record, self.record_many)
+        return self
+
+    def _path(self, day: str) -> Path:
+        return self.stats_dir / f"{day}.jsonl"
+
+    def record(self, event: str, task: Dict):
+        """이벤트 한 건 추가 (한 번의 write로 한 줄 전체를 기록)"""
+        now = self.now()
+        line = json.dumps({"at": now.isoformat(), "event": event, "task": task},
+                          separators=(",", ":")) + "\n"
+        fd = os.open(self._path(now.date().isoformat()), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode())
+        finally:
+            os.close(fd)
+
+    def record_many(self, event: str, tasks: List[Dict], chunk_lines: int = 1000):
+        """같은 이벤트 여러 건 추가 (chunk_lines줄씩 한 번의 write - 줄 단위 원자성 유지)"""
+        now = self.now()
+        at = now.isoformat()
+        lines = [json.dumps({"at": at, "event": event, "task": task}, separators=(",", ":")) + "\n"
+                 for task in tasks]
+        fd = os.open(self._path(now.date().isoformat()), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            for start in range(0, len(lines), chunk_lines):
+                os.write(fd, "".join(lines[start:start + chunk_lines]).encode())
+        finally:
+            os.close(fd)
+
+    def _apply(self, bucket: Dict, entry: Dict):
+        event, task = entry["event"], entry["task"]
+        if event not in bucket["counts"]:
+            return
+        bucket["counts"][event] += 1
+        agent_counts = bucket["by_agent"].setdefault(task.get("assigned_to", "unknown"),
+                                                     {e: 0 for e in COUNTED_EVENTS})
+        agent_counts[event] += 1
+        if event in ("completed", "blocked"):
+            bucket[event][task["id"]] = task
+
+    def day(self, day: Union[str, date, None] = None) -> Dict:
+        """하루치 집계 (새로 추가된 줄만 읽어서 반영)"""
+        key = _as_date(day, self.now).isoformat()
+        with self._lock:
+            bucket = self._buckets.setdefault(key, _empty_bucket(key))
+            path = self._path(key)
+            offset = self._offsets.get(key, 0)
+            try:
+                if path.stat().st_size > offset:
+                    with open(path, "rb") as f:
+                        f.seek(offset)
+                        data = f.read()
+                    # 아직 쓰는 중인 마지막 줄은 다음에 읽음
+                    complete = data[:data.rfind(b"\n") + 1]
+                    for line in complete.splitlines():
+                        if line.strip():
+                            self._apply(bucket, json.loads(line))
+                    self._offsets[key] = offset + len(complete)
+            except FileNotFoundError:
+                pass
+            return bucket
+
+    def range(self, start: Union[str, date], end: Union[str, date, None] = None) -> Dict:
+        """기간 집계 (start ~ end, 양 끝 포함)"""
+        start_day, end_day = _as_date(start, self.now), _as_date(end, self.now)
+        totals = {event: 0 for event in COUNTED_EVENTS}
+        by_agent: Dict[str, Dict] = {}
+        completed, blocked, days = {}, {}, []
+
+        day = start_day
+        while day <= end_day:
+            bucket = self.day(day)
+            days.append({"date": bucket["date"], "counts": dict(bucket["counts"])})
+            for event, count in bucket["counts"].items():
+                totals[event] += count
+            for agent, counts in bucket["by_agent"].items():
+                agent_totals = by_agent.setdefault(agent, {e: 0 for e in COUNTED_EVENTS})
+                for event, count in counts.items():
+                    agent_totals[event] += count
+            completed.update(bucket["completed"])
+            blocked.update(bucket["blocked"])
+            day += timedelta(days=1)
+
+        return {
+            "start": start_day.isoformat(),
+            "end": end_day.isoformat(),
+            "totals": totals,
+            "by_agent": by_agent,
+            "days": days,
+            "completed": list(completed.values()),
+            "blocked": list(blocked.values()),
+        }
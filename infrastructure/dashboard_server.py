@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Dashboard Server - 상주형 CEO 대시보드 (로컬 HTTP/JSON)
+
+  ./ceo-dashboard.py serve [port]
+
+- DashboardModel이 팀 상태/작업 수/대기열/승인 대기/보관 수를 메모리에 들고 있고,
+  바뀐 소스만 다시 읽는다 (작업 저장소 version, 디렉토리 mtime, 보관소 index)
+- 내용이 바뀌었을 때만 version을 올리고 JSON/텍스트 응답을 미리 만들어 두므로,
+  요청마다 파일을 읽지 않는다 (새로고침 비용이 작업/파일 수와 무관)
+- 읽지 않은 긴급(critical/high) 알림은 NotificationStore의 우선순위별 링에서 새로 추가된 줄만 읽음
+- Redis(CLAUDETEAM_REDIS_URL)가 있으면 ceo:urgent/broadcast 알림을 받아 최근 알림에 추가하고 바로 갱신
+
+GET /status                       전체 상태 JSON
+GET /status?since=<v>&wait=<초>   version이 v와 달라질 때까지 대기 (long poll)
+GET /text                         status 명령과 같은 형식의 텍스트
+GET /metrics                      에이전트/서버가 기록한 metrics/*.prom 을 합친 Prometheus 텍스트
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from archive import Archive
+from codec import read_record
+from heartbeat import HEARTBEAT_INTERVAL, read_heartbeats, unresponsive_agents
+from metrics import read_metrics_dir
+from notification_store import NotificationStore
+from status_writer import SHARED_STATUS_FILE, read_team_status
+from task_queue import TaskScheduler
+from task_store import FileTaskStore, TaskStore
+from transport import open_transport
+
+MAX_WAIT_SECONDS = 30
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class DashboardModel:
+    """대시보드 인메모리 모델 (refresh()는 바뀐 소스만 다시 읽음)"""
+
+    def __init__(self, shared_dir: Path, ceo_dir: Path, task_store: Optional[TaskStore] = None):
+        self.shared_dir = Path(shared_dir)
+        self.ceo_dir = Path(ceo_dir)
+        self.task_store = task_store or FileTaskStore(self.shared_dir / "tasks")
+        self.scheduler = TaskScheduler(self.task_store)
+        self.archive = Archive(self.shared_dir / "archive")
+        self.alerts = NotificationStore(self.shared_dir / "ceo-office" / "notifications")
+
+        self.version = 0
+        self.json = b"{}"
+        self.text = ""
+        self.notifications = deque(maxlen=20)
+        self._changed = threading.Condition()
+        self._lock = threading.Lock()
+
+        self._task_version = None
+        self._tasks: Dict[str, int] = {}
+        self._queues: Dict[str, Dict] = {}
+        self._status_mtimes = None
+        self._team: Dict[str, Dict] = {}
+        self._inbox_mtime = None
+        self._inbox: Dict[str, str] = {}
+        self._liveness_checked = None
+        self._unresponsive: list = []
+        self._view: Optional[Dict] = None
+
+    def _refresh_tasks(self):
+        # 상태별 작업 수는 이름만 세고, 내용은 대기열에 필요한 pending만 읽음 (완료 이력은 읽지 않음)
+        counts = {status: self.task_store.count(status) for status in ["pending", "in_progress", "completed"]}
+        dead_letter = self.task_store.count("dead_letter")
+        if dead_letter:
+            counts["dead_letter"] = dead_letter
+        version = (self.task_store.version(["pending"]), tuple(counts.items()))
+        if version == self._task_version:
+            return
+        self._task_version = version
+        self._tasks = counts
+        self.scheduler.sync()
+        self._queues = {
+            agent: {"depth": metrics["depth"], "next": self.scheduler.ordered(agent, 1)[0]["title"]}
+            for agent, metrics in self.scheduler.metrics().items() if metrics["depth"]
+        }
+
+    def _refresh_team(self):
+        status_dir = self.shared_dir / "status"
+        mtimes = (_mtime(status_dir), _mtime(self.shared_dir / SHARED_STATUS_FILE))
+        if mtimes != self._status_mtimes:
+            self._status_mtimes = mtimes
+            self._team = read_team_status(status_dir)
+
+    def _refresh_liveness(self):
+        """생존 신호는 mtime만 바뀌므로 디렉토리 변경으로 알 수 없음 - HEARTBEAT_INTERVAL마다 한 번만 확인"""
+        now = time.monotonic()
+        if self._liveness_checked is not None and now - self._liveness_checked < HEARTBEAT_INTERVAL:
+            return
+        self._liveness_checked = now
+        self._unresponsive = sorted(unresponsive_agents(read_heartbeats(self.shared_dir / "heartbeats")))
+
+    def _refresh_inbox(self):
+        inbox = self.ceo_dir / "inbox"
+        mtime = _mtime(inbox)
+        if mtime == self._inbox_mtime:
+            return
+        self._inbox_mtime = mtime
+        names = {path.name for path in inbox.glob("*.json")} if mtime is not None else set()
+        for name in set(self._inbox) - names:
+            del self._inbox[name]
+        for name in names - set(self._inbox):
+            try:
+                self._inbox[name] = read_record(inbox / name).get("subject", "Unknown")
+            except (FileNotFoundError, ValueError, EOFError):
+                self._inbox_mtime = None  # 쓰는 중인 파일 - 다음 refresh에서 다시 읽음
+
+    def refresh(self) -> bool:
+        """바뀐 소스만 다시 읽고, 내용이 달라졌으면 version 증가 (변경 여부 반환)"""
+        with self._lock:
+            self._refresh_tasks()
+            self._refresh_team()
+            self._refresh_liveness()
+            self._refresh_inbox()
+            view = {
+                "team": {agent: ("⚠️ 응답 없음 - " if agent in self._unresponsive else "")
+                         + data.get("current_task", "Idle") for agent, data in sorted(self._team.items())},
+                "unresponsive": self._unresponsive,
+                "tasks": dict(self._tasks, completed=self._tasks.get("completed", 0) + self.archive.count("tasks")),
+                "queues": self._queues,
+                "approvals": sorted(self._inbox.values()),
+                "urgent_unread": self.alerts.unread_count(),
+                "urgent": self.alerts.unread(limit=5),
+                "notifications": list(self.notifications),
+            }
+            if view == self._view:
+                return False
+            self._view = view
+            snapshot = dict(view, version=self.version + 1, updated_at=datetime.now().isoformat())
+            body = json.dumps(snapshot, ensure_ascii=False, indent=2).encode()
+            text = self._render(view)
+            with self._changed:
+                self.version += 1
+                self.json, self.text = body, text
+                self._changed.notify_all()
+            return True
+
+    def add_notification(self, channel: str, message):
+        """실시간 알림 추가 (다음 refresh에 반영)"""
+        self.notifications.appendleft({"channel": channel, "message": message,
+                                       "received_at": datetime.now().isoformat()})
+
+    def wait(self, since: int, timeout: float) -> bytes:
+        """version이 since와 달라질 때까지 최대 timeout초 대기 후 JSON 반환"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != since, timeout)
+            return self.json
+
+    @staticmethod
+    def _render(view: Dict) -> str:
+        lines = ["🏢 ClaudeTeam AI - CEO Dashboard", "", "📊 팀 상태:"]
+        lines += [f"  • {agent}: {task}" for agent, task in view["team"].items()]
+        lines += ["", "📋 작업 현황:"]
+        lines += [f"  • {status.capitalize()}: {count}" for status, count in view["tasks"].items()]
+        if view["queues"]:
+            lines += ["", "📥 대기열:"]
+            lines += [f"  • {agent}: {queue['depth']}건 (다음: {queue['next']})" for agent, queue in view["queues"].items()]
+        lines += ["", "⏳ 승인 대기 사항:"]
+        lines += [f"  • {subject}" for subject in view["approvals"][:3]] or ["  • 없음"]
+        if view["urgent"]:
+            lines += ["", "🚨 읽지 않은 긴급 알림 (" + ", ".join(
+                f"{priority} {count}건" for priority, count in view["urgent_unread"].items() if count) + "):"]
+            lines += [f"  • [{item['priority']}] {item['message']}" for item in view["urgent"]]
+        if view["notifications"]:
+            lines += ["", "🔔 최근 알림:"]
+            lines += [f"  • [{item['channel']}] {item['message']}" for item in view["notifications"][:5]]
+        return "\n".join(lines) + "\n"
+
+
+def _handler(model: DashboardModel):
+    class DashboardHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path in ("/", "/status"):
+                if "since" in query:
+                    try:
+                        since = int(query["since"][0])
+                        wait = min(float(query.get("wait", [MAX_WAIT_SECONDS])[0]), MAX_WAIT_SECONDS)
+                    except ValueError:
+                        self.send_error(400, "since/wait must be numbers")
+                        return
+                    body = model.wait(since, wait)
+                else:
+                    body = model.json
+                self._send(body, "application/json")
+            elif url.path == "/text":
+                self._send(model.text.encode(), "text/plain; charset=utf-8")
+            elif url.path == "/metrics":
+                body = read_metrics_dir(model.shared_dir / "metrics").encode()
+                self._send(body, "text/plain; version=0.0.4; charset=utf-8")
+            else:
+                self.send_error(404)
+
+        def _send(self, body: bytes, content_type: str):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return DashboardHandler
+
+
+async def _watch_notifications(model: DashboardModel, url: str, changed: asyncio.Event):
+    transport = await open_transport(url)
+    if transport is None or not transport.connected:
+        print("[DASHBOARD] Redis not available, refreshing from files only")
+        return
+    subscription = transport.subscribe(["ceo:urgent", "broadcast"], maxsize=50)
+    try:
+        async for channel, message in subscription:
+            model.add_notification(channel, message)
+            changed.set()
+    finally:
+        await transport.close()
+
+
+async def serve(model: DashboardModel, host: str = "127.0.0.1", port: int = 8765,
+                interval: float = 1.0, redis_url: Optional[str] = None):
+    """HTTP 서버를 띄우고 interval초마다 (또는 알림이 오면 바로) 모델 갱신"""
+    await asyncio.to_thread(model.refresh)
+    server = ThreadingHTTPServer((host, port), _handler(model))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[DASHBOARD] Serving on http://{host}:{server.server_address[1]}/status")
+
+    changed = asyncio.Event()
+    watcher = asyncio.create_task(_watch_notifications(model, redis_url, changed)) if redis_url else None
+    try:
+        while True:
+            try:
+                await asyncio.wait_for(changed.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            changed.clear()
+            await asyncio.to_thread(model.refresh)
+    finally:
+        if watcher:
+            watcher.cancel()
+        server.shutdown()
+        server.server_close()
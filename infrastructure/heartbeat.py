@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Heartbeat - 워커 생존 신호 (응답 없는 에이전트 감지용)
+
+heartbeats/<worker_id>.json     워커 정보 {"worker_id", "agent", "pid", "host", "started_at"}
+                                파일 mtime = 마지막 신호 시각
+
+- 신호 한 번은 os.utime 한 번 (내용은 시작할 때만 씀) - 수백 개 워커가 몇 초마다 보내도 부담 없음
+- 신호마다 on_beat(worker_id)를 불러 작업 lease도 함께 연장 (작업이 길어도 lease가 끊기지 않고,
+  프로세스가 죽으면 신호와 lease가 함께 끊긴다)
+- 정상 종료하면 파일을 지움 → 남아 있는데 stale_after초 넘게 갱신되지 않은 워커 = 응답 없음
+  (같은 호스트의 워커는 pid가 없어졌으면 바로 응답 없음으로 판단)
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from task_store import write_atomic
+
+HEARTBEAT_INTERVAL = 5  # 신호 간격 (초)
+STALE_AFTER = 30  # 이 시간 넘게 신호가 없으면 응답 없음 (초)
+
+
+class Heartbeat:
+    """워커 생존 신호 기록기 (한 프로세스의 여러 워커를 한 번에 갱신)"""
+
+    def __init__(self, heartbeat_dir: Path, on_beat: Optional[Callable[[str], None]] = None):
+        self.heartbeat_dir = Path(heartbeat_dir)
+        self.heartbeat_dir.mkdir(parents=True, exist_ok=True)
+        self.on_beat = on_beat
+        self._workers: Dict[str, Dict] = {}  # worker_id → 워커 정보
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _path(self, worker_id: str) -> Path:
+        return self.heartbeat_dir / f"{worker_id}.json"
+
+    def register(self, worker_id: str, agent: str):
+        """워커 등록 (정보 파일 작성 = 첫 신호)"""
+        info = {"worker_id": worker_id, "agent": agent, "pid": os.getpid(), "host": socket.gethostname(),
+                "started_at": datetime.now().isoformat()}
+        write_atomic(self._path(worker_id), json.dumps(info))
+        with self._lock:
+            self._workers[worker_id] = info
+
+    def unregister(self, worker_id: str):
+        """정상 종료 - 신호 파일 삭제 (워치독이 응답 없음으로 표시하지 않음)"""
+        with self._lock:
+            self._workers.pop(worker_id, None)
+        self._path(worker_id).unlink(missing_ok=True)
+
+    def beat(self):
+        """등록된 모든 워커의 신호 갱신"""
+        with self._lock:
+            workers = list(self._workers.items())
+        for worker_id, info in workers:
+            try:
+                os.utime(self._path(worker_id))
+            except FileNotFoundError:
+                # 워치독이 오래된 파일로 보고 지웠음 - 다시 작성
+                write_atomic(self._path(worker_id), json.dumps(info))
+            if self.on_beat:
+                try:
+                    self.on_beat(worker_id)
+                except Exception as e:
+                    print(f"[HEARTBEAT] Error: {e}")
+
+    def start(self, interval: float = HEARTBEAT_INTERVAL) -> "Heartbeat":
+        """백그라운드 스레드에서 interval초마다 신호 (작업 처리가 메인 스레드를 막고 있어도 계속 보냄)"""
+        def loop():
+            while not self._stop.wait(interval):
+                self.beat()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=loop, name="heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """신호 중지 및 등록된 워커 모두 해제"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            worker_ids = list(self._workers)
+        for worker_id in worker_ids:
+            self.unregister(worker_id)
+
+
+def _process_gone(info: Dict) -> bool:
+    """같은 호스트의 워커인데 프로세스가 없으면 True (다른 호스트는 알 수 없으므로 False)"""
+    if info.get("host") != socket.gethostname() or not info.get("pid"):
+        return False
+    try:
+        os.kill(info["pid"], 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+def read_heartbeats(heartbeat_dir: Path, stale_after: float = STALE_AFTER,
+                    now: Optional[float] = None) -> Dict[str, Dict]:
+    """worker_id → 워커 정보 + {"last_beat", "age", "stale"}"""
+    heartbeat_dir = Path(heartbeat_dir)
+    now = time.time() if now is None else now
+    heartbeats = {}
+    try:
+        entries = list(os.scandir(heartbeat_dir))
+    except FileNotFoundError:
+        return heartbeats
+    for entry in entries:
+        if entry.name.startswith(".") or not entry.name.endswith(".json"):
+            continue
+        try:
+            mtime = entry.stat().st_mtime
+            info = json.loads(Path(entry.path).read_text())
+        except (FileNotFoundError, ValueError):
+            continue  # 방금 지워졌거나 쓰는 중
+        age = max(now - mtime, 0)
+        info.update(last_beat=datetime.fromtimestamp(mtime).isoformat(), age=round(age, 1),
+                    stale=age > stale_after or _process_gone(info))
+        heartbeats[entry.name[:-5]] = info
+    return heartbeats
+
+
+def unresponsive_agents(heartbeats: Dict[str, Dict]) -> Dict[str, float]:
+    """모든 워커가 응답 없는 에이전트 → 가장 최근 신호 이후 경과 시간 (초)"""
+    ages: Dict[str, float] = {}
+    alive = set()
+    for info in heartbeats.values():
+        agent = info.get("agent")
+        if not info["stale"]:
+            alive.add(agent)
+        else:
+            ages[agent] = min(ages.get(agent, info["age"]), info["age"])
+    return {agent: age for agent, age in ages.items() if agent not in alive}
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Job Scheduler - cron 표현식 기반 주기 작업 실행기 (asyncio)
+
+- "분 시 일 월 요일" 5필드 cron 표현식 (*, */n, a-b, a-b/n, 쉼표 목록, 요일 0/7=일요일)
+- jitter: 실행 시각에 0~jitter초 무작위 지연 (여러 서버가 같은 시각에 몰리지 않도록)
+- catch-up: 서버가 꺼져 있는 동안 놓친 실행은 시작 직후 한 번만 실행 (마지막 실행 시각을 파일에 기록)
+- 같은 작업은 겹쳐 실행하지 않음 (이전 실행이 안 끝났으면 이번 회차는 건너뜀)
+- 동기 함수는 스레드 풀에서 실행하므로 오래 걸리는 작업이 이벤트 루프를 막지 않음
+"""
+
+import asyncio
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from task_store import write_atomic
+
+_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+
+def _parse_field(field: str, low: int, high: int) -> set:
+    values = set()
+    for part in field.split(","):
+        expr, _, step = part.partition("/")
+        if expr == "*":
+            start, end = low, high
+        elif "-" in expr:
+            start, end = (int(x) for x in expr.split("-", 1))
+        else:
+            start = end = int(expr)
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron field out of range: {part}")
+        values.update(range(start, end + 1, int(step or 1)))
+    return values
+
+
+class CronSchedule:
+    """cron 표현식 (로컬 시간 기준, 분 단위)"""
+
+    def __init__(self, expr: str):
+        fields = expr.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expr!r}")
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            _parse_field(field, low, high) for field, (low, high) in zip(fields, _FIELD_RANGES)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        # cron 규칙: 일/요일이 둘 다 제한되어 있으면 둘 중 하나만 맞아도 실행
+        self._day_restricted = fields[2] != "*"
+        self._weekday_restricted = fields[4] != "*"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후(dt 제외) 첫 실행 시각"""
+        current = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = current + timedelta(days=366 * 5)
+        while current < limit:
+            if current.month not in self.months:
+                current = (current.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(current):
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+            elif current.hour not in self.hours:
+                current = current.replace(minute=0) + timedelta(hours=1)
+            elif current.minute not in self.minutes:
+                current += timedelta(minutes=1)
+            else:
+                return current
+        raise ValueError(f"Cron expression never fires: {self.expr!r}")
+
+
+class Job:
+    """등록된 주기 작업과 실행 통계"""
+
+    def __init__(self, name: str, schedule: CronSchedule, func: Callable,
+                 jitter: float = 0, catch_up: bool = True):
+        self.name = name
+        self.schedule = schedule
+        self.func = func
+        self.jitter = jitter
+        self.catch_up = catch_up
+
+        self.next_run: Optional[datetime] = None  # 예정 시각 (jitter 제외)
+        self.due_at: float = 0  # 실제 실행 시각 (epoch, jitter 포함)
+        self.last_run: Optional[datetime] = None
+        self.running: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def plan(self, after: datetime, rng=random):
+        self.next_run = self.schedule.next_after(after)
+        self.due_at = self.next_run.timestamp() + rng.uniform(0, self.jitter)
+
+
+class JobScheduler:
+    """주기 작업 실행기 - run()을 이벤트 루프에서 태스크로 실행"""
+
+    def __init__(self, state_file: Optional[Path] = None, max_workers: int = 2,
+                 now: Optional[Callable[[], datetime]] = None, rng=None):
+        self.state_file = Path(state_file) if state_file else None
+        # 시각/난수 (테스트는 고정 시계와 seed 고정 Random을 넘김)
+        self.now = now or datetime.now
+        self.rng = rng or random
+        self.jobs: Dict[str, Job] = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._wakeup = None
+
+    def add(self, name: str, cron: str, func: Callable, jitter: float = 0, catch_up: bool = True) -> Job:
+        """작업 등록 (func는 동기 함수 또는 코루틴 함수)"""
+        job = Job(name, CronSchedule(cron), func, jitter=jitter, catch_up=catch_up)
+        self.jobs[name] = job
+        if self._wakeup:
+            self._wakeup.set()
+        return job
+
+    def _load_state(self) -> Dict[str, str]:
+        if self.state_file and self.state_file.exists():
+            return json.loads(self.state_file.read_text())
+        return {}
+
+    def _save_state(self):
+        if self.state_file:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            state = {name: job.last_run.isoformat() for name, job in self.jobs.items() if job.last_run}
+            write_atomic(self.state_file, json.dumps(state, indent=2))
+
+    def _start(self, job: Job, scheduled: datetime):
+        """작업 실행 시작 (이전 실행이 진행 중이면 건너뜀)"""
+        if job.running and not job.running.done():
+            job.skipped += 1
+            print(f"[SCHEDULER] {job.name}: previous run still in progress, skipping {scheduled:%Y-%m-%d %H:%M}")
+            return
+        job.last_run = scheduled
+        self._save_state()
+        job.running = asyncio.create_task(self._run_job(job))
+
+    async def _run_job(self, job: Job):
+        started = time.monotonic()
+        try:
+            if asyncio.iscoroutinefunction(job.func):
+                await job.func()
+            else:
+                await asyncio.get_running_loop().run_in_executor(self.executor, job.func)
+            job.runs += 1
+            job.last_error = None
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            print(f"[SCHEDULER] {job.name} failed: {e}")
+        finally:
+            job.last_duration = time.monotonic() - started
+
+    def _initialize(self):
+        """다음 실행 시각 계산 + 놓친 실행 한 번 보충"""
+        new_jobs = {name: job for name, job in self.jobs.items() if job.next_run is None}
+        if not new_jobs:
+            return
+        now = self.now()
+        state = self._load_state()
+        for name, job in new_jobs.items():
+            if name in state and job.last_run is None:
+                job.last_run = datetime.fromisoformat(state[name])
+            if job.catch_up and job.last_run and job.schedule.next_after(job.last_run) <= now:
+                # 여러 회차를 놓쳤어도 가장 최근 회차로 한 번만 실행
+                missed = job.schedule.next_after(job.last_run)
+                while job.schedule.next_after(missed) <= now:
+                    missed = job.schedule.next_after(missed)
+                print(f"[SCHEDULER] {name}: catching up missed run at {missed:%Y-%m-%d %H:%M}")
+                self._start(job, missed)
+            job.plan(now, self.rng)
+
+    async def run(self):
+        """예정된 시각마다 작업 실행 (취소될 때까지)"""
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                self._initialize()
+                now = self.now().timestamp()
+                for job in self.jobs.values():
+                    if job.due_at <= now:
+                        self._start(job, job.next_run)
+                        # 루프가 늦게 깨어나 여러 회차가 지났어도 한 번만 실행
+                        job.plan(max(job.next_run, self.now()), self.rng)
+
+                # 시계 변경에 대비해 최대 60초마다 다시 계산
+                delay = min([job.due_at for job in self.jobs.values()], default=now + 60) - self.now().timestamp()
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), max(0, min(delay, 60)))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for job in self.jobs.values():
+                if job.running and not job.running.done():
+                    job.running.cancel()
+            self.executor.shutdown(wait=False)
+
+    def status(self) -> Dict[str, Dict]:
+        """작업별 실행 통계"""
+        return {
+            name: {
+                "schedule": job.schedule.expr,
+                "next_run": job.next_run.isoformat() if job.next_run else None,
+                "last_run": job.last_run.isoformat() if job.last_run else None,
+                "running": bool(job.running and not job.running.done()),
+                "runs": job.runs,
+                "failures": job.failures,
+                "skipped": job.skipped,
+                "last_duration_s": job.last_duration,
+                "last_error": job.last_error,
+            }
+            for name, job in self.jobs.items()
+        }
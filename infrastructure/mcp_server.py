@@ -5,11 +5,34 @@ ClaudeTeam MCP Server - 에이전트 간 통신 및 작업 관리
 
 import json
 import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
-import redis.asyncio as redis
+from typing import Dict, Iterable, List, Optional
+from dataclasses import dataclass, asdict, fields
+
+from codec import get_codec, read_record, write_record
+from config import Config, load_config
+from task_store import MAX_TASK_RETRIES, TaskStore
+from task_query import TaskQuery
+from task_queue import TaskScheduler
+from transport import DEFAULT_REDIS_URL, Subscription, Transport, open_transport
+from status_writer import StatusWriter
+from daily_stats import DailyStats
+from message_log import BROADCAST_TOPIC, MessageLog
+from job_scheduler import JobScheduler
+from archive import Archive, archive_files, archive_tasks
+from spec_store import SpecStore
+from heartbeat import STALE_AFTER, read_heartbeats
+from notification_store import PRIORITIES, URGENT_PRIORITIES, NotificationStore
+from metrics import REGISTRY, histogram
+
+MESSAGE_DELIVERY = histogram("claudeteam_message_delivery_seconds", "메시지 전송부터 수신 에이전트가 읽을 때까지",
+                             ["kind"])
 
 @dataclass
 class Task:
@@ -24,6 +47,11 @@ class Task:
     created_at: str
     updated_at: str
     
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Task":
+        """저장소 레코드에서 Task 생성 (claimed_by 등 저장소 전용 필드는 무시)"""
+        return cls(**{f.name: data[f.name] for f in fields(cls)})
+    
 @dataclass
 class Message:
     from_agent: str
@@ -34,8 +62,13 @@ class Message:
     requires_ceo_approval: bool = False
 
 class SharedWorkspaceMCP:
-    def __init__(self):
-        self.workspace_dir = Path("/home/jyjjeon/claudeteam-startup/shared-workspace")
+    def __init__(self, task_store: Optional[TaskStore] = None, workspace_dir: Optional[Path] = None,
+                 io_workers: int = 8, config: Optional[Config] = None,
+                 scheduler: Optional[TaskScheduler] = None, daily_stats: Optional[DailyStats] = None,
+                 status_writer: Optional[StatusWriter] = None):
+        # 작업 공간 위치/저장소 백엔드 (CLAUDETEAM_* 환경 변수, 설정 파일, workspace_dir 인자 순으로 덮어씀)
+        self.config = config or load_config(shared_dir=workspace_dir)
+        self.workspace_dir = self.config.shared_dir
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
         
         # 디렉토리 구조 생성
@@ -46,59 +79,125 @@ class SharedWorkspaceMCP:
         (self.workspace_dir / "specs").mkdir(parents=True, exist_ok=True)
         (self.workspace_dir / "reports").mkdir(parents=True, exist_ok=True)
         
+        # 작업/메시지/상태 레코드 형식 (CLAUDETEAM_CODEC, 기본 compact JSON)
+        self.codec = get_codec()
+        
+        # 작업 저장소 (기본: 기존 파일 레이아웃, 설정의 task_backend로 sqlite/memory 선택 가능)
+        self.task_store = task_store or self.config.open_task_store(codec=self.codec)
+        # 담당자별 우선순위 큐 (저장소의 pending 작업에서 복구)
+        self.scheduler = scheduler or TaskScheduler(self.task_store)
+        self.scheduler.sync()
+        # 에이전트 상태 기록 (변경 없는 쓰기 생략, 1초 창 병합)
+        self.status_writer = status_writer or StatusWriter(self.workspace_dir / "status", codec=self.codec)
+        # 일별 활동 집계 (작업 생성/상태 변경마다 증분 기록)
+        self.daily_stats = daily_stats or DailyStats(self.workspace_dir / "reports" / "activity").attach(self.task_store)
+        self._inbox_cache: Dict[str, Dict] = {}
+        self._inbox_mtime = None
+        # 에이전트별 append-only 메시지 로그 (소비자별 커밋 오프셋)
+        self.message_log = MessageLog(self.workspace_dir / "messages" / "log", codec=self.codec)
+        self._message_batches: Dict[str, tuple] = {}
+        self._message_consumers: set = set()  # 이 프로세스에서 메시지 로그 소비자로 등록한 에이전트
+        # 오래된 완료 작업/보고서/알림 보관소 (hot 디렉토리 크기 제한)
+        self.archive = Archive(self.workspace_dir / "archive")
+        # 제품 스펙 (버전별 델타 이력, 읽기는 프로세스 내 캐시)
+        self.specs = SpecStore(self.workspace_dir / "specs")
+        # CEO 알림 (우선순위별 고정 크기 링, 반복 알림 억제 - 밀려난 알림은 보관소로)
+        self.notifications = NotificationStore(self.workspace_dir / "ceo-office" / "notifications",
+                                               on_evict=self._archive_notifications)
+        # 이미 응답 없음으로 알린 워커 (check_liveness가 새로 끊긴 워커만 알리도록)
+        self._stale_workers: set = set()
+        
+        # 파일 I/O는 스레드 풀에서 실행해 느린 디스크가 이벤트 루프를 막지 않게 함 (0이면 루프에서 바로 실행)
+        self._io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="mcp-io") if io_workers > 0 else None
+        
         # Redis for real-time communication (optional)
-        self.redis_client = None
+        self.transport: Optional[Transport] = None
         
-    async def connect_redis(self):
-        """Redis 연결 (실시간 통신용)"""
-        try:
-            self.redis_client = await redis.from_url("redis://localhost")
-            await self.redis_client.ping()
+    async def connect_redis(self, url: Optional[str] = None):
+        """Redis 연결 (실시간 통신용, 연결이 끊겨도 백오프하며 재연결)"""
+        url = url or os.environ.get("CLAUDETEAM_REDIS_URL", DEFAULT_REDIS_URL)
+        self.transport = await open_transport(url)
+        if self.transport and self.transport.connected:
             print("Redis connected for real-time communication")
-        except:
+        else:
             print("Redis not available, using file-based communication")
     
+    async def _io(self, func, *args, **kwargs):
+        """블로킹 저장소 호출을 I/O 스레드 풀에서 실행"""
+        if self._io_pool is None:
+            return func(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, partial(func, *args, **kwargs))
+    
+    def publish(self, channel: str, message: Dict):
+        """실시간 알림 예약 (같은 tick의 알림은 한 번에 전송)"""
+        if self.transport:
+            self.transport.publish(channel, message)
+    
+    def subscribe(self, channels: List[str], **options) -> Optional[Subscription]:
+        """실시간 알림 구독 (Redis가 없으면 None - 파일 감시/폴링으로 대체)"""
+        return self.transport.subscribe(channels, **options) if self.transport else None
+    
+    def get_subscription_metrics(self) -> List[Dict]:
+        """구독자별 큐 길이/지연/버린 알림 수"""
+        return self.transport.subscription_metrics() if self.transport else []
+    
     # ===== Task Management =====
     
     async def create_task(self, task: Task) -> str:
         """새 작업 생성"""
-        task_file = self.workspace_dir / "tasks" / "pending" / f"{task.id}.json"
-        task_file.write_text(json.dumps(asdict(task), indent=2))
+        await self._io(self.task_store.create, asdict(task))
+        self.scheduler.push(asdict(task))
         
         # Redis pub/sub로 알림
-        if self.redis_client:
-            await self.redis_client.publish(
-                f"agent:{task.assigned_to}",
-                json.dumps({"type": "new_task", "task_id": task.id})
-            )
+        self.publish(f"agent:{task.assigned_to}", {"type": "new_task", "task_id": task.id})
         
         return task.id
     
-    async def get_agent_tasks(self, agent_name: str) -> List[Task]:
-        """특정 에이전트의 작업 목록 조회"""
-        all_tasks = []
-        
-        for status_dir in ["pending", "in_progress", "review"]:
-            task_dir = self.workspace_dir / "tasks" / status_dir
-            for task_file in task_dir.glob("*.json"):
-                task_data = json.loads(task_file.read_text())
-                if task_data["assigned_to"] == agent_name:
-                    all_tasks.append(Task(**task_data))
+    async def create_tasks(self, tasks: Iterable, batch_size: int = 1000) -> List[str]:
+        """작업 여러 개 생성 (Task 또는 dict를 스트리밍으로 받아 batch_size개씩 한 번에 저장)
+
+        알림은 배치마다 담당자별로 한 번씩만 보냄 (개수 포함)
+        """
+        tasks = iter(tasks)
+        created = []
+        while True:
+            batch = [asdict(task) if isinstance(task, Task) else task for task in islice(tasks, batch_size)]
+            if not batch:
+                return created
+            await self._io(self.task_store.create_many, batch)
+            counts: Dict[str, int] = {}
+            for task in batch:
+                self.scheduler.push(task)
+                counts[task["assigned_to"]] = counts.get(task["assigned_to"], 0) + 1
+                created.append(task["id"])
+            for assignee, count in counts.items():
+                self.publish(f"agent:{assignee}", {"type": "new_task", "count": count})
+    
+    async def get_agent_tasks(self, agent_name: str, limit: Optional[int] = None) -> List[Task]:
+        """특정 에이전트의 작업 목록 조회 (limit을 주면 앞에서부터 limit개만)"""
+        # 진행 중인 작업 먼저, 대기 작업은 스케줄러가 꺼낼 순서대로
+        active = sorted(
+            await self._io(self.task_store.find, ["in_progress", "review"], assigned_to=agent_name),
+            key=lambda x: x["priority"], reverse=True
+        )[:limit]
+        await self._io(self.scheduler.sync)
+        pending = self.scheduler.ordered(agent_name, None if limit is None else limit - len(active))
         
-        return sorted(all_tasks, key=lambda x: x.priority, reverse=True)
+        return [Task.from_dict(task_data) for task_data in active + pending]
+    
+    async def query_tasks(self, query: TaskQuery) -> Dict:
+        """조건/정렬/커서로 작업 한 페이지 조회 (TaskStore.query 형식, 다음 페이지는 query.next_page(cursor))"""
+        return await self._io(self.task_store.query, query)
+    
+    async def get_queue_metrics(self) -> Dict:
+        """담당자별 대기열 길이와 대기 시간"""
+        await self._io(self.scheduler.sync)
+        return self.scheduler.metrics()
     
     async def update_task_status(self, task_id: str, new_status: str, agent_name: str):
         """작업 상태 업데이트"""
         # 현재 작업 찾기
-        current_task = None
-        current_path = None
-        
-        for status in ["pending", "in_progress", "review", "completed"]:
-            path = self.workspace_dir / "tasks" / status / f"{task_id}.json"
-            if path.exists():
-                current_task = json.loads(path.read_text())
-                current_path = path
-                break
+        current_task = await self._io(self.task_store.get, task_id)
         
         if not current_task:
             raise ValueError(f"Task {task_id} not found")
@@ -107,167 +206,306 @@ class SharedWorkspaceMCP:
         if current_task["assigned_to"] != agent_name and agent_name != "ceo":
             raise PermissionError(f"{agent_name} cannot update task assigned to {current_task['assigned_to']}")
         
-        # 상태 업데이트
-        current_task["status"] = new_status
-        current_task["updated_at"] = datetime.now().isoformat()
-        
-        # 새 위치로 이동
-        new_path = self.workspace_dir / "tasks" / new_status / f"{task_id}.json"
-        new_path.write_text(json.dumps(current_task, indent=2))
-        current_path.unlink()
+        # 상태 업데이트 (저장소에서 한 번의 원자적 쓰기로 처리)
+        await self._io(self.task_store.transition, task_id, new_status, updated_at=datetime.now().isoformat())
         
-        # CEO에게 알림 (중요 상태 변경시)
-        if new_status in ["completed", "blocked"]:
-            await self.notify_ceo(f"Task {task_id} is now {new_status}")
+        # CEO에게 알림 (중요 상태 변경시 - 완료는 흔하므로 창마다 한 번만, 나머지는 횟수로)
+        if new_status == "completed":
+            await self.notify_ceo(f"Task {task_id} is now completed", key="task_completed")
+        elif new_status == "blocked":
+            await self.notify_ceo(f"Task {task_id} is now blocked")
     
     # ===== Inter-Agent Communication =====
     
     async def send_message(self, message: Message):
-        """에이전트 간 메시지 전송"""
-        msg_file = self.workspace_dir / "messages" / f"{message.to_agent}_{message.timestamp}.json"
-        msg_file.write_text(json.dumps(asdict(message), indent=2))
+        """에이전트 간 메시지 전송 (to_agent가 "all"이면 전체 공지 - 한 번만 기록)"""
+        topic = BROADCAST_TOPIC if message.to_agent == "all" else message.to_agent
+        await self._append_message(topic, asdict(message))
         
         # CEO 승인 필요시 별도 처리
         if message.requires_ceo_approval:
             approval_file = self.workspace_dir / "ceo-office" / "inbox" / f"approval_{message.timestamp}.json"
-            approval_file.parent.mkdir(parents=True, exist_ok=True)
-            approval_file.write_text(json.dumps(asdict(message), indent=2))
+            await self._io(approval_file.parent.mkdir, parents=True, exist_ok=True)
+            await self._io(write_record, approval_file, asdict(message), self.codec)
         
         # Redis로 실시간 알림
-        if self.redis_client:
-            await self.redis_client.publish(
-                f"agent:{message.to_agent}",
-                json.dumps({"type": "new_message", "from": message.from_agent})
-            )
-    
-    async def get_messages(self, agent_name: str) -> List[Message]:
-        """에이전트의 메시지 조회"""
+        self.publish(f"agent:{message.to_agent}", {"type": "new_message", "from": message.from_agent})
+    
+    async def _append_message(self, topic: str, record: Dict):
+        """메시지 로그에 추가 - 같은 tick에 들어온 같은 토픽 메시지는 append_batch 한 번으로 기록"""
+        if self._io_pool is None:
+            self.message_log.append(topic, record)
+            return
+        pending = self._message_batches.get(topic)
+        if pending is None:
+            records = []
+            pending = self._message_batches[topic] = (records, asyncio.ensure_future(
+                self._write_message_batch(topic, records)))
+        pending[0].append(record)
+        await asyncio.shield(pending[1])
+    
+    async def _write_message_batch(self, topic: str, records: List[Dict]):
+        # 같은 tick의 다른 send_message 호출이 records에 추가할 때까지 한 번 양보
+        await asyncio.sleep(0)
+        del self._message_batches[topic]
+        await self._io(self.message_log.append_batch, topic, records)
+    
+    def _drain_legacy_messages(self, agent_name: str) -> List[Message]:
+        """이전 방식(messages/<agent>_*.json)으로 남은 메시지를 읽고 삭제"""
         messages = []
-        msg_dir = self.workspace_dir / "messages"
-        
-        for msg_file in msg_dir.glob(f"{agent_name}_*.json"):
-            msg_data = json.loads(msg_file.read_text())
-            messages.append(Message(**msg_data))
-            # 읽은 메시지는 삭제 (또는 archived로 이동)
+        for msg_file in (self.workspace_dir / "messages").glob(f"{agent_name}_*.json"):
+            messages.append(Message(**read_record(msg_file)))
             msg_file.unlink()
+        return messages
+    
+    async def read_messages(self, agent_name: str, max_messages: int = 100):
+        """에이전트 메시지 읽기 (커밋 전) → (메시지 목록, ack_messages에 넘길 cursor)
+        
+        처리를 마친 뒤 ack_messages를 호출해야 하며, 그 전에 죽으면 다음에 다시 전달된다.
+        """
+        messages, cursor = [], {}
+        now = datetime.now()
+        if agent_name not in self._message_consumers:
+            # 처음 읽는 에이전트는 소비자로 등록 (커밋하기 전에 compact가 메시지를 지우지 않도록)
+            for topic in [agent_name, BROADCAST_TOPIC]:
+                await self._io(self.message_log.subscribe, topic, agent_name)
+            self._message_consumers.add(agent_name)
+        for topic in [agent_name, BROADCAST_TOPIC]:
+            records, cursor[topic] = await self._io(self.message_log.poll, topic, agent_name, max_messages)
+            kind = "broadcast" if topic == BROADCAST_TOPIC else "direct"
+            for record in records:
+                messages.append(Message(**record))
+                try:
+                    MESSAGE_DELIVERY.observe((now - datetime.fromisoformat(record["timestamp"])).total_seconds(), kind)
+                except ValueError:
+                    pass
+        return sorted(messages, key=lambda x: x.timestamp), cursor
+    
+    async def ack_messages(self, agent_name: str, cursor: Dict[str, int]):
+        """read_messages로 받은 메시지 처리 완료 기록"""
+        for topic, offset in cursor.items():
+            await self._io(self.message_log.commit, topic, agent_name, offset)
+    
+    async def get_messages(self, agent_name: str, max_messages: int = 100) -> List[Message]:
+        """에이전트의 메시지 조회 (읽은 메시지는 바로 커밋)"""
+        messages, cursor = await self.read_messages(agent_name, max_messages)
+        await self.ack_messages(agent_name, cursor)
+        legacy = await self._io(self._drain_legacy_messages, agent_name)
+        return sorted(legacy + messages, key=lambda x: x.timestamp)
+    
+    def compact_message_log(self) -> int:
+        """모든 수신자가 읽은 메시지 세그먼트 삭제
+
+        개인 토픽은 토픽 이름의 에이전트, 브로드캐스트는 개인 토픽이 있는 모든 에이전트가
+        커밋할 때까지 남김 (등록 전에 지워서 한 번도 못 받는 메시지가 없도록)
+        """
+        topics = self.message_log.topics()
+        recipients = [topic for topic in topics if topic != BROADCAST_TOPIC]
+        return sum(self.message_log.compact(topic, recipients if topic == BROADCAST_TOPIC else [topic])
+                   for topic in topics)
+    
+    # ===== Liveness =====
+    
+    def check_liveness(self, stale_after: float = STALE_AFTER, max_retries: int = MAX_TASK_RETRIES,
+                       forget_after: float = 86400) -> Dict[str, List[Dict]]:
+        """응답 없는 워커 감지 + lease가 끊긴 작업 회수 (max_retries번 넘게 실패한 작업은 dead_letter)
         
-        return sorted(messages, key=lambda x: x.timestamp)
+        {"stale": 새로 응답 없어진 워커 정보, "requeued": 다시 대기열에 넣은 작업, "dead_letter": 포기한 작업}
+        """
+        heartbeat_dir = self.workspace_dir / "heartbeats"
+        stale = {worker_id: info for worker_id, info in read_heartbeats(heartbeat_dir, stale_after).items()
+                 if info["stale"]}
+        for worker_id, info in stale.items():
+            # 신호가 끊긴 워커는 lease 만료를 기다리지 않고 바로 회수
+            self.task_store.release_lease(worker_id)
+            if info["age"] > forget_after:
+                (heartbeat_dir / f"{worker_id}.json").unlink(missing_ok=True)
+        newly_stale = [stale[worker_id] for worker_id in sorted(set(stale) - self._stale_workers)]
+        self._stale_workers = set(stale)
+        reaped = self.task_store.reap_expired_leases(max_retries)
+        return {
+            "stale": newly_stale,
+            "requeued": [task for task in reaped if task["status"] == "pending"],
+            "dead_letter": [task for task in reaped if task["status"] == "dead_letter"],
+        }
+    
+    # ===== Archive =====
+    
+    def archive_old_records(self, keep_tasks: int = 500, keep_reports: int = 30,
+                            keep_notifications: int = 200) -> Dict[str, int]:
+        """완료 작업/일일 보고서/CEO 알림을 최근 것만 남기고 날짜별 묶음으로 보관"""
+        return {
+            "tasks": archive_tasks(self.archive, self.task_store, keep_tasks),
+            "reports": archive_files(self.archive, "reports", self.workspace_dir / "reports",
+                                     "daily_*.json", keep_reports),
+            # 알림 하나당 파일 하나였던 이전 형식 (지금 알림은 NotificationStore가 링에서 밀려날 때 보관)
+            "notifications": archive_files(self.archive, "notifications",
+                                           self.workspace_dir / "ceo-office" / "notifications",
+                                           "[0-9]*.json", keep_notifications),
+        }
+    
+    async def get_archived(self, kind: str, record_id: str) -> Optional[Dict]:
+        """보관된 작업/보고서/알림 조회 (kind: tasks | reports | notifications)"""
+        return await self._io(self.archive.get, kind, record_id)
+    
+    async def list_archived(self, kind: str, start: Optional[str] = None, end: Optional[str] = None,
+                            limit: int = 100) -> List[Dict]:
+        """기간(YYYY-MM-DD) 안의 보관 레코드 목록"""
+        def collect():
+            return [record for _, record in islice(self.archive.records(kind, start, end), limit)]
+        return await self._io(collect)
     
     # ===== Product Specs Management =====
     
-    async def save_product_spec(self, product_name: str, spec: Dict):
-        """제품 스펙 저장"""
-        spec_file = self.workspace_dir / "specs" / f"{product_name}.json"
-        spec["updated_at"] = datetime.now().isoformat()
-        spec_file.write_text(json.dumps(spec, indent=2))
+    async def save_product_spec(self, product_name: str, spec: Dict) -> Dict:
+        """제품 스펙 저장 (바뀐 키만 새 버전의 델타로 기록, 저장된 스펙 반환)"""
+        saved = await self._io(self.specs.save, product_name, spec)
         
-        # 모든 에이전트에게 스펙 업데이트 알림
-        if self.redis_client:
-            await self.redis_client.publish(
-                "broadcast",
-                json.dumps({"type": "spec_update", "product": product_name})
-            )
-    
-    async def get_product_spec(self, product_name: str) -> Dict:
-        """제품 스펙 조회"""
-        spec_file = self.workspace_dir / "specs" / f"{product_name}.json"
-        if spec_file.exists():
-            return json.loads(spec_file.read_text())
-        return None
+        # 모든 에이전트에게 스펙 업데이트 알림 (버전을 보고 변경분만 가져가도록)
+        self.publish("broadcast", {"type": "spec_update", "product": product_name, "version": saved["version"]})
+        return saved
+    
+    async def get_product_spec(self, product_name: str, since_version: Optional[int] = None) -> Optional[Dict]:
+        """제품 스펙 조회 (since_version을 주면 그 이후 변경분만 - SpecStore.changes_since 형식)"""
+        if since_version is None:
+            return await self._io(self.specs.get, product_name)
+        return await self._io(self.specs.changes_since, product_name, since_version)
     
     # ===== Status & Reporting =====
     
     async def update_agent_status(self, agent_name: str, status: Dict):
         """에이전트 상태 업데이트"""
-        status_file = self.workspace_dir / "status" / f"{agent_name}.json"
-        status_file.parent.mkdir(exist_ok=True)
         status["timestamp"] = datetime.now().isoformat()
-        status_file.write_text(json.dumps(status, indent=2))
+        await self._io(self.status_writer.update, agent_name, status)
     
     async def get_team_status(self) -> Dict:
         """전체 팀 상태 조회"""
-        team_status = {}
-        status_dir = self.workspace_dir / "status"
-        
-        if status_dir.exists():
-            for status_file in status_dir.glob("*.json"):
-                agent_name = status_file.stem
-                team_status[agent_name] = json.loads(status_file.read_text())
-        
-        return team_status
+        return await self._io(self.status_writer.read_all)
+    
+    def _pending_approvals(self) -> List[Dict]:
+        """CEO 승인 대기 목록 (inbox가 바뀌었을 때 새 파일만 읽음)"""
+        inbox_dir = self.workspace_dir / "ceo-office" / "inbox"
+        try:
+            mtime = inbox_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if mtime != self._inbox_mtime:
+            names = {path.name for path in inbox_dir.glob("*.json")}
+            for name in set(self._inbox_cache) - names:
+                del self._inbox_cache[name]
+            for name in sorted(names - set(self._inbox_cache)):
+                self._inbox_cache[name] = read_record(inbox_dir / name)
+            self._inbox_mtime = mtime
+        return [self._inbox_cache[name] for name in sorted(self._inbox_cache)]
     
-    async def generate_daily_report(self) -> Dict:
-        """일일 보고서 생성"""
+    async def generate_report(self, start, end=None) -> Dict:
+        """기간 활동 보고서 (start ~ end 날짜, 양 끝 포함)"""
+        return await self._io(self.daily_stats.range, start, end)
+    
+    async def generate_daily_report(self, day=None) -> Dict:
+        """일일 보고서 생성 (해당 날짜의 활동 버킷 + 현재 진행/대기 작업)"""
+        return await self._io(self._build_daily_report, day)
+    
+    def _build_daily_report(self, day=None) -> Dict:
+        activity = self.daily_stats.range(day, day)
+        self.scheduler.sync()
+        # 저장소 백엔드와 상관없이 ID 순 (대기 작업 전체를 복사하지 않고 조건에 맞는 것만)
         report = {
-            "date": datetime.now().date().isoformat(),
+            "date": activity["start"],
             "tasks": {
-                "completed_today": [],
-                "in_progress": [],
-                "blocked": [],
-                "pending_high_priority": []
+                "completed_today": activity["completed"],
+                "in_progress": list(self.task_store.iter_query(
+                    TaskQuery(statuses=["in_progress"], sort="id", limit=1000))),
+                "blocked": activity["blocked"],
+                "dead_letter": list(self.task_store.iter_query(
+                    TaskQuery(statuses=["dead_letter"], sort="id", limit=1000))),
+                "pending_high_priority": list(self.task_store.iter_query(
+                    TaskQuery(statuses=["pending"], min_priority=4, sort="id", limit=1000)))
             },
-            "team_status": await self.get_team_status(),
-            "ceo_decisions_needed": []
+            "activity": {"totals": activity["totals"], "by_agent": activity["by_agent"]},
+            "team_status": self.status_writer.read_all(),
+            "queues": self.scheduler.metrics(),
+            "ceo_decisions_needed": self._pending_approvals()
         }
         
-        # 작업 상태 집계
-        for status in ["completed", "in_progress", "pending"]:
-            task_dir = self.workspace_dir / "tasks" / status
-            for task_file in task_dir.glob("*.json"):
-                task = json.loads(task_file.read_text())
-                if status == "completed" and task["updated_at"].startswith(datetime.now().date().isoformat()):
-                    report["tasks"]["completed_today"].append(task)
-                elif status == "in_progress":
-                    report["tasks"]["in_progress"].append(task)
-                elif status == "pending" and task["priority"] >= 4:
-                    report["tasks"]["pending_high_priority"].append(task)
-        
-        # CEO 결정 대기 사항
-        inbox_dir = self.workspace_dir / "ceo-office" / "inbox"
-        if inbox_dir.exists():
-            for approval_file in inbox_dir.glob("*.json"):
-                report["ceo_decisions_needed"].append(json.loads(approval_file.read_text()))
-        
         # 보고서 저장
-        report_file = self.workspace_dir / "reports" / f"daily_{datetime.now().date()}.json"
+        report_file = self.workspace_dir / "reports" / f"daily_{report['date']}.json"
         report_file.write_text(json.dumps(report, indent=2))
         
         return report
     
     # ===== CEO Interface =====
     
-    async def notify_ceo(self, message: str, priority: str = "info"):
-        """CEO에게 알림"""
-        notification = {
-            "timestamp": datetime.now().isoformat(),
-            "priority": priority,  # "critical", "high", "normal", "info"
-            "message": message
-        }
-        
-        notif_file = self.workspace_dir / "ceo-office" / "notifications" / f"{datetime.now().timestamp()}.json"
-        notif_file.parent.mkdir(parents=True, exist_ok=True)
-        notif_file.write_text(json.dumps(notification, indent=2))
+    async def notify_ceo(self, message: str, priority: str = "info", key: Optional[str] = None) -> Optional[Dict]:
+        """CEO에게 알림 ("critical", "high", "normal", "info")
         
-        if self.redis_client and priority in ["critical", "high"]:
-            await self.redis_client.publish("ceo:urgent", json.dumps(notification))
+        같은 key(기본값: 메시지)가 중복 억제 창 안에 이미 있으면 기록/전송하지 않고 None
+        """
+        notification = await self._io(self.notifications.add, message, priority, key)
+        if notification and priority in URGENT_PRIORITIES:
+            self.publish("ceo:urgent", notification)
+        return notification
+    
+    async def get_notifications(self, urgent_only: bool = True, limit: int = 50) -> Dict:
+        """읽지 않은 알림 - {"unread": 우선순위별 수, "notifications": [...]} (긴급만이면 critical/high)"""
+        def collect():
+            priorities = URGENT_PRIORITIES if urgent_only else PRIORITIES
+            return {"unread": self.notifications.unread_count(priorities),
+                    "notifications": self.notifications.unread(priorities, limit)}
+        return await self._io(collect)
+    
+    def _archive_notifications(self, notifications: List[Dict]):
+        """링에서 밀려난 알림을 날짜별 묶음으로 보관 (ID: <우선순위>-<seq>)"""
+        self.archive.add("notifications", [
+            (f"{item['priority']}-{item['seq']}", item["timestamp"][:10], item) for item in notifications
+        ])
 
 # MCP Server Runner
-async def run_mcp_server():
+async def run_mcp_server(config: Optional[Config] = None):
     """MCP 서버 실행"""
-    server = SharedWorkspaceMCP()
+    server = SharedWorkspaceMCP(config=config)
     await server.connect_redis()
     
     print("🚀 ClaudeTeam MCP Server Started")
-    print("📁 Workspace: /home/jyjjeon/claudeteam-startup/shared-workspace")
+    print(f"📁 Workspace: {server.workspace_dir} (tasks: {server.config.task_backend})")
     print("⏰ Monitoring agent activities...")
     
-    # 주기적으로 일일 보고서 생성 (실제로는 스케줄러 사용)
-    while True:
-        await asyncio.sleep(3600)  # 1시간마다
-        # 오후 6시에 일일 보고서 생성
-        if datetime.now().hour == 18:
-            report = await server.generate_daily_report()
-            await server.notify_ceo("Daily report generated", "normal")
+    scheduler = JobScheduler(state_file=server.workspace_dir / "reports" / "scheduler_state.json")
+    # 지표는 metrics/*.prom 으로 주기 기록 (ceo-dashboard.py serve 의 /metrics 에서 합쳐 보여줌)
+    REGISTRY.start_dumping(server.workspace_dir / "metrics" / f"mcp_server-{os.getpid()}.prom")
+    
+    async def daily_report():
+        # 보고서 집계는 generate_daily_report가 I/O 스레드에서 처리
+        await server.generate_daily_report()
+        await server.notify_ceo("Daily report generated", "normal")
+    
+    async def watchdog():
+        # 응답 없는 에이전트 알림, 그 작업은 재시도 횟수를 올려 대기열로 (반복해서 실패하면 dead_letter)
+        result = await server._io(server.check_liveness)
+        for info in result["stale"]:
+            print(f"[WATCHDOG] Agent not responding: {info['worker_id']} (last heartbeat {info['age']:.0f}s ago)")
+            await server.notify_ceo(f"{info['agent']} not responding (worker {info['worker_id']}, "
+                                    f"last heartbeat {info['last_beat']})", "high")
+        for task in result["requeued"]:
+            print(f"[WATCHDOG] Re-queued stale task: {task['id']} (retry {task['retries']})")
+        for task in result["dead_letter"]:
+            print(f"[WATCHDOG] Dead-lettered task: {task['id']} after {task['retries']} failed attempts")
+            await server.notify_ceo(f"Task moved to dead letter after {task['retries']} failed attempts: "
+                                    f"{task['title']} ({task['id']})", "high")
+    
+    def archive():
+        archived = server.archive_old_records()
+        if any(archived.values()):
+            print(f"[SCHEDULER] Archived: {archived}")
+    
+    # 매일 오후 6시 일일 보고서, 매분 응답 없는 워커 확인/작업 회수, 10분마다 읽은 메시지 세그먼트 정리,
+    # 매시 30분 오래된 완료 작업/보고서/알림 보관
+    scheduler.add("daily_report", "0 18 * * *", daily_report, jitter=60)
+    scheduler.add("watchdog", "* * * * *", watchdog, jitter=5, catch_up=False)
+    scheduler.add("compact_messages", "*/10 * * * *", server.compact_message_log, catch_up=False)
+    scheduler.add("archive", "30 * * * *", archive, catch_up=False)
+    
+    await scheduler.run()
 
 if __name__ == "__main__":
-    asyncio.run(run_mcp_server())
\ No newline at end of file
+    asyncio.run(run_mcp_server(load_config(sys.argv[1:])))
\ No newline at end of file
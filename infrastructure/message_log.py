@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Message Log - 토픽별 세그먼트 append-only 메시지 로그 + 소비자별 커밋 오프셋
+
+messages/log/<topic>/
+    <base_offset>.seg          레코드 = [길이(4) | crc32(4) | 코덱 인코딩 본문]
+    consumers/<consumer>.offset  소비자가 마지막으로 커밋한 오프셋
+
+- 오프셋은 토픽 전체에서의 바이트 위치 (세그먼트 파일 이름 = 시작 오프셋)
+- 소비자는 read() 후 처리가 끝나면 commit() → 커밋 전에 죽으면 다시 전달 (at-least-once)
+- 소비자는 subscribe()로 오프셋 0을 먼저 기록해 등록 (아직 커밋하지 않았어도 compact가 기다림)
+- 등록된 소비자와 compact(consumers=)로 알려 준 수신자가 모두 지나간 세그먼트만 삭제
+  (커밋 기록이 없는 수신자는 0으로 보므로 아무것도 지우지 않음, 남은 오프셋은 그대로 유효)
+- 여러 프로세스가 같은 토픽에 써도 되도록 append/회전은 토픽 잠금 파일(flock) 안에서 처리
+"""
+
+import fcntl
+import os
+import struct
+import threading
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from codec import Codec, decode, get_codec
+from task_store import write_atomic
+
+BROADCAST_TOPIC = "_broadcast"
+_HEADER = struct.Struct("<II")
+_SEGMENT_SUFFIX = ".seg"
+
+
+class MessageLog:
+    """토픽별 append-only 로그"""
+
+    def __init__(self, log_dir: Path, segment_bytes: int = 1024 * 1024, codec: Optional[Codec] = None):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.codec = codec or get_codec()
+        self._lock = threading.Lock()
+        self._lock_files: Dict[str, Any] = {}
+        self._active: Dict[str, int] = {}  # 토픽별 마지막으로 쓴 세그먼트
+
+    def _topic_dir(self, topic: str) -> Path:
+        return self.log_dir / topic
+
+    def _segments(self, topic: str) -> List[int]:
+        """세그먼트 시작 오프셋 목록 (오름차순)"""
+        try:
+            names = os.listdir(self._topic_dir(topic))
+        except FileNotFoundError:
+            return []
+        return sorted(int(name[:-len(_SEGMENT_SUFFIX)]) for name in names if name.endswith(_SEGMENT_SUFFIX))
+
+    def _segment_path(self, topic: str, base: int) -> Path:
+        return self._topic_dir(topic) / f"{base:020d}{_SEGMENT_SUFFIX}"
+
+    def _offset_path(self, topic: str, consumer: str) -> Path:
+        return self._topic_dir(topic) / "consumers" / f"{consumer}.offset"
+
+    @contextmanager
+    def _topic_lock(self, topic: str):
+        with self._lock:
+            lock_file = self._lock_files.get(topic)
+            if lock_file is None:
+                topic_dir = self._topic_dir(topic)
+                topic_dir.mkdir(parents=True, exist_ok=True)
+                lock_file = self._lock_files[topic] = open(topic_dir / ".lock", "w")
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _active_segment(self, topic: str) -> Tuple[int, int]:
+        """쓰기 중인 세그먼트 (시작 오프셋, 크기) - 토픽 잠금 안에서 호출
+
+        세그먼트는 segment_bytes를 넘은 뒤에만 회전하므로, 마지막으로 쓴 세그먼트가
+        아직 그보다 작으면 다른 프로세스도 그 뒤에 새 세그먼트를 만들지 않았다.
+        """
+        base = self._active.get(topic)
+        if base is not None:
+            try:
+                size = self._segment_path(topic, base).stat().st_size
+                if size < self.segment_bytes:
+                    return base, size
+            except FileNotFoundError:
+                pass
+        segments = self._segments(topic)
+        base = segments[-1] if segments else 0
+        path = self._segment_path(topic, base)
+        return base, path.stat().st_size if path.exists() else 0
+
+    def append(self, topic: str, record: Any) -> int:
+        """레코드 추가 (한 번의 write), 레코드의 오프셋 반환"""
+        return self.append_batch(topic, [record])[0]
+
+    def append_batch(self, topic: str, records: List[Any]) -> List[int]:
+        """여러 레코드를 한 번의 write로 추가"""
+        frames = []
+        for record in records:
+            body = self.codec.encode(record)
+            frames.append(_HEADER.pack(len(body), zlib.crc32(body)) + body)
+
+        with self._topic_lock(topic):
+            base, size = self._active_segment(topic)
+            if size >= self.segment_bytes:
+                base, size = base + size, 0
+            path = self._segment_path(topic, base)
+            self._active[topic] = base
+
+            offsets, position = [], base + size
+            for frame in frames:
+                offsets.append(position)
+                position += len(frame)
+
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, b"".join(frames))
+            finally:
+                os.close(fd)
+        return offsets
+
+    def read(self, topic: str, offset: int, max_records: int = 100) -> Tuple[List[Tuple[int, Any]], int]:
+        """offset부터 최대 max_records개 읽기 → ([(오프셋, 레코드)], 다음 오프셋)"""
+        records = []
+        segments = self._segments(topic)
+        if segments and offset < segments[0]:
+            # 이미 compact된 구간 - 남아 있는 첫 세그먼트부터
+            offset = segments[0]
+
+        for i, base in enumerate(segments):
+            end = segments[i + 1] if i + 1 < len(segments) else None
+            if end is not None and offset >= end:
+                continue
+            try:
+                with open(self._segment_path(topic, base), "rb") as f:
+                    f.seek(offset - base)
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+
+            position = 0
+            while len(records) < max_records and position + _HEADER.size <= len(data):
+                length, crc = _HEADER.unpack_from(data, position)
+                body = data[position + _HEADER.size:position + _HEADER.size + length]
+                if len(body) < length or zlib.crc32(body) != crc:
+                    if end is None:
+                        # 아직 쓰는 중인 레코드 - 다음 읽기에서 다시 시도
+                        return records, offset + position
+                    # 회전된 세그먼트의 깨진 꼬리 (쓰다가 죽은 프로세스) - 건너뜀
+                    position = end - offset
+                    break
+                records.append((offset + position, decode(body)))
+                position += _HEADER.size + length
+            offset += position
+            if len(records) >= max_records or end is None:
+                break
+            offset = end
+        return records, offset
+
+    def committed(self, topic: str, consumer: str) -> int:
+        """소비자가 커밋한 오프셋 (없으면 0)"""
+        try:
+            return int(self._offset_path(topic, consumer).read_text())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def subscribe(self, topic: str, consumer: str):
+        """소비자 등록 - 커밋 기록이 없으면 오프셋 0 기록 (처음부터 읽고, 그 전까지 compact 대상에서 제외)"""
+        path = self._offset_path(topic, consumer)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        try:
+            os.write(fd, b"0")
+        finally:
+            os.close(fd)
+
+    def commit(self, topic: str, consumer: str, offset: int):
+        """처리를 마친 위치 기록"""
+        path = self._offset_path(topic, consumer)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, str(offset))
+
+    def poll(self, topic: str, consumer: str, max_records: int = 100) -> Tuple[List[Any], int]:
+        """커밋된 위치부터 읽기 → (레코드 목록, 처리 후 commit할 오프셋)"""
+        records, next_offset = self.read(topic, self.committed(topic, consumer), max_records)
+        return [record for _, record in records], next_offset
+
+    def compact(self, topic: str, consumers: Iterable[str] = ()) -> int:
+        """등록된 소비자와 consumers(반드시 받아야 할 수신자)가 모두 지나간 세그먼트 삭제 (삭제한 세그먼트 수 반환)"""
+        consumers_dir = self._topic_dir(topic) / "consumers"
+        names = set(consumers)
+        if consumers_dir.exists():
+            names.update(path.stem for path in consumers_dir.glob("*.offset"))
+        if not names:
+            return 0
+        low = min(self.committed(topic, name) for name in names)
+
+        removed = 0
+        with self._topic_lock(topic):
+            segments = self._segments(topic)
+            # 마지막(쓰기 중인) 세그먼트는 남겨 둠
+            for base, next_base in zip(segments, segments[1:]):
+                if next_base > low:
+                    break
+                self._segment_path(topic, base).unlink()
+                removed += 1
+        return removed
+
+    def close(self):
+        with self._lock:
+            for lock_file in self._lock_files.values():
+                lock_file.close()
+            self._lock_files.clear()
+
+    def topics(self) -> List[str]:
+        return sorted(p.name for p in self.log_dir.iterdir() if p.is_dir())
+
+    def stats(self, topic: str) -> Dict:
+        """토픽 크기와 소비자별 지연(바이트)"""
+        segments = self._segments(topic)
+        end = segments[-1] + self._segment_path(topic, segments[-1]).stat().st_size if segments else 0
+        consumers_dir = self._topic_dir(topic) / "consumers"
+        lag = {path.stem: end - self.committed(topic, path.stem) for path in consumers_dir.glob("*.offset")} \
+            if consumers_dir.exists() else {}
+        return {"segments": len(segments), "start": segments[0] if segments else 0, "end": end, "lag": lag}
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Metrics - 카운터/히스토그램 + Prometheus 텍스트 출력 + 선택적 구간(span) 추적
+
+- 프로세스마다 REGISTRY 하나에 값을 쌓고, start_dumping()이 주기적으로
+  metrics/<instance>.prom 에 기록 (node_exporter textfile collector와 같은 형식)
+- ceo-dashboard.py serve 의 GET /metrics 가 최근 .prom 파일을 모두 합쳐 내보냄
+- 관측 한 번 = 잠금 + bisect 정도라 운영 중에도 켜 둠 (CLAUDETEAM_METRICS=off 면 아무 것도 안 함)
+- CLAUDETEAM_TRACE=<파일> 이면 time()으로 잰 구간과 record_span()을 JSON 한 줄씩 추가 기록
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from task_store import write_atomic
+
+# 작업 대기/처리 시간 (초 ~ 분)
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 1800, 7200)
+# 파일 I/O, 알림 전송 같은 짧은 구간 (100µs ~ 1s)
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Tracer:
+    """구간 기록기 - 파일이 지정된 경우에만 JSON 한 줄씩 O_APPEND로 기록"""
+
+    def __init__(self, path: Optional[str] = None):
+        path = path or os.environ.get("CLAUDETEAM_TRACE")
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644) if path else None
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return self._fd is not None
+
+    def _stack(self) -> List[int]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def record_span(self, name: str, start: float, duration: float, span_id: Optional[int] = None,
+                    parent: Optional[int] = None, **attrs):
+        """구간 하나 기록 (start는 time.time() 기준)"""
+        if self._fd is None:
+            return
+        line = {"name": name, "span": span_id or next(self._ids), "parent": parent,
+                "pid": os.getpid(), "thread": threading.get_ident(),
+                "start": round(start, 6), "duration_ms": round(duration * 1000, 3)}
+        line.update(attrs)
+        os.write(self._fd, (json.dumps(line, ensure_ascii=False, default=str) + "\n").encode())
+
+
+class _Timer:
+    """with histogram.time(...): 구간 시간 관측 (추적이 켜져 있으면 span도 기록)"""
+
+    __slots__ = ("child", "attrs", "started", "span_id", "parent")
+
+    def __init__(self, child: "_HistogramChild", attrs: Dict):
+        self.child = child
+        self.attrs = attrs
+        self.span_id = None
+
+    def __enter__(self):
+        tracer = self.child.registry.tracer
+        if tracer._fd is not None:
+            stack = tracer._stack()
+            self.parent = stack[-1] if stack else None
+            self.span_id = next(tracer._ids)
+            stack.append(self.span_id)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        self.child.observe(elapsed)
+        if self.span_id is not None:
+            child, tracer = self.child, self.child.registry.tracer
+            tracer._stack().pop()
+            attrs = dict(zip(child.histogram.label_names, child.label_values), **self.attrs)
+            tracer.record_span(child.histogram.name, time.time() - elapsed, elapsed,
+                               span_id=self.span_id, parent=self.parent, **attrs)
+        return False
+
+
+class _HistogramChild:
+    """레이블 값이 고정된 히스토그램 시계열 (hot path에서는 labels()로 미리 받아 두고 사용)"""
+
+    __slots__ = ("histogram", "registry", "label_values", "buckets", "counts", "total", "_lock")
+
+    def __init__(self, histogram: "Histogram", label_values: Tuple):
+        self.histogram = histogram
+        self.registry = histogram.registry
+        self.label_values = label_values
+        self.buckets = histogram.buckets
+        self.counts = [0] * (len(self.buckets) + 1)  # 버킷별 개수 (+Inf 포함, 누적 아님)
+        self.total = 0.0
+        self._lock = histogram._lock
+
+    def observe(self, value: float):
+        if not self.registry.enabled:
+            return
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += value
+
+    def time(self, **attrs) -> _Timer:
+        """with 블록 실행 시간 관측 (attrs는 추적 span에만 기록)"""
+        return _Timer(self, attrs)
+
+
+class Metric:
+    type = ""
+
+    def __init__(self, registry: "Registry", name: str, help: str, labels: Iterable[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def samples(self) -> List[Tuple[str, Tuple, Tuple, float]]:
+        """(이름, 레이블 이름, 레이블 값, 값) 목록"""
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, *label_values, amount: float = 1):
+        if not self.registry.enabled:
+            return
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values) -> float:
+        return self._values.get(label_values, 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, self.label_names, values, value) for values, value in sorted(self._values.items())]
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, registry: "Registry", name: str, help: str, labels: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(registry, name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def labels(self, *label_values) -> _HistogramChild:
+        child = self._values.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self._values.setdefault(label_values, _HistogramChild(self, label_values))
+        return child
+
+    def observe(self, value: float, *label_values):
+        self.labels(*label_values).observe(value)
+
+    def time(self, *label_values, **attrs) -> _Timer:
+        """with 블록 실행 시간 관측 (attrs는 추적 span에만 기록)"""
+        return _Timer(self.labels(*label_values), attrs)
+
+    def count(self, *label_values) -> int:
+        child = self._values.get(label_values)
+        return sum(child.counts) if child else 0
+
+    def samples(self):
+        names = self.label_names + ("le",)
+        result = []
+        with self._lock:
+            for values, child in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _format_value(bound)
+                    result.append((f"{self.name}_bucket", names, values + (le,), cumulative))
+                result.append((f"{self.name}_sum", self.label_names, values, child.total))
+                result.append((f"{self.name}_count", self.label_names, values, cumulative))
+        return result
+
+
+class Registry:
+    """프로세스의 지표 모음"""
+
+    def __init__(self, enabled: Optional[bool] = None, tracer: Optional[Tracer] = None):
+        if enabled is None:
+            enabled = os.environ.get("CLAUDETEAM_METRICS", "on") != "off"
+        self.enabled = enabled
+        self.tracer = tracer or Tracer()
+        self._metrics: Dict[str, Metric] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help: str, labels: Iterable[str], **options) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, help, labels, **options)
+            return metric
+
+    def counter(self, name: str, help: str, labels: Iterable[str] = ()) -> Counter:
+        return self._get(Counter, name, help, labels)
+
+    def histogram(self, name: str, help: str, labels: Iterable[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, labels, buckets=buckets)
+
+    def render(self, instance: Optional[str] = None) -> str:
+        """Prometheus 텍스트 형식 (instance가 있으면 모든 시계열에 instance 레이블 추가)"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            samples = metric.samples()
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, label_names, label_values, value in samples:
+                if instance:
+                    label_names, label_values = ("instance",) + label_names, (instance,) + label_values
+                lines.append(f"{name}{_format_labels(label_names, label_values)} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def dump(self, path: Path, instance: Optional[str] = None):
+        """metrics 파일 기록 (원자적 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, self.render(instance or path.stem))
+
+    def start_dumping(self, path: Path, interval: float = 15.0, instance: Optional[str] = None) -> threading.Event:
+        """interval초마다 dump (반환된 Event를 set하면 마지막으로 한 번 기록하고 종료)"""
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                self.dump(path, instance)
+            self.dump(path, instance)
+
+        threading.Thread(target=loop, name="metrics-dump", daemon=True).start()
+        return stop
+
+
+def merge_prometheus(texts: Iterable[str]) -> str:
+    """여러 .prom 텍스트를 지표별로 묶어 하나로 합침 (HELP/TYPE은 한 번만)"""
+    families: Dict[str, Dict] = OrderedDict()
+    for text in texts:
+        family = None
+        for line in text.splitlines():
+            if line.startswith("# HELP ") or line.startswith("# TYPE "):
+                name = line.split(" ", 3)[2]
+                family = families.setdefault(name, {"HELP": None, "TYPE": None, "samples": []})
+                family[line[2:6]] = family[line[2:6]] or line
+            elif line and not line.startswith("#") and family is not None:
+                family["samples"].append(line)
+    lines = []
+    for family in families.values():
+        lines += [line for line in (family["HELP"], family["TYPE"]) if line] + family["samples"]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def read_metrics_dir(metrics_dir: Path, max_age: float = 600) -> str:
+    """metrics/*.prom 중 max_age초 안에 갱신된 파일을 합친 Prometheus 텍스트 (죽은 프로세스 파일 제외)"""
+    texts, now = [], time.time()
+    for path in sorted(Path(metrics_dir).glob("*.prom")):
+        try:
+            if now - path.stat().st_mtime <= max_age:
+                texts.append(path.read_text())
+        except FileNotFoundError:
+            continue
+    return merge_prometheus(texts)
+
+
+REGISTRY = Registry()
+counter = REGISTRY.counter
+histogram = REGISTRY.histogram
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Notification Store - CEO 알림 저장소 (우선순위별 고정 크기 링 + 중복 억제)
+
+ceo-office/notifications/
+    <priority>.jsonl    우선순위별 알림 한 줄씩 {"seq", "timestamp", "priority", "message", ["key", "repeated"]}
+    read.json           우선순위별 마지막으로 읽은 seq
+
+- 우선순위마다 별도 로그라 긴급(critical/high) 알림은 info/normal이 아무리 많아도 바로 꺼낼 수 있다
+- 각 로그는 capacity의 두 배를 넘으면 최근 capacity개만 남김 (밀려난 알림은 on_evict로 보관소에)
+- 같은 key(기본값: 메시지)의 알림이 dedup_window초 안에 다시 오면 기록하지 않고 세어 두었다가,
+  창이 지난 뒤 같은 key의 다음 알림에 "repeated"로 붙인다 (억제 횟수는 프로세스별)
+- seq는 우선순위별로 1씩 증가 → 읽지 않은 수 = 마지막 seq - 읽은 seq (알림 수와 상관없이 일정 시간)
+- 읽는 쪽은 새로 추가된 줄만 읽어 메모리 링에 이어 붙이므로 대시보드 새로고침 비용도 알림 수와 무관
+"""
+
+import fcntl
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from task_store import write_atomic
+
+PRIORITIES = ["critical", "high", "normal", "info"]
+URGENT_PRIORITIES = ["critical", "high"]
+
+
+class _Ring:
+    """우선순위 하나의 메모리 링 (파일에서 읽은 위치까지)"""
+
+    def __init__(self, capacity: int):
+        self.inode = None
+        self.offset = 0
+        self.lines = 0  # 파일의 줄 수 (잘라낼 시점 판단용)
+        self.entries: deque = deque(maxlen=capacity)
+        self.last_seq = 0
+
+
+class NotificationStore:
+    """우선순위별 알림 링 (쓰기는 프로세스 간 잠금 안에서, 읽기는 증분)"""
+
+    def __init__(self, notifications_dir: Path, capacity: int = 200, dedup_window: float = 60,
+                 on_evict: Optional[Callable[[List[Dict]], None]] = None,
+                 now: Optional[Callable[[], datetime]] = None):
+        self.notifications_dir = Path(notifications_dir)
+        self.notifications_dir.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.dedup_window = timedelta(seconds=dedup_window)
+        self.on_evict = on_evict
+        self.now = now or datetime.now
+        self._rings = {priority: _Ring(capacity) for priority in PRIORITIES}
+        self._last_seen: Dict[tuple, datetime] = {}  # (우선순위, key) → 마지막으로 기록된 시각
+        self._suppressed: Dict[tuple, int] = {}  # (우선순위, key) → 기록하지 않은 횟수
+        self._prune_at = capacity * len(PRIORITIES)
+        self._read: Dict[str, int] = {}
+        self._read_mtime = None
+        self._lock = threading.RLock()
+
+    def _path(self, priority: str) -> Path:
+        return self.notifications_dir / f"{priority}.jsonl"
+
+    @contextmanager
+    def _locked(self):
+        """추가는 프로세스 간 잠금 안에서 (서버와 대시보드가 동시에 써도 seq가 겹치지 않음)"""
+        with self._lock, open(self.notifications_dir / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _remember(self, priority: str, ring: _Ring, entry: Dict):
+        ring.entries.append(entry)
+        ring.last_seq = entry["seq"]
+        try:
+            self._last_seen[(priority, entry.get("key", entry["message"]))] = \
+                datetime.fromisoformat(entry["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    def _sync(self, priority: str) -> _Ring:
+        """새로 추가된 줄만 읽어 링에 반영 (잘라내기로 파일이 교체됐으면 처음부터)"""
+        ring = self._rings[priority]
+        path = self._path(priority)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return ring
+        if ring.inode != stat.st_ino or stat.st_size < ring.offset:
+            ring.inode, ring.offset, ring.lines = stat.st_ino, 0, 0
+            ring.entries.clear()
+        if stat.st_size > ring.offset:
+            with open(path, "rb") as f:
+                f.seek(ring.offset)
+                data = f.read()
+            # 아직 쓰는 중인 마지막 줄은 다음에 읽음
+            complete = data[:data.rfind(b"\n") + 1]
+            for line in complete.splitlines():
+                if line.strip():
+                    self._remember(priority, ring, json.loads(line))
+                    ring.lines += 1
+            ring.offset += len(complete)
+        return ring
+
+    def add(self, message: str, priority: str = "info", key: Optional[str] = None) -> Optional[Dict]:
+        """알림 추가 - 같은 key가 dedup_window 안에 이미 기록됐으면 건너뛰고 None"""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority} (use {', '.join(PRIORITIES)})")
+        dedup_key = (priority, key or message)
+        now = self.now()
+        with self._locked():
+            ring = self._sync(priority)
+            last = self._last_seen.get(dedup_key)
+            if last is not None and now - last < self.dedup_window:
+                self._suppressed[dedup_key] = self._suppressed.get(dedup_key, 0) + 1
+                return None
+            entry = {"seq": ring.last_seq + 1, "timestamp": now.isoformat(), "priority": priority,
+                     "message": message}
+            if key:
+                entry["key"] = key
+            repeated = self._suppressed.pop(dedup_key, 0)
+            if repeated:
+                entry["repeated"] = repeated
+            line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+            fd = os.open(self._path(priority), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                # 잠금 안이라 방금 쓴 줄이 파일 끝 - 다시 읽지 않고 링에 바로 반영
+                stat = os.fstat(fd)
+            finally:
+                os.close(fd)
+            if ring.inode != stat.st_ino:
+                self._sync(priority)  # 파일을 새로 만들었음
+            else:
+                self._remember(priority, ring, entry)
+                ring.offset += len(line)
+                ring.lines += 1
+            if ring.lines > self.capacity * 2:
+                self._trim(priority)
+            self._prune(now)
+        return entry
+
+    def _trim(self, priority: str):
+        """최근 capacity개만 남기고 파일 교체 (밀려난 알림은 on_evict로)"""
+        path = self._path(priority)
+        lines = path.read_bytes().splitlines(keepends=True)
+        evicted, kept = lines[:-self.capacity], lines[-self.capacity:]
+        if self.on_evict:
+            self.on_evict([json.loads(line) for line in evicted if line.strip()])
+        write_atomic(path, b"".join(kept))
+        self._sync(priority)
+
+    def _prune(self, now: datetime):
+        """창이 지난 중복 억제 key 정리 (key가 매번 다른 알림이 쌓여도 메모리는 창 안의 key 수에 비례)"""
+        if len(self._last_seen) <= self._prune_at:
+            return
+        cutoff = now - self.dedup_window
+        for dedup_key, seen in list(self._last_seen.items()):
+            if seen < cutoff and dedup_key not in self._suppressed:
+                del self._last_seen[dedup_key]
+        # 창 안의 key가 많아도 정리 비용이 알림마다 들지 않도록 다음 기준을 늘림
+        self._prune_at = max(self.capacity * len(PRIORITIES), len(self._last_seen) * 2)
+
+    def recent(self, priorities: Optional[Iterable[str]] = None, limit: Optional[int] = None) -> List[Dict]:
+        """최근 알림 (최신순, 우선순위를 주지 않으면 전체)"""
+        with self._lock:
+            entries = []
+            for priority in (PRIORITIES if priorities is None else priorities):
+                entries.extend(self._sync(priority).entries)
+        entries.sort(key=lambda entry: entry["timestamp"], reverse=True)
+        return entries[:limit] if limit is not None else entries
+
+    def _read_seqs(self) -> Dict[str, int]:
+        """read.json (바뀌었을 때만 다시 읽음)"""
+        path = self.notifications_dir / "read.json"
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if mtime != self._read_mtime:
+            try:
+                self._read = json.loads(path.read_text())
+            except ValueError:
+                return self._read
+            self._read_mtime = mtime
+        return self._read
+
+    def unread_count(self, priorities: Iterable[str] = URGENT_PRIORITIES) -> Dict[str, int]:
+        """우선순위별 읽지 않은 알림 수 (마지막 seq - 읽은 seq)"""
+        with self._lock:
+            read = self._read_seqs()
+            return {priority: max(self._sync(priority).last_seq - read.get(priority, 0), 0)
+                    for priority in priorities}
+
+    def unread(self, priorities: Iterable[str] = URGENT_PRIORITIES, limit: Optional[int] = None) -> List[Dict]:
+        """읽지 않은 알림 (우선순위 순, 같은 우선순위 안에서는 최신순 - 링에 남은 것까지)"""
+        unread = []
+        with self._lock:
+            read = self._read_seqs()
+            for priority in priorities:
+                ring = self._sync(priority)
+                count = min(max(ring.last_seq - read.get(priority, 0), 0), len(ring.entries))
+                # 링 끝에서 읽지 않은 수만큼만 (앞쪽은 보지 않음)
+                for index in range(len(ring.entries) - 1, len(ring.entries) - 1 - count, -1):
+                    unread.append(ring.entries[index])
+                    if limit is not None and len(unread) >= limit:
+                        return unread
+        return unread
+
+    def mark_read(self, priorities: Optional[Iterable[str]] = None):
+        """지금까지의 알림을 읽음으로 (우선순위를 주지 않으면 전체)"""
+        with self._locked():
+            read = dict(self._read_seqs())
+            for priority in (PRIORITIES if priorities is None else priorities):
+                read[priority] = self._sync(priority).last_seq
+            write_atomic(self.notifications_dir / "read.json", json.dumps(read))
+            self._read, self._read_mtime = read, None
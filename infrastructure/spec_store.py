@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Spec Store - 제품 스펙 저장소 (버전 + 델타 이력 + 프로세스 내 LRU 캐시)
+
+specs/
+    <product>.json              최신 스펙 전체 ("version", "updated_at" 포함, 사람이 읽는 형식 그대로)
+    history/<product>.jsonl     버전별 변경분 한 줄씩 {"version", "updated_at", "set": [[경로, 값]], "unset": [경로]}
+
+- 저장할 때 직전 스펙과 비교해 바뀐 키 경로만 이력에 추가 (전체 사본을 쌓지 않음), 바뀐 게 없으면 버전 유지
+- 버전은 스펙마다 1부터 단조 증가, 저장은 프로세스 간 잠금 안에서
+- 조회는 캐시 우선: 파일의 (inode, mtime, 크기)가 그대로면 다시 읽거나 파싱하지 않음
+  호출자에게는 사본을 준다 (받은 스펙을 고쳐 save()해도 캐시와 비교 기준은 그대로).
+  사본은 캐시에 같이 둔 marshal 바이트에서 만들어 deepcopy나 JSON 재파싱보다 빠름
+- changes_since()는 주어진 버전 이후의 델타만 반환 (이력이 잘렸거나 빠졌으면 전체 스펙)
+- 에이전트가 specs/에 직접 쓴 파일도 읽을 수 있다 (버전 없음 = 0). 다음 save()가 그 내용과 비교해 이력을 이어감
+"""
+
+import copy
+import fcntl
+import json
+import marshal
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from task_store import write_atomic
+
+META_FIELDS = ("version", "updated_at")
+
+
+def diff_spec(old: Dict, new: Dict, path: Tuple = ()) -> Tuple[List, List]:
+    """두 스펙의 차이 → (set [[경로, 값]], unset [경로]) - dict는 키 단위로 내려가고 나머지 값은 통째로 교체"""
+    set_ops, unset_ops = [], []
+    for key, value in new.items():
+        if not path and key in META_FIELDS:
+            continue
+        if key not in old:
+            set_ops.append([list(path + (key,)), value])
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            nested_set, nested_unset = diff_spec(old[key], value, path + (key,))
+            set_ops += nested_set
+            unset_ops += nested_unset
+        elif old[key] != value:
+            set_ops.append([list(path + (key,)), value])
+    for key in old:
+        if key not in new and not (not path and key in META_FIELDS):
+            unset_ops.append(list(path + (key,)))
+    return set_ops, unset_ops
+
+
+def apply_delta(spec: Dict, delta: Dict) -> Dict:
+    """스펙에 델타 한 건 적용 (spec을 직접 수정하고 반환)"""
+    for key_path, value in delta.get("set", ()):
+        parent = spec
+        for key in key_path[:-1]:
+            if not isinstance(parent.get(key), dict):
+                parent[key] = {}
+            parent = parent[key]
+        parent[key_path[-1]] = copy.deepcopy(value)  # 같은 델타를 여러 스펙에 적용해도 값을 공유하지 않음
+    for key_path in delta.get("unset", ()):
+        parent = spec
+        for key in key_path[:-1]:
+            parent = parent.get(key)
+            if not isinstance(parent, dict):
+                break
+        else:
+            parent.pop(key_path[-1], None)
+    spec["version"] = delta["version"]
+    spec["updated_at"] = delta["updated_at"]
+    return spec
+
+
+def _file_key(path: Path) -> Optional[Tuple]:
+    """캐시 유효성 키 (write_atomic은 새 inode로 교체하므로 제자리 수정과 교체 모두 감지)"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class SpecStore:
+    """제품 스펙 저장/조회 (최신 스펙과 이력 모두 LRU 캐시)"""
+
+    def __init__(self, specs_dir: Path, cache_size: int = 128, history_limit: int = 200):
+        self.specs_dir = Path(specs_dir)
+        self.history_dir = self.specs_dir / "history"
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self.history_limit = history_limit  # 스펙별로 남길 델타 수 (넘으면 오래된 것부터 잘라냄)
+        self._specs: "OrderedDict[str, Tuple]" = OrderedDict()  # 이름 → (파일 키, 스펙, marshal 바이트)
+        self._history: "OrderedDict[str, Tuple]" = OrderedDict()  # 이름 → (inode, 읽은 위치, 델타 목록)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _spec_path(self, name: str) -> Path:
+        return self.specs_dir / f"{name}.json"
+
+    def _history_path(self, name: str) -> Path:
+        return self.history_dir / f"{name}.jsonl"
+
+    @contextmanager
+    def _locked(self):
+        """저장은 프로세스 간 잠금 안에서 (서버와 대시보드가 동시에 저장해도 버전이 겹치지 않음)"""
+        with self._lock, open(self.specs_dir / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _remember(self, cache: OrderedDict, name: str, entry: Tuple):
+        cache[name] = entry
+        cache.move_to_end(name)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def get(self, name: str) -> Optional[Dict]:
+        """최신 스펙 사본 (파일이 바뀌었을 때만 다시 읽음, 고쳐서 save()에 넘겨도 됨)"""
+        entry = self._entry(name)
+        return marshal.loads(entry[2]) if entry else None
+
+    def _cached(self, name: str) -> Optional[Dict]:
+        """캐시된 스펙 객체 그대로 (저장소 안에서만, 수정 금지)"""
+        entry = self._entry(name)
+        return entry[1] if entry else None
+
+    def _entry(self, name: str) -> Optional[Tuple]:
+        with self._lock:
+            path = self._spec_path(name)
+            key = _file_key(path)
+            cached = self._specs.get(name)
+            if cached and cached[0] == key:
+                self._specs.move_to_end(name)
+                self.hits += 1
+                return cached
+            self.misses += 1
+            if key is None:
+                self._specs.pop(name, None)
+                return None
+            try:
+                spec = json.loads(path.read_text())
+            except FileNotFoundError:
+                return None
+            entry = (key, spec, marshal.dumps(spec))
+            self._remember(self._specs, name, entry)
+            return entry
+
+    def version(self, name: str) -> int:
+        spec = self._cached(name)
+        return spec.get("version", 0) if spec else 0
+
+    def history(self, name: str) -> List[Dict]:
+        """남아 있는 델타 목록 사본"""
+        return copy.deepcopy(self._deltas(name))
+
+    def _deltas(self, name: str) -> List[Dict]:
+        """캐시된 델타 목록 (새로 추가된 줄만 읽어서 이어 붙임, 수정 금지)"""
+        with self._lock:
+            path = self._history_path(name)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                self._history.pop(name, None)
+                return []
+            inode, offset, deltas = self._history.get(name, (None, 0, []))
+            if inode != stat.st_ino or stat.st_size < offset:
+                offset, deltas = 0, []  # 잘라내기로 파일이 교체됨
+            if stat.st_size > offset:
+                with open(path, "rb") as f:
+                    f.seek(offset)
+                    data = f.read()
+                complete = data[:data.rfind(b"\n") + 1]
+                deltas = deltas + [json.loads(line) for line in complete.splitlines() if line.strip()]
+                offset += len(complete)
+            self._remember(self._history, name, (stat.st_ino, offset, deltas))
+            return deltas
+
+    def save(self, name: str, spec: Dict, updated_at: Optional[str] = None) -> Dict:
+        """스펙 저장 - 바뀐 부분을 새 버전의 델타로 이력에 추가하고 저장된 스펙 사본 반환"""
+        with self._locked():
+            current = self._cached(name) or {}
+            set_ops, unset_ops = diff_spec(current, spec)
+            if current and not set_ops and not unset_ops:
+                return self.get(name)
+            history = self._deltas(name)
+            last_version = history[-1]["version"] if history else 0
+            if history and current.get("version", 0) != last_version:
+                # 파일이 저장소 밖에서 바뀜 → 이전 델타와 이어지지 않으므로 이력을 끊음 (받는 쪽은 전체 스펙)
+                self._history_path(name).unlink()
+            version = max(current.get("version", 0), last_version) + 1
+            delta = {"version": version, "updated_at": updated_at or datetime.now().isoformat(),
+                     "set": set_ops, "unset": unset_ops}
+            saved = {key: value for key, value in spec.items() if key not in META_FIELDS}
+            saved.update(version=version, updated_at=delta["updated_at"])
+            saved = copy.deepcopy(saved)
+
+            # 스펙 파일 먼저 교체 (중간에 죽어 델타가 빠져도 changes_since가 전체 스펙으로 대신함)
+            path = self._spec_path(name)
+            write_atomic(path, json.dumps(saved, indent=2))
+            packed = marshal.dumps(saved)
+            self._remember(self._specs, name, (_file_key(path), saved, packed))
+            with open(self._history_path(name), "a") as f:
+                f.write(json.dumps(delta, separators=(",", ":")) + "\n")
+            self._trim_history(name)
+            return marshal.loads(packed)
+
+    def _trim_history(self, name: str):
+        """델타가 history_limit의 두 배를 넘으면 최근 history_limit개만 남김 (잘라내는 비용 분산)"""
+        deltas = self._deltas(name)
+        if len(deltas) <= self.history_limit * 2:
+            return
+        kept = deltas[-self.history_limit:]
+        write_atomic(self._history_path(name),
+                     "".join(json.dumps(delta, separators=(",", ":")) + "\n" for delta in kept))
+
+    def changes_since(self, name: str, since_version: int) -> Optional[Dict]:
+        """since_version 이후의 변경분
+
+        {"product", "version", "since_version", "changes": [델타...]} - 순서대로 apply_delta 하면 최신 스펙
+        이력으로 이어 붙일 수 없으면 "changes" 대신 "spec"(전체)을 넣어 반환, 스펙이 없으면 None
+        델타와 스펙은 모두 사본이라 받은 쪽에서 고쳐도 캐시에 영향 없음
+        """
+        spec = self._cached(name)
+        if spec is None:
+            return None
+        version = spec.get("version", 0)
+        result = {"product": name, "version": version, "since_version": since_version}
+        if since_version >= version:
+            result["changes"] = []
+            return result
+        changes = [delta for delta in self._deltas(name) if since_version < delta["version"] <= version]
+        if [delta["version"] for delta in changes] == list(range(since_version + 1, version + 1)):
+            result["changes"] = copy.deepcopy(changes)
+        else:
+            result["spec"] = self.get(name)
+        return result
+
+    def names(self) -> List[str]:
+        return sorted(path.stem for path in self.specs_dir.glob("*.json"))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"cached": len(self._specs), "hits": self.hits, "misses": self.misses}
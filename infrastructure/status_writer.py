@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Status Writer - 에이전트 상태 기록 (변경 없는 쓰기 생략 + 병합 + 원자적 쓰기)
+
+- files 모드: status/<agent>.json (기존 레이아웃)
+- shared 모드: team_status.json 하나에 전체 팀 상태 기록 (CLAUDETEAM_STATUS_MODE=shared)
+"""
+
+import fcntl
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from codec import Codec, get_codec, read_record
+from task_store import write_atomic
+
+SHARED_STATUS_FILE = "team_status.json"
+
+
+def read_team_status(status_dir: Path) -> Dict[str, Dict]:
+    """팀 상태 조회 - 공유 파일과 에이전트별 파일 중 더 최근 것을 사용"""
+    status_dir = Path(status_dir)
+    team = {}
+    shared_file = status_dir.parent / SHARED_STATUS_FILE
+    if shared_file.exists():
+        team = read_record(shared_file)
+
+    if status_dir.exists():
+        for status_file in status_dir.glob("*.json"):
+            agent = status_file.stem
+            data = read_record(status_file)
+            if agent not in team or data.get("timestamp", "") > team[agent].get("timestamp", ""):
+                team[agent] = data
+    return team
+
+
+class StatusWriter:
+    """에이전트 상태 기록기
+
+    - 타임스탬프를 뺀 내용이 마지막으로 쓴 것과 같으면 쓰지 않음
+    - 에이전트별로 coalesce_window초에 한 번만 쓰고, 그 사이 업데이트는 마지막 값만 남겨 창이 끝날 때 기록
+    - 임시 파일 + rename으로 원자적 기록
+    """
+
+    def __init__(self, status_dir: Path, coalesce_window: float = 1.0, shared: Optional[bool] = None,
+                 codec: Optional[Codec] = None):
+        self.status_dir = Path(status_dir)
+        self.codec = codec or get_codec()
+        self.status_dir.mkdir(parents=True, exist_ok=True)
+        self.coalesce_window = coalesce_window
+        if shared is None:
+            shared = os.environ.get("CLAUDETEAM_STATUS_MODE", "files") == "shared"
+        self.shared = shared
+        self.shared_file = self.status_dir.parent / SHARED_STATUS_FILE
+
+        self._last_written: Dict[str, Dict] = {}
+        self._last_write_at: Dict[str, float] = {}
+        self._pending: Dict[str, Dict] = {}
+        self._timer = None
+        self._lock = threading.RLock()
+
+    def update(self, agent: str, status: Dict) -> bool:
+        """상태 업데이트 요청 (실제로 바로 기록했으면 True)"""
+        content = {k: v for k, v in status.items() if k != "timestamp"}
+        with self._lock:
+            if self._last_written.get(agent) == content:
+                # 창 안에서 원래 값으로 되돌아온 경우 대기 중인 쓰기도 취소
+                self._pending.pop(agent, None)
+                return False
+
+            now = time.monotonic()
+            last_write_at = self._last_write_at.get(agent)
+            if last_write_at is None or now - last_write_at >= self.coalesce_window:
+                self._pending.pop(agent, None)
+                self._write({agent: status})
+                return True
+
+            self._pending[agent] = status
+            if self._timer is None:
+                self._timer = threading.Timer(last_write_at + self.coalesce_window - now, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            return False
+
+    def flush(self):
+        """대기 중인 상태 모두 기록"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending:
+                pending, self._pending = self._pending, {}
+                self._write(pending)
+
+    def _write(self, statuses: Dict[str, Dict]):
+        if self.shared:
+            # 여러 프로세스가 같은 파일을 갱신하므로 잠금 후 read-modify-write
+            with open(self.shared_file.with_suffix(".lock"), "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                team = read_record(self.shared_file) if self.shared_file.exists() else {}
+                team.update(statuses)
+                write_atomic(self.shared_file, self.codec.encode(team))
+        else:
+            for agent, status in statuses.items():
+                write_atomic(self.status_dir / f"{agent}.json", self.codec.encode(status))
+
+        now = time.monotonic()
+        for agent, status in statuses.items():
+            self._last_written[agent] = {k: v for k, v in status.items() if k != "timestamp"}
+            self._last_write_at[agent] = now
+
+    def read_all(self) -> Dict[str, Dict]:
+        """팀 상태 조회 (아직 기록 대기 중인 이 프로세스의 상태 포함)"""
+        with self._lock:
+            team = read_team_status(self.status_dir)
+            team.update(self._pending)
+            return team
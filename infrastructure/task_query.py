@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Task Query - 작업 조회 조건/정렬/커서 (페이지 단위 조회)
+
+- TaskQuery: 담당자, 상태, 우선순위 범위, 생성/수정 시각 범위, 제목 검색, 정렬 키, 페이지 크기, 커서
+- 커서는 마지막으로 본 작업의 (정렬 값, ID) - 다음 페이지는 그 뒤부터 (keyset pagination)
+  작업이 추가/삭제되어도 이미 본 작업이 다시 나오거나 건너뛰지 않는다
+- select_page()는 limit+1개만 유지하는 heap으로 한 페이지를 고르므로 메모리는 페이지 크기에 비례
+"""
+
+import base64
+import heapq
+import json
+from dataclasses import dataclass, replace
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 정렬 키 → 값이 없는 작업의 기본값
+SORT_KEYS = {"created_at": "", "updated_at": "", "priority": 0, "id": ""}
+
+
+def encode_cursor(key: Tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple:
+    try:
+        return tuple(json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass
+class TaskQuery:
+    """작업 조회 조건 (모든 조건은 AND, 시각은 ISO 문자열 비교 - after 이상, before 미만)"""
+    assigned_to: Optional[str] = None
+    statuses: Optional[List[str]] = None
+    min_priority: Optional[int] = None
+    max_priority: Optional[int] = None
+    created_after: Optional[str] = None
+    created_before: Optional[str] = None
+    updated_after: Optional[str] = None
+    updated_before: Optional[str] = None
+    text: Optional[str] = None  # 제목에 포함된 문자열 (대소문자 무시)
+    sort: str = "created_at"  # SORT_KEYS 중 하나, "-"로 시작하면 내림차순
+    limit: int = 50
+    cursor: Optional[str] = None
+
+    def __post_init__(self):
+        if self.sort_field not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {self.sort} (use {', '.join(SORT_KEYS)})")
+        if self.limit < 1:
+            raise ValueError("limit must be positive")
+
+    @property
+    def sort_field(self) -> str:
+        return self.sort.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.sort.startswith("-")
+
+    def matches(self, task: Dict) -> bool:
+        if self.assigned_to is not None and task.get("assigned_to") != self.assigned_to:
+            return False
+        if self.statuses is not None and task.get("status") not in self.statuses:
+            return False
+        priority = task.get("priority", 0)
+        if (self.min_priority is not None and priority < self.min_priority) or \
+                (self.max_priority is not None and priority > self.max_priority):
+            return False
+        created, updated = task.get("created_at") or "", task.get("updated_at") or ""
+        if (self.created_after and created < self.created_after) or \
+                (self.created_before and created >= self.created_before):
+            return False
+        if (self.updated_after and updated < self.updated_after) or \
+                (self.updated_before and updated >= self.updated_before):
+            return False
+        if self.text and self.text.lower() not in (task.get("title") or "").lower():
+            return False
+        return True
+
+    def sort_key(self, task: Dict) -> Tuple:
+        """(정렬 값, ID) - ID로 같은 값 사이의 순서를 고정"""
+        value = task.get(self.sort_field)
+        return (SORT_KEYS[self.sort_field] if value is None else value, task["id"])
+
+    def after_cursor(self) -> Callable[[Tuple], bool]:
+        """정렬 키가 커서 뒤에 오는지 확인하는 함수 (커서가 없으면 항상 참)"""
+        if not self.cursor:
+            return lambda key: True
+        cursor = decode_cursor(self.cursor)
+        return (lambda key: key < cursor) if self.descending else (lambda key: key > cursor)
+
+    def next_page(self, cursor: str) -> "TaskQuery":
+        return replace(self, cursor=cursor)
+
+
+def make_page(rows: List[Tuple[Tuple, Dict]], query: TaskQuery) -> Dict:
+    """정렬된 (키, 작업) limit+1개 → {"tasks": [...], "next_cursor": 다음 페이지 커서 또는 None}"""
+    more = len(rows) > query.limit
+    rows = rows[:query.limit]
+    return {
+        "tasks": [dict(task) for _, task in rows],
+        "next_cursor": encode_cursor(rows[-1][0]) if more else None,
+    }
+
+
+def select_page(tasks: Iterable[Dict], query: TaskQuery) -> Dict:
+    """작업 스트림에서 조건에 맞는 한 페이지 (heap에 limit+1개만 유지)"""
+    after = query.after_cursor()
+    candidates = (
+        (key, task) for task in tasks if query.matches(task)
+        for key in (query.sort_key(task),) if after(key)
+    )
+    pick = heapq.nlargest if query.descending else heapq.nsmallest
+    return make_page(pick(query.limit + 1, candidates, key=itemgetter(0)), query)
+
+
+def iter_pages(run_query: Callable[[TaskQuery], Dict], query: TaskQuery) -> Iterator[Dict]:
+    """커서를 따라가며 모든 페이지의 작업을 차례로 yield"""
+    while True:
+        page = run_query(query)
+        yield from page["tasks"]
+        if not page["next_cursor"]:
+            return
+        query = query.next_page(page["next_cursor"])
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Task Scheduler - 담당자별 힙 우선순위 큐 (aging + 마감 시한)
+
+대기열 상태는 작업 저장소(TaskStore)의 pending 작업에서 다시 만들 수 있으므로,
+저장소가 영속적이면 스케줄러도 재시작 후 그대로 복구된다.
+"""
+
+import heapq
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from task_store import TaskStore
+
+
+def _timestamp(value: Optional[str], default: float) -> float:
+    """ISO 시각 문자열 → epoch 초"""
+    if not value:
+        return default
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return default
+
+
+def _percentile(values, pct: float) -> Optional[float]:
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+class TaskScheduler:
+    """담당자별 우선순위 큐
+
+    - 유효 우선순위 = priority + 대기시간 / aging_seconds (오래 기다린 작업이 점점 앞으로)
+      모든 작업이 같은 속도로 나이를 먹으므로 순서 키 `created/aging_seconds - priority`는
+      시간이 지나도 변하지 않는다 → 재정렬 없이 힙 하나로 O(log n) push/pop
+    - "deadline"이 있는 작업은 마감 deadline_slack초 전부터 우선순위와 상관없이 먼저 꺼냄
+    - 삭제는 lazy (힙에 남은 항목은 pop 할 때 건너뜀)
+    """
+
+    def __init__(self, task_store: Optional[TaskStore] = None, assigned_to: Optional[str] = None,
+                 aging_seconds: float = 3600, deadline_slack: float = 300,
+                 clock: Optional[Callable[[], float]] = None):
+        self.task_store = task_store
+        self.clock = clock or time.time  # epoch 초 (시뮬레이션은 가상 시계)
+        self.assigned_to = assigned_to
+        self.aging_seconds = aging_seconds
+        self.deadline_slack = deadline_slack
+
+        self._queues: Dict[str, List] = defaultdict(list)
+        self._deadlines: Dict[str, List] = defaultdict(list)
+        self._entries: Dict[str, tuple] = {}  # task_id -> (seq, task)
+        self._depth: Dict[str, int] = defaultdict(int)
+        self._waits: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self._seq = 0
+        self._synced_version = None
+        self._lock = threading.RLock()
+
+    def push(self, task: Dict):
+        """작업 추가 (같은 ID가 있으면 교체)"""
+        with self._lock:
+            self._discard(task["id"])
+            self._seq += 1
+            assignee = task["assigned_to"]
+            created = _timestamp(task.get("created_at"), self.clock())
+            key = created / self.aging_seconds - task.get("priority", 0)
+            heapq.heappush(self._queues[assignee], (key, self._seq, task["id"]))
+            if task.get("deadline"):
+                deadline = _timestamp(task["deadline"], float("inf"))
+                heapq.heappush(self._deadlines[assignee], (deadline, self._seq, task["id"]))
+            self._entries[task["id"]] = (self._seq, task)
+            self._depth[assignee] += 1
+
+    def _discard(self, task_id: str) -> Optional[Dict]:
+        entry = self._entries.pop(task_id, None)
+        if entry:
+            self._depth[entry[1]["assigned_to"]] -= 1
+            return entry[1]
+        return None
+
+    def remove(self, task_id: str) -> Optional[Dict]:
+        """작업 제거 (claim/취소된 작업)"""
+        with self._lock:
+            return self._discard(task_id)
+
+    def _pop_live(self, heap: List, peek: bool = False):
+        """힙에서 아직 유효한 첫 항목 (삭제/교체된 항목은 버림)"""
+        while heap:
+            _, seq, task_id = heap[0]
+            entry = self._entries.get(task_id)
+            if entry and entry[0] == seq:
+                if not peek:
+                    heapq.heappop(heap)
+                return heap[0] if peek else (seq, task_id)
+            heapq.heappop(heap)
+        return None
+
+    def pop(self, assignee: str) -> Optional[Dict]:
+        """담당자의 다음 작업 꺼내기 (마감 임박 작업 → 유효 우선순위 순)"""
+        with self._lock:
+            now = self.clock()
+            deadlines = self._deadlines.get(assignee)
+            head = self._pop_live(deadlines, peek=True) if deadlines else None
+            if head and head[0] - now <= self.deadline_slack:
+                _, task_id = self._pop_live(deadlines)
+            else:
+                popped = self._pop_live(self._queues.get(assignee, []))
+                if not popped:
+                    return None
+                _, task_id = popped
+
+            task = self._discard(task_id)
+            self._waits[assignee].append(now - _timestamp(task.get("created_at"), now))
+            return task
+
+    def ordered(self, assignee: str, limit: Optional[int] = None) -> List[Dict]:
+        """담당자 대기열을 꺼낼 순서대로 조회 (표시용, 큐는 변경하지 않음, limit개면 전체를 정렬하지 않음)"""
+        with self._lock:
+            live = (
+                (key, seq, task_id) for key, seq, task_id in self._queues.get(assignee, [])
+                if task_id in self._entries and self._entries[task_id][0] == seq
+            )
+            head = sorted(live) if limit is None else heapq.nsmallest(limit, live)
+            return [self._entries[task_id][1] for _, _, task_id in head]
+
+    def sync(self):
+        """저장소의 pending 작업과 대기열 동기화 (저장소가 바뀌었을 때만)"""
+        if self.task_store is None:
+            return
+        with self._lock:
+            version = self.task_store.version(["pending"])
+            if version == self._synced_version:
+                return
+            pending = {task["id"]: task for task in self.task_store.find(["pending"], assigned_to=self.assigned_to)}
+            for task_id in [task_id for task_id in self._entries if task_id not in pending]:
+                self._discard(task_id)
+            for task_id, task in pending.items():
+                if task_id not in self._entries:
+                    self.push(task)
+            self._synced_version = version
+
+    def depth(self, assignee: str) -> int:
+        with self._lock:
+            return self._depth.get(assignee, 0)
+
+    def metrics(self) -> Dict:
+        """담당자별 대기열 길이와 대기 시간 통계 (최근 1000건)"""
+        with self._lock:
+            result = {}
+            for assignee in sorted(set(self._depth) | set(self._waits)):
+                waits = self._waits.get(assignee, ())
+                result[assignee] = {
+                    "depth": self._depth.get(assignee, 0),
+                    "dequeued": len(waits),
+                    "wait_p50_s": _percentile(waits, 50),
+                    "wait_p99_s": _percentile(waits, 99),
+                    "wait_max_s": max(waits) if waits else None,
+                }
+            return result
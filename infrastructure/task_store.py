@@ -0,0 +1,986 @@
+#!/usr/bin/env python3
+"""
+Task Store - 작업 저장소 (인메모리 인덱스 + 영속 백엔드)
+
+- FileTaskStore: 기존 tasks/<status>/<id>.json 레이아웃 (호환/내보내기용)
+- SQLiteTaskStore: WAL 모드 SQLite (대량 작업용 영속 백엔드)
+- MemoryTaskStore: 프로세스 메모리만 사용 (영속성이 필요 없는 시뮬레이션/벤치마크용)
+"""
+
+import fcntl
+import itertools
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Union
+
+from codec import Codec, decode, get_codec
+from task_query import TaskQuery, decode_cursor, iter_pages, make_page, select_page
+
+TASK_STATUSES = ["pending", "in_progress", "review", "completed", "blocked", "dead_letter"]
+TASK_BACKENDS = ["file", "sqlite", "memory"]
+MAX_TASK_RETRIES = 3  # lease가 끊긴 작업을 다시 대기열에 넣는 최대 횟수 (넘으면 dead_letter)
+
+
+def write_atomic(path: Path, data: Union[str, bytes]):
+    """임시 파일 작성 후 rename으로 교체"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if isinstance(data, bytes):
+        tmp_path.write_bytes(data)
+    else:
+        tmp_path.write_text(data)
+    os.replace(tmp_path, path)
+
+
+_id_sequence = itertools.count(1)
+_id_token = (None, "")
+
+
+def new_task_id(prefix: str = "task") -> str:
+    """충돌 없는 작업 ID - <prefix>_<ms 시각>_<프로세스 토큰>_<순번>
+
+    같은 프로세스에서는 순번으로, 프로세스/호스트 사이에서는 무작위 토큰으로 구분
+    (fork된 자식 프로세스는 pid가 바뀌므로 토큰을 새로 만든다)
+    """
+    global _id_token
+    pid = os.getpid()
+    if _id_token[0] != pid:
+        _id_token = (pid, secrets.token_hex(4))
+    # 순번은 자리 수를 맞춰 같은 ms 안에서도 ID 문자열 순서 = 생성 순서 (TaskQuery sort="id")
+    return f"{prefix}_{time.time_ns() // 1_000_000}_{_id_token[1]}_{next(_id_sequence):06d}"
+
+
+class LeaseLostError(Exception):
+    """lease가 만료되어 작업이 다른 워커에게 넘어간 경우"""
+
+
+def _reaped(task: Dict, max_retries: int) -> Dict:
+    """lease가 끊긴 작업 → 재시도 횟수를 올려 pending, max_retries번 넘게 실패했으면 dead_letter"""
+    reaped = dict(task, retries=task.get("retries", 0) + 1, last_worker=task.get("claimed_by"))
+    reaped.pop("claimed_by", None)
+    reaped["status"] = "dead_letter" if reaped["retries"] > max_retries else "pending"
+    return reaped
+
+
+class TaskIndex:
+    """작업 ID / 담당자 / 상태별 인메모리 인덱스"""
+
+    def __init__(self):
+        self.tasks: Dict[str, Dict] = {}
+        self.by_status: Dict[str, set] = defaultdict(set)
+        self.by_assignee: Dict[str, set] = defaultdict(set)
+        self.version = 0  # 추가/삭제마다 증가 (변경 감지용)
+        self.status_versions: Dict[str, int] = defaultdict(int)  # 상태별 추가/삭제 횟수
+
+    def add(self, task: Dict):
+        self.remove(task["id"])
+        self.version += 1
+        self.status_versions[task["status"]] += 1
+        self.tasks[task["id"]] = task
+        self.by_status[task["status"]].add(task["id"])
+        self.by_assignee[task["assigned_to"]].add(task["id"])
+
+    def remove(self, task_id: str) -> Optional[Dict]:
+        task = self.tasks.pop(task_id, None)
+        if task:
+            self.version += 1
+            self.status_versions[task["status"]] += 1
+            self.by_status[task["status"]].discard(task_id)
+            self.by_assignee[task["assigned_to"]].discard(task_id)
+        return task
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        return self.tasks.get(task_id)
+
+    def select(self, statuses: Optional[Iterable[str]] = None,
+               assigned_to: Optional[str] = None) -> List[Dict]:
+        """상태/담당자 조건에 맞는 작업 (작은 인덱스 기준으로 교집합)"""
+        if statuses is None:
+            ids = set(self.tasks) if assigned_to is None else self.by_assignee.get(assigned_to, set())
+        else:
+            ids = set()
+            for status in statuses:
+                ids |= self.by_status.get(status, set())
+            if assigned_to is not None:
+                ids &= self.by_assignee.get(assigned_to, set())
+        return [self.tasks[task_id] for task_id in ids]
+
+    def iter_select(self, statuses: Optional[Iterable[str]] = None,
+                    assigned_to: Optional[str] = None) -> Iterator[Dict]:
+        """select()와 같은 조건, ID 집합을 새로 만들지 않고 차례로 (순회 중에는 인덱스를 바꾸지 말 것)"""
+        if statuses is None:
+            ids = self.tasks if assigned_to is None else self.by_assignee.get(assigned_to, ())
+            for task_id in ids:
+                yield self.tasks[task_id]
+            return
+        assignee_ids = None if assigned_to is None else self.by_assignee.get(assigned_to, set())
+        for status in statuses:
+            ids = self.by_status.get(status, set())
+            if assignee_ids is not None and len(assignee_ids) < len(ids):
+                for task_id in assignee_ids:
+                    if self.tasks[task_id]["status"] == status:
+                        yield self.tasks[task_id]
+                continue
+            for task_id in ids:
+                task = self.tasks[task_id]
+                if assigned_to is None or task["assigned_to"] == assigned_to:
+                    yield task
+
+    def count(self, status: str) -> int:
+        return len(self.by_status.get(status, ()))
+
+    def versions(self, statuses: Optional[Iterable[str]] = None) -> Hashable:
+        """지정한 상태들의 변경 횟수 (다른 상태의 작업이 바뀌어도 그대로)"""
+        if statuses is None:
+            return self.version
+        return tuple(self.status_versions.get(status, 0) for status in statuses)
+
+
+def _query_index(lock, index: TaskIndex, query: TaskQuery, refresh: Callable = None) -> Dict:
+    """인덱스 저장소의 한 페이지 (잠금 안에서 heap으로 고르고 페이지만 복사)"""
+    with lock:
+        if refresh:
+            refresh(query.statuses)
+        return select_page(index.iter_select(query.statuses, query.assigned_to), query)
+
+
+def _iter_index(lock, index: TaskIndex, query: TaskQuery, refresh: Callable = None) -> Iterator[Dict]:
+    """인덱스 저장소 전체 순회 - 정렬 키만 먼저 모으고, 작업 사본은 페이지 단위로 만듦
+
+    (커서로 페이지마다 다시 훑으면 전체 순회가 작업 수의 제곱에 비례하므로)
+    """
+    after = query.after_cursor()
+    with lock:
+        if refresh:
+            refresh(query.statuses)
+        keys = sorted((key for task in index.iter_select(query.statuses, query.assigned_to)
+                       if query.matches(task) for key in (query.sort_key(task),) if after(key)),
+                      reverse=query.descending)
+    for start in range(0, len(keys), query.limit):
+        with lock:
+            tasks = [index.get(task_id) for _, task_id in keys[start:start + query.limit]]
+            page = [dict(task) for task in tasks if task is not None and query.matches(task)]
+        yield from page
+
+
+class TaskStore:
+    """작업 저장소 인터페이스"""
+
+    listeners = ()
+    batch_listeners: Dict = {}
+
+    def add_listener(self, callback, batch_callback=None):
+        """작업 변경 구독 - callback(event, task), event는 "created" 또는 변경된 상태
+
+        batch_callback(event, tasks)을 주면 create_many 같은 일괄 변경은 한 번에 받는다
+        """
+        self.listeners = list(self.listeners) + [callback]
+        if batch_callback is not None:
+            self.batch_listeners = dict(self.batch_listeners)
+            self.batch_listeners[callback] = batch_callback
+
+    def _emit(self, event: str, task: Dict):
+        for callback in self.listeners:
+            try:
+                callback(event, dict(task))
+            except Exception as e:
+                print(f"[TASK_STORE] Listener error: {e}")
+
+    def _emit_many(self, event: str, tasks: List[Dict]):
+        for callback in self.listeners:
+            batch_callback = self.batch_listeners.get(callback)
+            try:
+                if batch_callback is not None:
+                    batch_callback(event, [dict(task) for task in tasks])
+                else:
+                    for task in tasks:
+                        callback(event, dict(task))
+            except Exception as e:
+                print(f"[TASK_STORE] Listener error: {e}")
+
+    def create(self, task: Dict):
+        """새 작업 저장 (같은 ID가 있으면 덮어씀)"""
+        raise NotImplementedError
+
+    def create_many(self, tasks: List[Dict]):
+        """작업 여러 개 저장 (백엔드별로 한 번의 잠금/트랜잭션, 변경 이벤트도 한 번에)"""
+        for task in tasks:
+            self.create(task)
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        """ID로 작업 조회"""
+        raise NotImplementedError
+
+    def find(self, statuses: Optional[Iterable[str]] = None,
+             assigned_to: Optional[str] = None) -> List[Dict]:
+        """상태/담당자로 작업 조회"""
+        raise NotImplementedError
+
+    def query(self, query: TaskQuery) -> Dict:
+        """조건/정렬/커서로 작업 한 페이지 조회 - {"tasks": [...], "next_cursor": 다음 페이지 커서 또는 None}"""
+        return select_page(self.find(query.statuses, query.assigned_to), query)
+
+    def iter_query(self, query: TaskQuery) -> Iterator[Dict]:
+        """조건에 맞는 작업 전체를 정렬 순서대로 yield (query.limit은 내부 페이지 크기)"""
+        return iter_pages(self.query, query)
+
+    def transition(self, task_id: str, new_status: str, worker_id: Optional[str] = None, **fields) -> Dict:
+        """작업 상태 변경 (단일 원자적 쓰기)
+
+        worker_id를 주면 그 워커가 claim한 작업만 옮기고, lease를 잃었으면 LeaseLostError.
+        """
+        raise NotImplementedError
+
+    def remove(self, task_id: str) -> Optional[Dict]:
+        """작업 삭제 (보관 후 정리용), 삭제한 작업 반환"""
+        raise NotImplementedError
+
+    def count(self, status: str) -> int:
+        """상태별 작업 수"""
+        raise NotImplementedError
+
+    def version(self, statuses: Optional[Iterable[str]] = None) -> Hashable:
+        """변경 감지용 값 - 이전 값과 같으면 그 사이 해당 상태의 작업이 바뀌지 않았음"""
+        raise NotImplementedError
+
+    def claim(self, task_id: str, worker_id: str, **fields) -> Optional[Dict]:
+        """pending 작업을 워커 소유 in_progress로 원자적 선점 (다른 워커가 먼저 가져갔으면 None)"""
+        raise NotImplementedError
+
+    def renew_lease(self, worker_id: str):
+        """워커 lease 연장"""
+        raise NotImplementedError
+
+    def release_lease(self, worker_id: str):
+        """워커 lease 반납 (정상 종료시)"""
+        raise NotImplementedError
+
+    def reap_expired_leases(self, max_retries: int = MAX_TASK_RETRIES) -> List[Dict]:
+        """lease가 만료된 워커의 작업을 pending(재시도 횟수 +1) 또는 dead_letter로 옮기고 옮긴 작업 목록 반환"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class FileTaskStore(TaskStore):
+    """tasks/<status>/<id>.json 파일 레이아웃 저장소
+
+    디렉토리 mtime이 바뀐 경우에만 다시 스캔하고, 이미 아는 파일은 다시 파싱하지 않는다.
+    상태 변경은 os.rename 한 번으로 확정되며, 파일 위치가 상태의 기준이 된다.
+    claim된 작업은 in_progress/<worker_id>/<id>.json 에 있고, 워커 lease는
+    leases/<worker_id>.lease 파일의 mtime으로 갱신된다.
+    """
+
+    def __init__(self, tasks_dir: Path, lease_seconds: float = 60, codec: Optional[Codec] = None):
+        self.tasks_dir = Path(tasks_dir)
+        self.lease_seconds = lease_seconds
+        # 쓰기 형식 (읽기는 형식 자동 판별이라 기존 pretty JSON 파일과 섞여 있어도 됨)
+        self.codec = codec or get_codec()
+        for status in ["pending", "in_progress", "completed"]:
+            (self.tasks_dir / status).mkdir(parents=True, exist_ok=True)
+
+        self.index = TaskIndex()
+        self._locations: Dict[str, Path] = {}
+        self._dir_mtimes: Dict[Path, int] = {}
+        self._dir_names: Dict[Path, set] = defaultdict(set)
+        self._subdirs: Dict[Path, set] = defaultdict(set)
+        self._lock = threading.RLock()
+
+    def _path(self, status: str, task_id: str) -> Path:
+        return self.tasks_dir / status / f"{task_id}.json"
+
+    def _claim_path(self, worker_id: str, task_id: str) -> Path:
+        return self.tasks_dir / "in_progress" / worker_id / f"{task_id}.json"
+
+    def _lease_path(self, worker_id: str) -> Path:
+        return self.tasks_dir / "leases" / f"{worker_id}.lease"
+
+    def _remember(self, task: Dict, path: Path):
+        self._dir_names[path.parent].add(path.name)
+        self._locations[task["id"]] = path
+        self.index.add(task)
+
+    def _forget(self, path: Path):
+        self._dir_names[path.parent].discard(path.name)
+
+    def _scan_dir(self, status: str, directory: Path) -> set:
+        """mtime이 바뀐 디렉토리만 다시 읽어 인덱스 갱신 (하위 디렉토리 이름 반환)"""
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None and self._dir_mtimes.get(directory) == mtime:
+            return self._subdirs[directory]
+
+        scan_started = time.time_ns()
+        names, subdirs = set(), set()
+        if mtime is not None:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.name.endswith(".json"):
+                        names.add(entry.name)
+                    elif entry.is_dir():
+                        subdirs.add(entry.name)
+
+        known = self._dir_names[directory]
+        for name in known - names:
+            task_id = name[:-5]
+            if self._locations.get(task_id) == directory / name:
+                del self._locations[task_id]
+                self.index.remove(task_id)
+
+        complete = True
+        for name in names - known:
+            try:
+                task = decode((directory / name).read_bytes())
+            except (FileNotFoundError, ValueError, EOFError):
+                # 다른 프로세스가 이동/작성 중인 파일 - 다음 스캔에서 다시 확인
+                names.discard(name)
+                complete = False
+                continue
+            task["status"] = status
+            self._locations[task["id"]] = directory / name
+            self.index.add(task)
+        self._dir_names[directory] = names
+        self._subdirs[directory] = subdirs
+
+        # 스캔 직후 같은 mtime 단위 안에서 생긴 변경을 놓치지 않도록 최근 mtime은 캐시하지 않음
+        if complete and mtime is not None and scan_started - mtime > 50_000_000:
+            self._dir_mtimes[directory] = mtime
+        else:
+            self._dir_mtimes.pop(directory, None)
+        return subdirs
+
+    def _candidates(self, task_id: str, hint: Optional[Path]) -> Iterator[Path]:
+        """작업 파일이 있을 수 있는 경로 - 힌트, 알려진 위치, 상태 디렉토리별 경로, 워커별 claim 경로 순"""
+        yield from filter(None, [hint, self._locations.get(task_id)])
+        for status in TASK_STATUSES:
+            yield self._path(status, task_id)
+        try:
+            with os.scandir(self.tasks_dir / "in_progress") as entries:
+                workers = [entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")]
+        except FileNotFoundError:
+            return
+        for worker_id in workers:
+            yield self._claim_path(worker_id, task_id)
+
+    def _locate(self, task_id: str, hint: Optional[Path] = None) -> Optional[Dict]:
+        """작업 파일 하나만 찾아 다시 읽고 인덱스 갱신 (상태 디렉토리 전체를 다시 훑지 않음)
+
+        알려진 위치에 있으면 파일 한 번 읽기, 다른 프로세스가 옮겼으면 상태 수만큼 경로 확인
+        """
+        known = self._locations.get(task_id)
+        seen = set()
+        for path in self._candidates(task_id, hint):
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                task = decode(path.read_bytes())
+            except (FileNotFoundError, ValueError, EOFError):
+                continue
+            task["status"] = path.relative_to(self.tasks_dir).parts[0]
+            if known is not None and known != path:
+                self._forget(known)
+            # 바뀌지 않은 작업은 인덱스를 건드리지 않음 (상태별 version이 헛되이 오르지 않도록)
+            if known != path or self.index.get(task_id) != task:
+                self._remember(task, path)
+            return task
+        if known is not None:
+            self._forget(known)
+            del self._locations[task_id]
+            self.index.remove(task_id)
+        return None
+
+    def _scan(self, status: str):
+        """상태 디렉토리와 워커별 하위 디렉토리 동기화"""
+        status_dir = self.tasks_dir / status
+        previous = set(self._subdirs[status_dir])
+        for sub in sorted(self._scan_dir(status, status_dir) | previous):
+            self._scan_dir(status, status_dir / sub)
+
+    def refresh(self, statuses: Optional[Iterable[str]] = None):
+        """상태 디렉토리 동기화 (지정하지 않으면 전체)"""
+        with self._lock:
+            for status in (TASK_STATUSES if statuses is None else statuses):
+                self._scan(status)
+
+    def create(self, task: Dict):
+        with self._lock:
+            path = self._path(task["status"], task["id"])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, self.codec.encode(task))
+            self._remember(dict(task), path)
+        self._emit("created", task)
+
+    def create_many(self, tasks: List[Dict]):
+        with self._lock:
+            for status in {task["status"] for task in tasks}:
+                (self.tasks_dir / status).mkdir(parents=True, exist_ok=True)
+            for task in tasks:
+                path = self._path(task["status"], task["id"])
+                write_atomic(path, self.codec.encode(task))
+                self._remember(dict(task), path)
+        self._emit_many("created", tasks)
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        with self._lock:
+            task = self._locate(task_id)
+            return dict(task) if task else None
+
+    def find(self, statuses: Optional[Iterable[str]] = None,
+             assigned_to: Optional[str] = None) -> List[Dict]:
+        with self._lock:
+            # 요청한 상태 디렉토리만 동기화 (completed 이력 전체를 읽지 않도록)
+            statuses = None if statuses is None else list(statuses)
+            self.refresh(statuses)
+            return [dict(task) for task in self.index.select(statuses, assigned_to)]
+
+    def query(self, query: TaskQuery) -> Dict:
+        return _query_index(self._lock, self.index, query, self.refresh)
+
+    def iter_query(self, query: TaskQuery) -> Iterator[Dict]:
+        return _iter_index(self._lock, self.index, query, self.refresh)
+
+    def transition(self, task_id: str, new_status: str, worker_id: Optional[str] = None, **fields) -> Dict:
+        with self._lock:
+            claim_path = self._claim_path(worker_id, task_id) if worker_id else None
+            task = self._locate(task_id, claim_path)
+            if not task:
+                raise ValueError(f"Task {task_id} not found")
+            old_path = claim_path or self._locations[task_id]
+
+            new_path = self._path(new_status, task_id)
+            new_path.parent.mkdir(parents=True, exist_ok=True)
+            # rename 한 번으로 상태 확정 (다른 프로세스가 먼저 옮겼다면 FileNotFoundError)
+            try:
+                os.rename(old_path, new_path)
+            except FileNotFoundError:
+                if worker_id:
+                    raise LeaseLostError(f"{worker_id} no longer holds task {task_id}")
+                raise
+            self._forget(old_path)
+
+            updated = dict(task, **fields)
+            updated["status"] = new_status
+            write_atomic(new_path, self.codec.encode(updated))
+            self._remember(updated, new_path)
+        self._emit(new_status, updated)
+        return dict(updated)
+
+    def remove(self, task_id: str) -> Optional[Dict]:
+        with self._lock:
+            if self._locate(task_id) is None:
+                return None
+            path = self._locations.pop(task_id)
+            task = self.index.remove(task_id)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            self._forget(path)
+            return task
+
+    def count(self, status: str) -> int:
+        """상태 디렉토리의 작업 파일 수 - 이름만 세고 내용은 읽지 않음 (in_progress는 워커별 하위 디렉토리 포함)"""
+        total = 0
+        status_dir = self.tasks_dir / status
+        try:
+            with os.scandir(status_dir) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.name.endswith(".json"):
+                        total += 1
+                    elif entry.is_dir():
+                        subdirs.append(entry.path)
+        except FileNotFoundError:
+            return 0
+        for subdir in subdirs:
+            try:
+                with os.scandir(subdir) as entries:
+                    total += sum(1 for entry in entries
+                                 if entry.name.endswith(".json") and not entry.name.startswith("."))
+            except FileNotFoundError:
+                continue  # 워커 디렉토리가 방금 정리됨
+        return total
+
+    def version(self, statuses: Optional[Iterable[str]] = None) -> Hashable:
+        with self._lock:
+            statuses = None if statuses is None else list(statuses)
+            self.refresh(statuses)
+            return self.index.versions(statuses)
+
+    def claim(self, task_id: str, worker_id: str, **fields) -> Optional[Dict]:
+        with self._lock:
+            src = self._path("pending", task_id)
+            dst = self._claim_path(worker_id, task_id)
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            self.renew_lease(worker_id)
+            try:
+                os.rename(src, dst)
+            except FileNotFoundError:
+                return None
+            self._forget(src)
+
+            task = dict(decode(dst.read_bytes()), **fields)
+            task["status"] = "in_progress"
+            task["claimed_by"] = worker_id
+            write_atomic(dst, self.codec.encode(task))
+            self._remember(task, dst)
+        self._emit("in_progress", task)
+        return dict(task)
+
+    def renew_lease(self, worker_id: str):
+        lease = self._lease_path(worker_id)
+        lease.parent.mkdir(parents=True, exist_ok=True)
+        lease.touch()
+
+    def release_lease(self, worker_id: str):
+        self._lease_path(worker_id).unlink(missing_ok=True)
+
+    def reap_expired_leases(self, max_retries: int = MAX_TASK_RETRIES) -> List[Dict]:
+        """lease가 만료된 워커의 작업을 pending 또는 dead_letter로 되돌림"""
+        reaped = []
+        in_progress_dir = self.tasks_dir / "in_progress"
+        now = time.time()
+        # 회수는 프로세스 간 잠금 안에서 (여러 워커/서버가 동시에 돌아도 같은 작업을 두 번 옮기지 않음)
+        with self._lock, open(self.tasks_dir / ".reap.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            with os.scandir(in_progress_dir) as entries:
+                workers = [e.name for e in entries if e.is_dir() and not e.name.startswith(".")]
+
+            for worker_id in workers:
+                lease = self._lease_path(worker_id)
+                try:
+                    if lease.stat().st_mtime + self.lease_seconds > now:
+                        continue
+                except FileNotFoundError:
+                    pass
+
+                worker_dir = in_progress_dir / worker_id
+                for name in os.listdir(worker_dir):
+                    if name.startswith(".") and name.endswith(".json.reaping"):
+                        private = worker_dir / name  # 이전 회수가 중간에 멈춘 작업
+                    elif not name.startswith(".") and name.endswith(".json"):
+                        # 먼저 숨김 이름으로 rename해 소유권을 가져옴 (워커가 그 사이 완료했으면 FileNotFoundError)
+                        private = worker_dir / f".{name}.reaping"
+                        try:
+                            os.rename(worker_dir / name, private)
+                        except FileNotFoundError:
+                            continue
+                        self._forget(worker_dir / name)
+                    else:
+                        continue
+                    try:
+                        task = _reaped(decode(private.read_bytes()), max_retries)
+                    except (ValueError, EOFError):
+                        continue  # 깨진 파일은 숨김 이름으로 남겨 둠
+                    path = self._path(task["status"], task["id"])
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    write_atomic(path, self.codec.encode(task))
+                    private.unlink()
+                    self._remember(task, path)
+                    reaped.append(task)
+                try:
+                    worker_dir.rmdir()
+                    lease.unlink(missing_ok=True)
+                except OSError:
+                    pass
+        for task in reaped:
+            self._emit(task["status"], task)
+        return reaped
+
+
+class SQLiteTaskStore(TaskStore):
+    """WAL 모드 SQLite 저장소 (id / 담당자 / 상태 B-tree 인덱스, 워커 lease 테이블)"""
+
+    def __init__(self, db_path: Path, lease_seconds: float = 60):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self._lock = threading.RLock()
+        self._writes = 0  # 이 연결에서의 쓰기 횟수 (다른 연결의 쓰기는 PRAGMA data_version)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                    isolation_level=None, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                assigned_to TEXT NOT NULL,
+                status TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT,
+                data TEXT NOT NULL,
+                claimed_by TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_assignee_status ON tasks(assigned_to, status);
+            CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+            CREATE TABLE IF NOT EXISTS leases (
+                worker_id TEXT PRIMARY KEY,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS status_versions (
+                status TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            );
+            CREATE TRIGGER IF NOT EXISTS tasks_replace_version BEFORE INSERT ON tasks BEGIN
+                UPDATE status_versions SET version = version + 1
+                    WHERE status = (SELECT status FROM tasks WHERE id = NEW.id);
+            END;
+            CREATE TRIGGER IF NOT EXISTS tasks_insert_version AFTER INSERT ON tasks BEGIN
+                INSERT INTO status_versions (status, version) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET version = version + 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS tasks_update_version AFTER UPDATE ON tasks BEGIN
+                UPDATE status_versions SET version = version + 1 WHERE status = OLD.status;
+                INSERT INTO status_versions (status, version) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET version = version + 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS tasks_delete_version AFTER DELETE ON tasks BEGIN
+                UPDATE status_versions SET version = version + 1 WHERE status = OLD.status;
+            END;
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(tasks)")}
+        if "claimed_by" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN claimed_by TEXT")
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (여러 프로세스가 동시에 claim해도 한 쪽만 성공)"""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+                self.conn.execute("COMMIT")
+                self._writes += 1
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _row_values(self, task: Dict):
+        return (task["id"], task["assigned_to"], task["status"], task.get("priority", 0),
+                task.get("updated_at"), json.dumps(task),
+                task.get("claimed_by") if task["status"] == "in_progress" else None)
+
+    def _update(self, conn, task: Dict):
+        conn.execute(
+            "UPDATE tasks SET status = ?, priority = ?, updated_at = ?, data = ?, claimed_by = ? WHERE id = ?",
+            self._row_values(task)[2:] + (task["id"],)
+        )
+
+    def create(self, task: Dict):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tasks (id, assigned_to, status, priority, updated_at, data, claimed_by) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row_values(task)
+            )
+            self._writes += 1
+        self._emit("created", task)
+
+    def create_many(self, tasks: List[Dict]):
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO tasks (id, assigned_to, status, priority, updated_at, data, claimed_by) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self._row_values(task) for task in tasks]
+            )
+        self._emit_many("created", tasks)
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self.conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, statuses: Optional[Iterable[str]] = None,
+             assigned_to: Optional[str] = None) -> List[Dict]:
+        clauses, params = [], []
+        if statuses is not None:
+            statuses = list(statuses)
+            clauses.append(f"status IN ({','.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if assigned_to is not None:
+            clauses.append("assigned_to = ?")
+            params.append(assigned_to)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self.conn.execute(f"SELECT data FROM tasks{where}", params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    # 정렬 키 → SQL 식 (값이 없으면 TaskQuery.sort_key와 같은 기본값)
+    _SORT_COLUMNS = {"created_at": "COALESCE(json_extract(data, '$.created_at'), '')",
+                     "updated_at": "COALESCE(updated_at, '')", "priority": "priority", "id": "id"}
+
+    def _query_sql(self, query: TaskQuery, paged: bool):
+        """조건/정렬을 SQL로 (상태/담당자/우선순위/수정 시각은 인덱스 컬럼, 나머지는 JSON 필드)"""
+        clauses, params = [], []
+        if query.statuses is not None:
+            clauses.append(f"status IN ({','.join('?' * len(query.statuses))})")
+            params.extend(query.statuses)
+        for sql, value in [("assigned_to = ?", query.assigned_to),
+                           ("priority >= ?", query.min_priority), ("priority <= ?", query.max_priority),
+                           ("COALESCE(json_extract(data, '$.created_at'), '') >= ?", query.created_after),
+                           ("COALESCE(json_extract(data, '$.created_at'), '') < ?", query.created_before),
+                           ("COALESCE(updated_at, '') >= ?", query.updated_after),
+                           ("COALESCE(updated_at, '') < ?", query.updated_before)]:
+            if value is not None:
+                clauses.append(sql)
+                params.append(value)
+        if query.text:
+            clauses.append("instr(lower(COALESCE(json_extract(data, '$.title'), '')), lower(?)) > 0")
+            params.append(query.text)
+        column = self._SORT_COLUMNS[query.sort_field]
+        if query.cursor:
+            clauses.append(f"({column}, id) {'<' if query.descending else '>'} (?, ?)")
+            params.extend(decode_cursor(query.cursor))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "DESC" if query.descending else "ASC"
+        sql = f"SELECT data FROM tasks{where} ORDER BY {column} {order}, id {order}"
+        if paged:
+            sql += " LIMIT ?"
+            params.append(query.limit + 1)
+        return sql, params
+
+    def query(self, query: TaskQuery) -> Dict:
+        sql, params = self._query_sql(query, paged=True)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        tasks = [json.loads(row[0]) for row in rows]
+        return make_page([(query.sort_key(task), task) for task in tasks], query)
+
+    def iter_query(self, query: TaskQuery) -> Iterator[Dict]:
+        """별도 읽기 연결에서 한 번의 SELECT를 query.limit개씩 읽음 (WAL 스냅샷, 쓰기 잠금을 잡지 않음)"""
+        sql, params = self._query_sql(query, paged=False)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(query.limit)
+                if not rows:
+                    return
+                for row in rows:
+                    yield json.loads(row[0])
+        finally:
+            conn.close()
+
+    def transition(self, task_id: str, new_status: str, worker_id: Optional[str] = None, **fields) -> Dict:
+        with self._transaction() as conn:
+            if worker_id:
+                row = conn.execute(
+                    "SELECT data FROM tasks WHERE id = ? AND status = 'in_progress' AND claimed_by = ?",
+                    (task_id, worker_id)
+                ).fetchone()
+                if not row:
+                    raise LeaseLostError(f"{worker_id} no longer holds task {task_id}")
+            else:
+                row = conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+                if not row:
+                    raise ValueError(f"Task {task_id} not found")
+            task = dict(json.loads(row[0]), **fields)
+            task["status"] = new_status
+            self._update(conn, task)
+        self._emit(new_status, task)
+        return task
+
+    def remove(self, task_id: str) -> Optional[Dict]:
+        with self._transaction() as conn:
+            row = conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            if not row:
+                return None
+            conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        return json.loads(row[0])
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM tasks WHERE status = ?", (status,)).fetchone()[0]
+
+    def version(self, statuses: Optional[Iterable[str]] = None) -> Hashable:
+        with self._lock:
+            if statuses is None:
+                return (self.conn.execute("PRAGMA data_version").fetchone()[0], self._writes)
+            # 상태별 변경 횟수는 트리거가 같은 트랜잭션에서 올림 (다른 프로세스의 쓰기 포함)
+            statuses = list(statuses)
+            rows = dict(self.conn.execute(
+                f"SELECT status, version FROM status_versions WHERE status IN ({', '.join('?' * len(statuses))})",
+                statuses
+            ).fetchall())
+            return tuple(rows.get(status, 0) for status in statuses)
+
+    def claim(self, task_id: str, worker_id: str, **fields) -> Optional[Dict]:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT data FROM tasks WHERE id = ? AND status = 'pending'", (task_id,)
+            ).fetchone()
+            if not row:
+                return None
+            task = dict(json.loads(row[0]), **fields)
+            task["status"] = "in_progress"
+            task["claimed_by"] = worker_id
+            self._update(conn, task)
+            conn.execute("INSERT OR REPLACE INTO leases (worker_id, expires_at) VALUES (?, ?)",
+                         (worker_id, time.time() + self.lease_seconds))
+        self._emit("in_progress", task)
+        return task
+
+    def renew_lease(self, worker_id: str):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO leases (worker_id, expires_at) VALUES (?, ?)",
+                              (worker_id, time.time() + self.lease_seconds))
+
+    def release_lease(self, worker_id: str):
+        with self._lock:
+            self.conn.execute("DELETE FROM leases WHERE worker_id = ?", (worker_id,))
+
+    def reap_expired_leases(self, max_retries: int = MAX_TASK_RETRIES) -> List[Dict]:
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT data FROM tasks WHERE status = 'in_progress' AND claimed_by IS NOT NULL "
+                "AND claimed_by NOT IN (SELECT worker_id FROM leases WHERE expires_at > ?)",
+                (now,)
+            ).fetchall()
+            reaped = []
+            for (data,) in rows:
+                task = _reaped(json.loads(data), max_retries)
+                self._update(conn, task)
+                reaped.append(task)
+            conn.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+        for task in reaped:
+            self._emit(task["status"], task)
+        return reaped
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class MemoryTaskStore(TaskStore):
+    """인메모리 저장소 (디스크 I/O 없음, 같은 프로세스에서 인스턴스를 공유해야 함)"""
+
+    def __init__(self, lease_seconds: float = 60):
+        self.lease_seconds = lease_seconds
+        self.index = TaskIndex()
+        self._leases: Dict[str, float] = {}  # worker_id → 만료 시각
+        self._lock = threading.RLock()
+
+    def create(self, task: Dict):
+        with self._lock:
+            self.index.add(dict(task))
+        self._emit("created", task)
+
+    def create_many(self, tasks: List[Dict]):
+        with self._lock:
+            for task in tasks:
+                self.index.add(dict(task))
+        self._emit_many("created", tasks)
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        with self._lock:
+            task = self.index.get(task_id)
+            return dict(task) if task else None
+
+    def find(self, statuses: Optional[Iterable[str]] = None,
+             assigned_to: Optional[str] = None) -> List[Dict]:
+        with self._lock:
+            return [dict(task) for task in self.index.select(statuses, assigned_to)]
+
+    def query(self, query: TaskQuery) -> Dict:
+        return _query_index(self._lock, self.index, query)
+
+    def iter_query(self, query: TaskQuery) -> Iterator[Dict]:
+        return _iter_index(self._lock, self.index, query)
+
+    def transition(self, task_id: str, new_status: str, worker_id: Optional[str] = None, **fields) -> Dict:
+        with self._lock:
+            task = self.index.get(task_id)
+            if worker_id and not (task and task["status"] == "in_progress" and task.get("claimed_by") == worker_id):
+                raise LeaseLostError(f"{worker_id} no longer holds task {task_id}")
+            if not task:
+                raise ValueError(f"Task {task_id} not found")
+            updated = dict(task, **fields)
+            updated["status"] = new_status
+            self.index.add(updated)
+        self._emit(new_status, updated)
+        return dict(updated)
+
+    def remove(self, task_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self.index.remove(task_id)
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            return self.index.count(status)
+
+    def version(self, statuses: Optional[Iterable[str]] = None) -> Hashable:
+        with self._lock:
+            return self.index.versions(statuses)
+
+    def claim(self, task_id: str, worker_id: str, **fields) -> Optional[Dict]:
+        with self._lock:
+            task = self.index.get(task_id)
+            if not task or task["status"] != "pending":
+                return None
+            task = dict(task, **fields)
+            task["status"] = "in_progress"
+            task["claimed_by"] = worker_id
+            self.index.add(task)
+            self._leases[worker_id] = time.time() + self.lease_seconds
+        self._emit("in_progress", task)
+        return dict(task)
+
+    def renew_lease(self, worker_id: str):
+        with self._lock:
+            self._leases[worker_id] = time.time() + self.lease_seconds
+
+    def release_lease(self, worker_id: str):
+        with self._lock:
+            self._leases.pop(worker_id, None)
+
+    def reap_expired_leases(self, max_retries: int = MAX_TASK_RETRIES) -> List[Dict]:
+        now = time.time()
+        reaped = []
+        with self._lock:
+            for task in self.index.select(["in_progress"]):
+                worker_id = task.get("claimed_by")
+                if worker_id and self._leases.get(worker_id, 0) <= now:
+                    task = _reaped(task, max_retries)
+                    self.index.add(task)
+                    reaped.append(task)
+            self._leases = {worker_id: expires for worker_id, expires in self._leases.items() if expires > now}
+        for task in reaped:
+            self._emit(task["status"], task)
+        return [dict(task) for task in reaped]
+
+
+def open_task_store(workspace_dir: Path, backend: str = "file", codec: Optional[Codec] = None,
+                    **options) -> TaskStore:
+    """백엔드 이름으로 작업 저장소 생성 ("file" | "sqlite" | "memory", codec은 file에만 적용)"""
+    workspace_dir = Path(workspace_dir)
+    if backend == "file":
+        return FileTaskStore(workspace_dir / "tasks", codec=codec, **options)
+    if backend == "sqlite":
+        return SQLiteTaskStore(workspace_dir / "tasks.db", **options)
+    if backend == "memory":
+        return MemoryTaskStore(**options)
+    raise ValueError(f"Unknown task store backend: {backend}")
+
+
+def copy_tasks(source: TaskStore, target: TaskStore) -> int:
+    """저장소 간 작업 복사 (예: SQLite → 파일 레이아웃 내보내기)"""
+    copied = 0
+    for task in source.find():
+        target.create(task)
+        copied += 1
+    return copied
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Transport - 실시간 알림 전송 (Redis pub/sub 또는 프로세스 내 가짜 브로커)
+
+- publish()는 큐에 넣기만 하고 바로 반환, 같은 이벤트 루프 tick에 들어온 알림은 한 번에 전송
+  (Redis는 pipeline 한 번, round trip 1회)
+- RedisTransport: 크기가 제한된 커넥션 풀, 연결이 끊기면 지수 백오프로 재연결
+- FakeBroker/FakeTransport: Redis 없이 pub/sub 경로 전체를 테스트/부하 측정
+- 알림은 보조 수단이므로(작업/메시지 원본은 파일) 전송 실패분은 버리고 dropped로 집계
+- subscribe(): 구독자별 크기 제한 큐 - 가득 차면 가장 오래된 알림을 버리고,
+  같은 제품의 spec_update처럼 최신 값만 의미 있는 알림은 큐 안에서 합침
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from metrics import LATENCY_BUCKETS, histogram
+
+DEFAULT_REDIS_URL = "redis://localhost"
+
+PUBLISH_LATENCY = histogram("claudeteam_publish_seconds", "알림 예약부터 배치 전송 완료까지 (배치당 가장 오래 기다린 알림 기준)",
+                            ["backend"], buckets=LATENCY_BUCKETS)
+
+
+def _encode(message: Union[str, bytes, Dict]) -> Union[str, bytes]:
+    return message if isinstance(message, (str, bytes)) else json.dumps(message)
+
+
+def default_coalesce_key(channel: str, message: Any) -> Optional[Tuple]:
+    """합칠 수 있는 알림의 키 (None이면 합치지 않음)"""
+    if isinstance(message, dict) and message.get("type") == "spec_update":
+        return (channel, "spec_update", message.get("product"))
+    return None
+
+
+class Subscription:
+    """구독자별 알림 큐 (크기 제한 + drop/coalesce 정책 + 지연 통계)
+
+    policy:
+      "coalesce"    - 같은 키의 알림이 큐에 있으면 그 자리에서 최신 값으로 교체, 가득 차면 가장 오래된 것 버림
+      "drop_oldest" - 가득 차면 가장 오래된 알림 버림
+      "drop_newest" - 가득 차면 새 알림 버림
+    """
+
+    POLICIES = ("coalesce", "drop_oldest", "drop_newest")
+
+    def __init__(self, channels: List[str], maxsize: int = 100, policy: str = "coalesce",
+                 coalesce_key: Callable = default_coalesce_key):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown subscription policy: {policy}")
+        self.channels = list(channels)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.coalesce_key = coalesce_key
+
+        self._queue: Deque[List] = deque()  # [channel, message, enqueued_at, key]
+        self._by_key: Dict[Tuple, List] = {}
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+
+    def put(self, channel: str, message: Any):
+        """알림 추가 (브로커/리더에서 호출, 블로킹 없음)"""
+        self.received += 1
+        now = time.monotonic()
+        key = self.coalesce_key(channel, message) if self.policy == "coalesce" else None
+        if key is not None and key in self._by_key:
+            # 큐에서의 위치(도착 순서)와 최초 도착 시각은 유지하고 내용만 최신으로
+            self._by_key[key][1] = message
+            self.coalesced += 1
+            return
+
+        if len(self._queue) >= self.maxsize:
+            if self.policy == "drop_newest":
+                self.dropped += 1
+                return
+            oldest = self._queue.popleft()
+            if oldest[3] is not None:
+                del self._by_key[oldest[3]]
+            self.dropped += 1
+
+        entry = [channel, message, now, key]
+        self._queue.append(entry)
+        if key is not None:
+            self._by_key[key] = entry
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._ready.set()
+
+    def _pop(self) -> Tuple[str, Any]:
+        channel, message, enqueued_at, key = self._queue.popleft()
+        if key is not None:
+            del self._by_key[key]
+        if not self._queue:
+            self._ready.clear()
+        lag = time.monotonic() - enqueued_at
+        self._lag_total += lag
+        self._lag_max = max(self._lag_max, lag)
+        self.delivered += 1
+        return channel, message
+
+    def get_nowait(self) -> Optional[Tuple[str, Any]]:
+        """(채널, 알림) 또는 큐가 비었으면 None"""
+        return self._pop() if self._queue else None
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Tuple[str, Any]]:
+        """다음 알림 대기 → (채널, 알림), timeout이 지나거나 구독이 닫히면 None"""
+        while not self._queue:
+            if self.closed:
+                return None
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._pop()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    def close(self):
+        self.closed = True
+        self._ready.set()
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def metrics(self) -> Dict:
+        """큐 길이와 지연 (lag = 도착 후 꺼내기까지 걸린 시간)"""
+        oldest = time.monotonic() - self._queue[0][2] if self._queue else 0.0
+        return {
+            "channels": self.channels,
+            "policy": self.policy,
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "received": self.received,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "oldest_lag_ms": round(oldest * 1000, 3),
+            "avg_lag_ms": round(self._lag_total / self.delivered * 1000, 3) if self.delivered else None,
+            "max_lag_ms": round(self._lag_max * 1000, 3),
+        }
+
+
+def _decode_message(data: Union[str, bytes]) -> Any:
+    try:
+        return json.loads(data)
+    except (TypeError, ValueError):
+        return data
+
+
+class Transport:
+    """tick 단위로 알림을 모아 보내는 전송 계층"""
+
+    def __init__(self, max_pending: int = 10000):
+        self.max_pending = max_pending
+        self._pending: Deque[Tuple[str, Union[str, bytes]]] = deque()
+        self._flush_scheduled = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._queued_at = 0.0  # 대기 중인 알림 중 가장 오래된 것의 예약 시각
+        self.sent = 0
+        self.batches = 0
+        self.dropped = 0
+        self.subscriptions: List[Subscription] = []
+
+    @property
+    def connected(self) -> bool:
+        return True
+
+    def subscribe(self, channels: List[str], maxsize: int = 100, policy: str = "coalesce",
+                  coalesce_key: Callable = default_coalesce_key) -> Subscription:
+        """채널 구독 (이벤트 루프 안에서 호출)"""
+        subscription = Subscription(channels, maxsize=maxsize, policy=policy, coalesce_key=coalesce_key)
+        self.subscriptions.append(subscription)
+        self._attach(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscription.close()
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            self._detach(subscription)
+
+    def _attach(self, subscription: Subscription):
+        raise NotImplementedError
+
+    def _detach(self, subscription: Subscription):
+        pass
+
+    def _route(self, channel: str, message: Any) -> int:
+        """받은 알림을 해당 채널 구독자들에게 전달"""
+        delivered = 0
+        for subscription in self.subscriptions:
+            if channel in subscription.channels:
+                subscription.put(channel, message)
+                delivered += 1
+        return delivered
+
+    def subscription_metrics(self) -> List[Dict]:
+        return [subscription.metrics() for subscription in self.subscriptions]
+
+    def publish(self, channel: str, message: Union[str, bytes, Dict]):
+        """알림 예약 (이벤트 루프 안에서 호출, 블로킹 없음)"""
+        if len(self._pending) >= self.max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+        if not self._pending:
+            self._queued_at = time.perf_counter()
+        self._pending.append((channel, _encode(message)))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            # 현재 tick의 다른 콜백이 모두 publish한 뒤에 전송
+            asyncio.get_running_loop().call_soon(self._start_flush)
+
+    def _start_flush(self):
+        self._flush_task = asyncio.ensure_future(self._flush_pending())
+
+    async def _flush_pending(self):
+        try:
+            while self._pending:
+                batch, queued_at = list(self._pending), self._queued_at
+                self._pending.clear()
+                await self._send(batch)
+                PUBLISH_LATENCY.observe(time.perf_counter() - queued_at, type(self).__name__)
+        finally:
+            self._flush_scheduled = False
+
+    async def _send(self, batch: List[Tuple[str, Union[str, bytes]]]):
+        raise NotImplementedError
+
+    async def flush(self):
+        """예약된 알림을 모두 보낼 때까지 대기"""
+        while self._flush_scheduled:
+            if self._flush_task is None or self._flush_task.done():
+                # call_soon으로 예약된 전송이 아직 시작 전
+                await asyncio.sleep(0)
+            else:
+                await asyncio.shield(self._flush_task)
+
+    async def close(self):
+        await self.flush()
+        for subscription in list(self.subscriptions):
+            self.unsubscribe(subscription)
+
+    def stats(self) -> Dict:
+        return {
+            "backend": type(self).__name__,
+            "connected": self.connected,
+            "sent": self.sent,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "pending": len(self._pending),
+        }
+
+
+class RedisTransport(Transport):
+    """Redis pub/sub 전송 (커넥션 풀 + pipeline + 재연결 백오프)"""
+
+    def __init__(self, url: str = DEFAULT_REDIS_URL, max_connections: int = 8,
+                 backoff_initial: float = 0.5, backoff_max: float = 30.0, max_pending: int = 10000):
+        super().__init__(max_pending=max_pending)
+        import redis.asyncio as aioredis
+        from redis.exceptions import RedisError
+
+        self.url = url
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self._errors = (RedisError, OSError)
+        # 풀이 가득 차면 새로 연결하지 않고 빈 연결을 기다림
+        self._pool = aioredis.BlockingConnectionPool.from_url(url, max_connections=max_connections, timeout=5)
+        self.client = aioredis.Redis(connection_pool=self._pool)
+        self._connected = False
+        self._backoff = backoff_initial
+        self._retry_at = 0.0
+        self.connects = 0
+        self._reader: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    async def connect(self) -> bool:
+        """연결 확인 (실패하면 백오프 시간이 지날 때까지 다시 시도하지 않음)"""
+        if self._connected:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            await self.client.ping()
+        except self._errors as e:
+            self._mark_down(e)
+            return False
+        if self.connects:
+            print(f"[TRANSPORT] Reconnected to {self.url}")
+        self._connected = True
+        self._backoff = self.backoff_initial
+        self.connects += 1
+        return True
+
+    def _mark_down(self, error: Exception):
+        if self._connected:
+            print(f"[TRANSPORT] Redis connection lost: {error}")
+        self._connected = False
+        self._retry_at = time.monotonic() + self._backoff * random.uniform(0.5, 1.0)
+        self._backoff = min(self._backoff * 2, self.backoff_max)
+
+    async def _send(self, batch):
+        # 서버 재시작 후 풀에 남은 끊긴 연결로 실패할 수 있으므로 한 번은 바로 다시 시도
+        for retry in (False, True):
+            if not await self.connect():
+                break
+            try:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for channel, message in batch:
+                        pipe.publish(channel, message)
+                    await pipe.execute()
+            except self._errors as e:
+                if retry:
+                    self._mark_down(e)
+                continue
+            self.sent += len(batch)
+            self.batches += 1
+            return
+        self.dropped += len(batch)
+
+    def _attach(self, subscription: Subscription):
+        # 구독 변경은 리더 루프가 다음 폴링(최대 1초) 때 반영
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.ensure_future(self._read_loop())
+
+    async def _close_pubsub(self, pubsub):
+        try:
+            await (getattr(pubsub, "aclose", None) or pubsub.close)()
+        except self._errors:
+            pass
+
+    async def _read_loop(self):
+        """구독 중인 채널의 알림을 받아 구독자 큐로 전달 (연결이 끊기면 백오프 후 다시 구독)"""
+        pubsub, subscribed = None, set()
+        try:
+            while self.subscriptions:
+                wanted = {channel for subscription in self.subscriptions for channel in subscription.channels}
+                try:
+                    if pubsub is None:
+                        if not await self.connect():
+                            await asyncio.sleep(max(self._retry_at - time.monotonic(), 0.1))
+                            continue
+                        pubsub, subscribed = self.client.pubsub(ignore_subscribe_messages=True), set()
+                    if wanted - subscribed:
+                        await pubsub.subscribe(*(wanted - subscribed))
+                    if subscribed - wanted:
+                        await pubsub.unsubscribe(*(subscribed - wanted))
+                    subscribed = wanted
+
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message["type"] == "message":
+                        channel = message["channel"]
+                        if isinstance(channel, bytes):
+                            channel = channel.decode()
+                        self._route(channel, _decode_message(message["data"]))
+                except self._errors as e:
+                    self._mark_down(e)
+                    if pubsub is not None:
+                        await self._close_pubsub(pubsub)
+                    pubsub = None
+        finally:
+            if pubsub is not None:
+                await self._close_pubsub(pubsub)
+
+    async def close(self):
+        await super().close()
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        await self._pool.disconnect()
+
+
+class FakeBroker:
+    """프로세스 내 pub/sub 브로커 (Redis 대용, 여러 FakeTransport가 공유 가능)"""
+
+    def __init__(self):
+        self._transports: List["FakeTransport"] = []
+
+    def publish(self, channel: str, message: Any) -> int:
+        """받은 구독 수 반환 (Redis PUBLISH와 같음)"""
+        message = _decode_message(message)
+        return sum(transport._route(channel, message) for transport in self._transports)
+
+
+class FakeTransport(Transport):
+    """FakeBroker로 전송 (latency를 주면 배치마다 네트워크 왕복 시간을 흉내냄)"""
+
+    def __init__(self, broker: Optional[FakeBroker] = None, latency: float = 0.0, max_pending: int = 10000):
+        super().__init__(max_pending=max_pending)
+        self.broker = broker or FakeBroker()
+        self.broker._transports.append(self)
+        self.latency = latency
+
+    def _attach(self, subscription: Subscription):
+        pass
+
+    async def _send(self, batch):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for channel, message in batch:
+            self.broker.publish(channel, message)
+        self.sent += len(batch)
+        self.batches += 1
+
+
+async def open_transport(url: str = DEFAULT_REDIS_URL) -> Optional[Transport]:
+    """URL로 전송 계층 생성 ("fake://" → 프로세스 내 브로커, redis 패키지가 없으면 None)"""
+    if url.startswith("fake://"):
+        return FakeTransport()
+    try:
+        transport = RedisTransport(url)
+    except ImportError:
+        return None
+    await transport.connect()
+    return transport
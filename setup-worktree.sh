@@ -7,7 +7,7 @@ echo "
 ╚══════════════════════════════════════════════════════╝
 "
 
-BASE_DIR="/home/jyjjeon/claudeteam-startup"
+BASE_DIR="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}"
 PROJECT_NAME="smartplug-pro"
 GIT_REPO="$BASE_DIR/projects/$PROJECT_NAME"
 
@@ -9,7 +9,10 @@ echo "
 ╚══════════════════════════════════════════════════════╝
 "
 
-BASE_DIR="/home/jyjjeon/claudeteam-startup"
+BASE_DIR="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}"
+# shared-workspace만 tmpfs 등 다른 곳에 두려면 CLAUDETEAM_SHARED_DIR (Python 쪽도 같은 변수를 읽음)
+SHARED_DIR="${CLAUDETEAM_SHARED_DIR:-$BASE_DIR/shared-workspace}"
+export CLAUDETEAM_HOME="$BASE_DIR" CLAUDETEAM_SHARED_DIR="$SHARED_DIR"
 cd $BASE_DIR
 
 # 색상 정의
@@ -67,9 +70,9 @@ fi
 
 # 디렉토리 구조 생성
 echo -e "${BLUE}[SETUP]${NC} 작업 공간 초기화..."
-mkdir -p $BASE_DIR/{shared-workspace,agents,infrastructure,ceo-office}
-mkdir -p $BASE_DIR/shared-workspace/{tasks,specs,messages,reports,status}
-mkdir -p $BASE_DIR/shared-workspace/tasks/{pending,in_progress,completed}
+mkdir -p $SHARED_DIR $BASE_DIR/{agents,infrastructure,ceo-office}
+mkdir -p $SHARED_DIR/{tasks,specs,messages,reports,status}
+mkdir -p $SHARED_DIR/tasks/{pending,in_progress,completed}
 
 # 실행 권한 부여
 chmod +x $BASE_DIR/agents/*.sh
@@ -143,6 +146,7 @@ case $MODE in
         echo "  📊 상태 확인: ./ceo-dashboard.py status"
         echo "  📝 제안서 검토: ./ceo-dashboard.py proposals"
         echo "  📌 작업 할당: ./ceo-dashboard.py assign <agent> <task>"
+        echo "  📦 일괄 할당: ./ceo-dashboard.py assign-batch tasks.jsonl (JSONL/CSV, - 이면 stdin)"
         echo "  💬 메시지: ./ceo-dashboard.py message <agent> <message>"
         echo "  🚨 긴급 회의: ./ceo-dashboard.py meeting <topic>"
         echo ""
@@ -9,7 +9,10 @@ echo "
 ╚══════════════════════════════════════════════════════╝
 "
 
-BASE_DIR="/home/jyjjeon/claudeteam-startup"
+BASE_DIR="${CLAUDETEAM_HOME:-/home/jyjjeon/claudeteam-startup}"
+# shared-workspace만 tmpfs 등 다른 곳에 두려면 CLAUDETEAM_SHARED_DIR (Python 쪽도 같은 변수를 읽음)
+SHARED_DIR="${CLAUDETEAM_SHARED_DIR:-$BASE_DIR/shared-workspace}"
+export CLAUDETEAM_HOME="$BASE_DIR" CLAUDETEAM_SHARED_DIR="$SHARED_DIR"
 cd $BASE_DIR
 
 # 색상 정의
@@ -22,9 +25,9 @@ NC='\033[0m'
 
 # 디렉토리 구조 생성
 echo -e "${BLUE}[SETUP]${NC} 작업 공간 초기화..."
-mkdir -p $BASE_DIR/{shared-workspace,agents,infrastructure,ceo-office,logs}
-mkdir -p $BASE_DIR/shared-workspace/{tasks,specs,messages,reports,status}
-mkdir -p $BASE_DIR/shared-workspace/tasks/{pending,in_progress,completed}
+mkdir -p $SHARED_DIR $BASE_DIR/{agents,infrastructure,ceo-office,logs}
+mkdir -p $SHARED_DIR/{tasks,specs,messages,reports,status}
+mkdir -p $SHARED_DIR/tasks/{pending,in_progress,completed}
 
 # 실행 권한 부여
 chmod +x $BASE_DIR/agents/*.sh
@@ -38,20 +41,40 @@ echo -e "\n${GREEN}[AGENTS]${NC} AI 에이전트 시뮬레이터 시작...\n"
 tmux kill-server 2>/dev/null
 
 # 에이전트 시뮬레이터 시작
-agents=("pm" "hardware" "backend" "frontend" "qa")
-for agent in "${agents[@]}"; do
-    echo -e "${YELLOW}[START]${NC} Starting $agent agent simulator..."
+# SIM_MODE=async 이면 모든 역할을 하나의 프로세스(asyncio 런타임)에서 실행
+#   예) SIM_MODE=async AGENT_CONCURRENCY="pm=1 hardware=1 backend=4 frontend=2 qa=2" ./startup_sim.sh
+# 프로세스 모드에서 POOL_<ROLE>=N 이면 해당 역할의 작업 본문을 N개 프로세스 풀에서 실행
+#   예) POOL_QA=4 POOL_PM=2 ./startup_sim.sh
+SIM_MODE=${SIM_MODE:-process}
+
+if [ "$SIM_MODE" == "async" ]; then
+    echo -e "${YELLOW}[START]${NC} Starting single-process agent runtime... ${AGENT_CONCURRENCY}"
     
     if command -v tmux &> /dev/null; then
-        tmux new-session -d -s "${agent}_claude" "python3 $BASE_DIR/agents/agent_simulator.py $agent"
-        echo "  → tmux 세션 '${agent}_claude'에서 실행 중"
+        tmux new-session -d -s "agents_runtime" "python3 $BASE_DIR/agents/agent_runtime.py $AGENT_CONCURRENCY"
+        echo "  → tmux 세션 'agents_runtime'에서 실행 중"
     else
-        python3 $BASE_DIR/agents/agent_simulator.py $agent > $BASE_DIR/logs/${agent}_claude.log 2>&1 &
+        python3 $BASE_DIR/agents/agent_runtime.py $AGENT_CONCURRENCY > $BASE_DIR/logs/agents_runtime.log 2>&1 &
         echo "  → 백그라운드 프로세스로 실행 중 (PID: $!)"
     fi
-    
-    sleep 1
-done
+else
+    agents=("pm" "hardware" "backend" "frontend" "qa")
+    for agent in "${agents[@]}"; do
+        echo -e "${YELLOW}[START]${NC} Starting $agent agent simulator..."
+        pool_var="POOL_${agent^^}"
+        pool_workers=${!pool_var:-0}
+        
+        if command -v tmux &> /dev/null; then
+            tmux new-session -d -s "${agent}_claude" "python3 $BASE_DIR/agents/agent_simulator.py $agent --pool=$pool_workers"
+            echo "  → tmux 세션 '${agent}_claude'에서 실행 중"
+        else
+            python3 $BASE_DIR/agents/agent_simulator.py $agent --pool=$pool_workers > $BASE_DIR/logs/${agent}_claude.log 2>&1 &
+            echo "  → 백그라운드 프로세스로 실행 중 (PID: $!)"
+        fi
+        
+        sleep 1
+    done
+fi
 
 echo -e "\n${GREEN}✅ 모든 에이전트 시뮬레이터가 시작되었습니다!${NC}\n"
 
@@ -62,6 +85,7 @@ python3 $BASE_DIR/ceo-dashboard.py status
 echo -e "\n${YELLOW}[사용 가능한 명령어]${NC}"
 echo "  📊 상태 확인: python3 ceo-dashboard.py status"
 echo "  📌 작업 할당: python3 ceo-dashboard.py assign <agent> <task>"
+echo "  📦 일괄 할당: python3 ceo-dashboard.py assign-batch tasks.jsonl (JSONL/CSV, - 이면 stdin)"
 echo "  📝 제안서 검토: python3 ceo-dashboard.py proposals"
 echo "  🛑 종료: tmux kill-server"
 echo ""
@@ -73,9 +97,13 @@ echo ""
 echo -e "\n${GREEN}[TEST]${NC} 테스트 작업을 할당하시겠습니까? (y/n)"
 read -r response
 if [ "$response" == "y" ]; then
-    python3 $BASE_DIR/ceo-dashboard.py assign pm_claude "Create SmartPlug Pro initial specification"
-    python3 $BASE_DIR/ceo-dashboard.py assign backend_claude "Design REST API for device management"
-    python3 $BASE_DIR/ceo-dashboard.py assign frontend_claude "Create dashboard mockup"
+    # 한 번의 실행으로 일괄 할당 (작업마다 프로세스를 띄우지 않음)
+    python3 $BASE_DIR/ceo-dashboard.py assign-batch <<'EOF'
+agent,description,priority
+pm_claude,Create SmartPlug Pro initial specification,3
+backend_claude,Design REST API for device management,3
+frontend_claude,Create dashboard mockup,3
+EOF
     echo "✅ 테스트 작업이 할당되었습니다."
 fi
 
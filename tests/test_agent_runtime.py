@@ -0,0 +1,48 @@
+"""AgentRuntime: 워커가 작업의 handler를 실제로 실행하고, 예외는 blocked로 기록해야 함"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "infrastructure"))
+sys.path.insert(0, str(ROOT / "agents"))
+
+from agent_runtime import AgentRuntime
+from config import load_config
+
+
+def _task(task_id, handler, **fields):
+    return dict({"id": task_id, "type": "backend", "title": task_id, "description": "runtime test",
+                 "assigned_to": "backend_claude", "created_by": "pm_claude", "status": "pending", "priority": 3,
+                 "created_at": "2026-10-18T00:00:00", "updated_at": "2026-10-18T00:00:00",
+                 "handler": handler}, **fields)
+
+
+def test_worker_runs_handlers(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLAUDETEAM_REDIS_URL", "fake://")
+    runtime = AgentRuntime(concurrency={"backend": 2}, work_time=0, idle_interval=60,
+                           config=load_config(home=tmp_path, task_backend="memory"))
+    store = runtime.task_store
+
+    async def scenario():
+        runner = asyncio.ensure_future(runtime.run())
+        await asyncio.sleep(0.2)
+        store.create_many([_task("sum", "checksum", cost=10), _task("bad", "no_such_handler"),
+                           _task("sim", "simulate")])
+        for _ in range(200):
+            if not store.count("pending") and not store.count("in_progress"):
+                break
+            await asyncio.sleep(0.02)
+        runner.cancel()
+        try:
+            await runner
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(scenario())
+    assert {task["id"] for task in store.find(["completed"])} == {"sum", "sim"}
+    blocked = store.find(["blocked"])
+    assert [task["id"] for task in blocked] == ["bad"] and "no_such_handler" in blocked[0]["error"]
+    reports = list((runtime.workspace.workspace_dir / "reports").glob("*sum*"))
+    assert reports and "Checksum of sum" in reports[0].read_text()
@@ -0,0 +1,33 @@
+"""Archive: index.json에는 카운터만 두고 ID 조회는 ids.db로"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from archive import Archive
+
+
+def test_add_count_get(tmp_path):
+    archive = Archive(tmp_path)
+    assert archive.add("tasks", [("t1", "2026-01-01", {"n": 1}), ("t2", "2026-01-02", {"n": 2})]) == 2
+    assert archive.add("tasks", [("t1", "2026-01-01", {"n": 1})]) == 0  # 다시 보관해도 한 번만 셈
+
+    assert archive.count("tasks") == 2
+    assert archive.bundles("tasks") == {"2026-01-01": 1, "2026-01-02": 1}
+    assert archive.get("tasks", "t2") == {"n": 2} and archive.get("tasks", "missing") is None
+    assert "ids" not in json.loads((tmp_path / "index.json").read_text())["tasks"]
+    assert [record_id for record_id, _ in archive.records("tasks")] == ["t1", "t2"]
+
+
+def test_migrates_old_ids_map(tmp_path):
+    Archive(tmp_path).add("reports", [("r1", "2026-01-01", {"n": 1})])
+    index = json.loads((tmp_path / "index.json").read_text())
+    index["reports"]["ids"] = {"r1": "2026-01-01"}
+    (tmp_path / "ids.db").unlink()
+    (tmp_path / "index.json").write_text(json.dumps(index))
+
+    archive = Archive(tmp_path)
+    assert archive.get("reports", "r1") == {"n": 1} and archive.count("reports") == 1
+    assert "ids" not in json.loads((tmp_path / "index.json").read_text())["reports"]
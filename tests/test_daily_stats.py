@@ -0,0 +1,21 @@
+"""DailyStats: 날짜를 주지 않은 집계는 주입된 시계의 날짜 기준이어야 함 (가상 시계 시뮬레이션)"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from daily_stats import DailyStats
+
+
+def test_default_day_follows_clock(tmp_path):
+    clock = [datetime(2031, 5, 1, 23, 0)]
+    stats = DailyStats(tmp_path, now=lambda: clock[0])
+    stats.record("completed", {"id": "t1", "assigned_to": "qa_claude"})
+    clock[0] = datetime(2031, 5, 2, 1, 0)
+    stats.record("created", {"id": "t2", "assigned_to": "qa_claude"})
+
+    assert stats.day()["date"] == "2031-05-02" and stats.day()["counts"]["created"] == 1
+    totals = stats.range("2031-05-01")  # end 생략 → 시계 기준 오늘까지
+    assert [day["date"] for day in totals["days"]] == ["2031-05-01", "2031-05-02"]
@@ -0,0 +1,75 @@
+"""JobScheduler: cron 필드 해석, 놓친 실행 보충, jitter 범위 (고정 시계)"""
+
+import asyncio
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from job_scheduler import CronSchedule, JobScheduler
+
+NOW = datetime(2026, 3, 4, 10, 7, 30)  # 수요일
+
+
+def _runs(expr, start=NOW, count=4):
+    schedule, runs, at = CronSchedule(expr), [], start
+    for _ in range(count):
+        at = schedule.next_after(at)
+        runs.append(at.strftime("%a %m-%d %H:%M"))
+    return runs
+
+
+def test_cron_fields():
+    assert _runs("*/10 * * * *") == ["Wed 03-04 10:10", "Wed 03-04 10:20", "Wed 03-04 10:30", "Wed 03-04 10:40"]
+    assert _runs("0 9-11 * * *") == ["Wed 03-04 11:00", "Thu 03-05 09:00", "Thu 03-05 10:00", "Thu 03-05 11:00"]
+    assert _runs("30 8 * * 1-5", count=3) == ["Thu 03-05 08:30", "Fri 03-06 08:30", "Mon 03-09 08:30"]
+    assert _runs("0 0 * * 0,7", count=2) == ["Sun 03-08 00:00", "Sun 03-15 00:00"]  # 0과 7 모두 일요일
+    # 일/요일이 둘 다 제한되면 둘 중 하나만 맞아도 실행
+    assert _runs("0 12 1 * 5", count=3) == ["Fri 03-06 12:00", "Fri 03-13 12:00", "Fri 03-20 12:00"]
+    assert _runs("0 12 1 * 5", start=datetime(2026, 3, 28), count=2) == ["Wed 04-01 12:00", "Fri 04-03 12:00"]
+    assert _runs("15 6 1-10/3 2 *", count=2) == ["Mon 02-01 06:15", "Thu 02-04 06:15"]  # 다음 해 2월
+    assert CronSchedule("0 0 * * *").next_after(datetime(2026, 3, 4)) == datetime(2026, 3, 5)  # dt 자체는 제외
+
+
+@pytest.mark.parametrize("expr", ["* * * *", "60 * * * *", "0 24 * * *", "0 0 0 * *", "0 0 * 13 *", "5-1 * * * *"])
+def test_cron_rejects_invalid(expr):
+    with pytest.raises(ValueError):
+        CronSchedule(expr)
+
+
+def test_catch_up_runs_latest_missed_once(tmp_path):
+    state_file = tmp_path / "state.json"
+    last = (NOW - timedelta(hours=3, minutes=7)).isoformat()
+    state_file.write_text(json.dumps({"hourly": last, "no_catch_up": last}))
+    scheduler = JobScheduler(state_file=state_file, now=lambda: NOW)
+    runs = []
+    job = scheduler.add("hourly", "0 * * * *", lambda: runs.append(1))
+    scheduler.add("no_catch_up", "0 * * * *", lambda: runs.append(2), catch_up=False)
+
+    async def scenario():
+        scheduler._initialize()
+        await job.running
+
+    asyncio.run(scenario())
+    scheduler.executor.shutdown()
+    # 07:00 이후 08, 09, 10시 세 회차를 놓쳤지만 가장 최근 회차로 한 번만
+    assert runs == [1] and job.last_run == datetime(2026, 3, 4, 10, 0)
+    assert json.loads(state_file.read_text())["hourly"] == "2026-03-04T10:00:00"
+    assert job.next_run == datetime(2026, 3, 4, 11, 0)
+
+
+def test_jitter_bounds():
+    scheduler = JobScheduler(now=lambda: NOW, rng=random.Random(7))
+    job = scheduler.add("jittered", "*/5 * * * *", lambda: None, jitter=30)
+    delays = []
+    for _ in range(500):
+        job.plan(NOW, scheduler.rng)
+        delays.append(job.due_at - job.next_run.timestamp())
+    scheduler.executor.shutdown()
+    assert job.next_run == datetime(2026, 3, 4, 10, 10)
+    assert all(0 <= delay <= 30 for delay in delays) and max(delays) - min(delays) > 20
@@ -0,0 +1,37 @@
+"""MessageLog: 아직 커밋하지 않은 수신자의 메시지는 compact로 지워지면 안 됨"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from message_log import MessageLog
+
+
+def _fill(log, topic, count=50):
+    for i in range(count):
+        log.append(topic, {"n": i, "pad": "x" * 40})
+
+
+def test_compact_waits_for_subscribed_consumer(tmp_path):
+    log = MessageLog(tmp_path, segment_bytes=256)
+    log.subscribe("_broadcast", "qa")  # 구독만 하고 아직 읽지 않음
+    _fill(log, "_broadcast")
+    records, offset = log.poll("_broadcast", "pm", max_records=1000)
+    log.commit("_broadcast", "pm", offset)
+
+    assert log.compact("_broadcast") == 0
+    assert [record["n"] for record in log.poll("_broadcast", "qa", max_records=1000)[0]] == list(range(50))
+
+    log.commit("_broadcast", "qa", offset)
+    assert log.compact("_broadcast") > 0
+
+
+def test_compact_waits_for_listed_recipients(tmp_path):
+    log = MessageLog(tmp_path, segment_bytes=256)
+    _fill(log, "backend")
+    assert log.compact("backend", consumers=["backend"]) == 0  # 수신자가 커밋 기록 없이도 보호됨
+    log.subscribe("backend", "backend")
+    log.commit("backend", "backend", 100)
+    log.subscribe("backend", "backend")  # 다시 구독해도 커밋한 위치는 그대로
+    assert log.committed("backend", "backend") == 100
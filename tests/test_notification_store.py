@@ -0,0 +1,66 @@
+"""NotificationStore: 중복 억제, 우선순위별 링 크기 제한, 대량 info 알림 속 긴급 알림"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from notification_store import NotificationStore
+
+
+class Clock:
+    def __init__(self):
+        self.at = datetime(2026, 5, 1, 9, 0)
+
+    def __call__(self):
+        return self.at
+
+    def advance(self, seconds):
+        self.at += timedelta(seconds=seconds)
+
+
+def test_duplicate_key_suppressed_within_window(tmp_path):
+    clock = Clock()
+    store = NotificationStore(tmp_path, dedup_window=60, now=clock)
+    assert store.add("disk full", "high") is not None
+    clock.advance(10)
+    assert store.add("disk full", "high") is None
+    assert store.add("disk full again", "high", key="disk full") is None  # 같은 key
+    assert store.add("disk full", "normal") is not None  # 우선순위가 다르면 별개
+
+    clock.advance(60)
+    entry = store.add("disk full", "high")
+    assert entry["repeated"] == 2  # 창이 지난 뒤 다음 알림에 억제 횟수를 붙임
+    assert [e["message"] for e in store.recent(["high"])] == ["disk full", "disk full"]
+
+
+def test_ring_drops_oldest_past_capacity(tmp_path):
+    clock = Clock()
+    evicted = []
+    store = NotificationStore(tmp_path, capacity=5, now=clock, on_evict=evicted.extend)
+    for i in range(11):
+        clock.advance(1)
+        store.add(f"info {i}", "info")
+
+    # capacity의 두 배를 넘으면 파일을 최근 capacity개로 자름
+    assert [e["message"] for e in store.recent(["info"])] == [f"info {i}" for i in range(10, 5, -1)]
+    assert [e["message"] for e in evicted] == [f"info {i}" for i in range(6)]
+    assert len((tmp_path / "info.jsonl").read_text().splitlines()) == 5
+    # 다른 인스턴스(대시보드)도 잘린 파일을 처음부터 다시 읽음
+    assert [e["seq"] for e in NotificationStore(tmp_path, capacity=5).recent(["info"])] == [11, 10, 9, 8, 7]
+
+
+def test_urgent_survives_info_flood(tmp_path):
+    clock = Clock()
+    store = NotificationStore(tmp_path, capacity=20, now=clock)
+    store.add("server down", "critical")
+    for i in range(500):
+        clock.advance(1)
+        store.add(f"heartbeat {i}", "info")
+
+    assert [e["message"] for e in store.unread()] == ["server down"]
+    assert store.unread_count() == {"critical": 1, "high": 0}
+    assert len(store.recent(["info"])) == 20
+    store.mark_read(["critical"])
+    assert store.unread() == []
@@ -0,0 +1,42 @@
+"""SpecStore: 조회한 스펙을 고쳐 저장하면 새 버전으로 기록되고 캐시는 오염되지 않아야 함"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from config import load_config
+from mcp_server import SharedWorkspaceMCP
+from spec_store import SpecStore
+
+
+def test_get_mutate_save(tmp_path):
+    store = SpecStore(tmp_path / "specs")
+    store.save("plug", {"a": 2, "nested": {"b": 1}})
+
+    spec = store.get("plug")
+    spec["a"] = 99
+    spec["nested"]["b"] = 5
+    assert store.get("plug")["a"] == 2  # 다른 호출자에게 고친 내용이 보이지 않음
+
+    saved = store.save("plug", spec)
+    assert saved["version"] == 2
+    on_disk = json.loads((tmp_path / "specs" / "plug.json").read_text())
+    assert on_disk["a"] == 99 and on_disk["nested"]["b"] == 5
+    assert store.changes_since("plug", 1)["changes"][0]["set"] == [[["a"], 99], [["nested", "b"], 5]]
+
+
+def test_get_product_spec_returns_copy(tmp_path):
+    server = SharedWorkspaceMCP(config=load_config(shared_dir=tmp_path, task_backend="memory"), io_workers=0)
+
+    async def scenario():
+        await server.save_product_spec("plug", {"a": 2})
+        spec = await server.get_product_spec("plug")
+        spec["a"] = 99
+        saved = await server.save_product_spec("plug", spec)
+        return saved, await server.get_product_spec("plug")
+
+    saved, latest = asyncio.run(scenario())
+    assert saved["version"] == 2 and latest["a"] == 99
@@ -0,0 +1,73 @@
+"""TaskScheduler: aging, 마감 시한, lazy 삭제, 저장소 변경 시 재동기화"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from task_queue import TaskScheduler
+from task_store import MemoryTaskStore
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+def _task(task_id, priority=3, created=START, **fields):
+    return dict({"id": task_id, "assigned_to": "backend", "status": "pending", "priority": priority,
+                 "title": task_id, "created_at": created.isoformat()}, **fields)
+
+
+def _scheduler(store=None, at=START):
+    return TaskScheduler(store, aging_seconds=3600, deadline_slack=300, clock=lambda: at.timestamp())
+
+
+def test_aging_overtakes_priority():
+    scheduler = _scheduler()
+    # 우선순위 1 차이 = aging_seconds(1시간) 대기
+    scheduler.push(_task("old_low", priority=3, created=START - timedelta(minutes=90)))
+    scheduler.push(_task("new_high", priority=4, created=START))
+    scheduler.push(_task("recent_low", priority=3, created=START - timedelta(minutes=30)))
+    assert [task["id"] for task in scheduler.ordered("backend")] == ["old_low", "new_high", "recent_low"]
+    assert [scheduler.pop("backend")["id"] for _ in range(3)] == ["old_low", "new_high", "recent_low"]
+    assert scheduler.pop("backend") is None
+
+
+def test_deadline_within_slack_goes_first():
+    scheduler = _scheduler()
+    scheduler.push(_task("urgent_priority", priority=5))
+    scheduler.push(_task("due_soon", priority=1, deadline=(START + timedelta(minutes=4)).isoformat()))
+    scheduler.push(_task("due_later", priority=1, deadline=(START + timedelta(hours=2)).isoformat()))
+    # 마감 5분 전부터는 우선순위와 상관없이 먼저, 마감이 먼 작업은 일반 순서
+    assert [scheduler.pop("backend")["id"] for _ in range(3)] == ["due_soon", "urgent_priority", "due_later"]
+
+
+def test_lazy_deletion_skips_removed_and_replaced():
+    scheduler = _scheduler()
+    for task_id in ["a", "b", "c"]:
+        scheduler.push(_task(task_id, deadline=(START + timedelta(minutes=1)).isoformat()))
+    scheduler.remove("a")
+    scheduler.push(_task("b", priority=1))  # 교체 - 이전 힙 항목(마감 포함)은 꺼낼 때 버림
+    assert scheduler.depth("backend") == 2
+    assert [task["id"] for task in scheduler.ordered("backend")] == ["c", "b"]
+    assert scheduler.pop("backend")["id"] == "c"
+    assert scheduler.pop("backend")["id"] == "b" and scheduler.pop("backend") is None
+    assert scheduler.depth("backend") == 0
+
+
+def test_resync_after_pending_version_changes():
+    store = MemoryTaskStore()
+    store.create_many([_task("t1"), _task("t2", created=START + timedelta(minutes=1))])
+    scheduler = _scheduler(store)
+    scheduler.sync()
+    assert scheduler.depth("backend") == 2
+
+    store.claim("t1", "other-worker")  # 다른 워커가 가져감 → 다음 sync에서 대기열에서 빠짐
+    store.create(_task("t3", created=START + timedelta(minutes=2)))
+    scheduler.sync()
+    assert [task["id"] for task in scheduler.ordered("backend")] == ["t2", "t3"]
+
+    calls = []
+    find = store.find
+    store.find = lambda *args, **kwargs: calls.append(args) or find(*args, **kwargs)
+    scheduler.sync()  # pending 버전이 같으면 저장소를 다시 읽지 않음
+    assert calls == [] and scheduler.depth("backend") == 2
@@ -0,0 +1,79 @@
+"""TaskStore: version(statuses)는 지정한 상태의 작업이 바뀔 때만 달라져야 함"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from task_queue import TaskScheduler
+from task_store import FileTaskStore, MemoryTaskStore, SQLiteTaskStore
+
+
+@pytest.fixture(params=["file", "sqlite", "memory"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileTaskStore(tmp_path / "tasks")
+    if request.param == "sqlite":
+        return SQLiteTaskStore(tmp_path / "tasks.db")
+    return MemoryTaskStore()
+
+
+def _task(task_id, status="pending"):
+    return {"id": task_id, "assigned_to": "backend", "status": status, "priority": 3, "title": task_id}
+
+
+def test_version_per_status(store):
+    store.create_many([_task("t1"), _task("t2"), _task("done", "in_progress")])
+    pending = store.version(["pending"])
+
+    store.transition("done", "completed")
+    assert store.version(["pending"]) == pending  # 다른 상태의 변경은 pending 버전과 무관
+
+    store.claim("t1", "w1")
+    assert store.version(["pending"]) != pending
+
+
+def test_scheduler_skips_resync_on_other_statuses(store):
+    store.create_many([_task("t1"), _task("t2", "in_progress")])
+    scheduler = TaskScheduler(store)
+    scheduler.sync()
+    calls = []
+    find = store.find
+    store.find = lambda *args, **kwargs: calls.append(args) or find(*args, **kwargs)
+
+    store.transition("t2", "completed")
+    scheduler.sync()
+    assert calls == []
+
+    store.create(_task("t3"))
+    scheduler.sync()
+    assert len(calls) == 1 and [task["id"] for task in scheduler.ordered("backend")] == ["t1", "t3"]
+
+
+def test_file_count_reads_names_only(tmp_path):
+    store = FileTaskStore(tmp_path / "tasks")
+    store.create_many([_task("t1"), _task("t2"), _task("t3")])
+    store.claim("t1", "w1")
+    store.transition("t2", "completed")
+    (tmp_path / "tasks" / "completed" / "unreadable.json").write_bytes(b"\x00")
+
+    cold = FileTaskStore(tmp_path / "tasks")
+    assert [cold.count(status) for status in ["pending", "in_progress", "completed", "dead_letter"]] == [1, 1, 2, 0]
+    assert not cold.index.tasks  # 작업 파일을 하나도 읽지 않음
+
+
+def test_file_lookup_reads_one_file(tmp_path):
+    store = FileTaskStore(tmp_path / "tasks")
+    store.create_many([_task(f"done{i}", "completed") for i in range(50)] + [_task("t1")])
+
+    other = FileTaskStore(tmp_path / "tasks")  # 다른 프로세스와 같음
+    assert other.get("t1")["status"] == "pending"
+    other.claim("t1", "w1")
+    assert store.get("t1")["status"] == "in_progress"  # 다른 인스턴스가 옮긴 위치를 찾아감
+    assert store.transition("t1", "completed", worker_id="w1")["status"] == "completed"
+    assert other.get("missing") is None
+    assert set(other.index.tasks) == {"t1"}  # completed 이력은 읽지 않음
+
+    assert other.remove("t1")["id"] == "t1" and store.get("t1") is None
@@ -0,0 +1,42 @@
+"""StoreTaskWatcher: pending 디렉토리가 없는 저장소도 새 작업이 오면 바로 깨어나야 함"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "infrastructure"))
+sys.path.insert(0, str(ROOT / "agents"))
+
+from task_store import MemoryTaskStore, SQLiteTaskStore
+from task_watcher import StoreTaskWatcher
+
+
+def _task(task_id, assigned_to="backend_claude"):
+    return {"id": task_id, "assigned_to": assigned_to, "status": "pending", "priority": 3, "title": task_id}
+
+
+def test_wakes_on_store_events():
+    store = MemoryTaskStore()
+    watcher = StoreTaskWatcher(store, assigned_to="backend_claude", shared=False)
+    assert watcher.mode == "store events"
+
+    store.create(_task("other", assigned_to="qa_claude"))
+    assert not watcher.wait(0.05)  # 다른 담당자의 작업으로는 깨지 않음
+
+    threading.Timer(0.05, store.create, [_task("t1")]).start()
+    started = time.monotonic()
+    assert watcher.wait(5) and time.monotonic() - started < 1
+    watcher.close()
+
+
+def test_sees_other_connections_by_polling(tmp_path):
+    store = SQLiteTaskStore(tmp_path / "tasks.db")
+    watcher = StoreTaskWatcher(store, assigned_to="backend_claude", redis_url="redis://127.0.0.1:1",
+                               redis_channel="agent:backend_claude", poll_interval=0.05)
+    assert watcher.mode == "store events + poll"
+
+    SQLiteTaskStore(tmp_path / "tasks.db").create(_task("t1"))  # 다른 프로세스의 쓰기와 같음
+    assert watcher.wait(2)
+    watcher.close()
@@ -0,0 +1,111 @@
+"""Transport: 구독 큐의 drop/coalesce 정책, 한 tick의 publish를 한 배치로 전송 (FakeBroker)"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "infrastructure"))
+
+from transport import FakeBroker, FakeTransport
+
+
+def _drain(subscription):
+    items = []
+    while True:
+        item = subscription.get_nowait()
+        if item is None:
+            return items
+        items.append(item)
+
+
+def _publish_all(policy, maxsize, messages):
+    async def scenario():
+        transport = FakeTransport(FakeBroker())
+        subscription = transport.subscribe(["events"], maxsize=maxsize, policy=policy)
+        for message in messages:
+            transport.publish("events", message)
+        await transport.flush()
+        items = [message for _, message in _drain(subscription)]
+        await transport.close()
+        return subscription, items
+
+    return asyncio.run(scenario())
+
+
+def test_drop_oldest_keeps_latest_messages():
+    subscription, items = _publish_all("drop_oldest", 3, [{"n": n} for n in range(5)])
+    assert [item["n"] for item in items] == [2, 3, 4]
+    assert subscription.dropped == 2
+
+
+def test_drop_newest_keeps_first_messages():
+    subscription, items = _publish_all("drop_newest", 3, [{"n": n} for n in range(5)])
+    assert [item["n"] for item in items] == [0, 1, 2]
+    assert subscription.dropped == 2
+
+
+def test_coalesce_replaces_in_place_by_key():
+    messages = [
+        {"type": "spec_update", "product": "plug", "rev": 1},
+        {"type": "task", "id": "t1"},
+        {"type": "spec_update", "product": "hub", "rev": 1},
+        {"type": "spec_update", "product": "plug", "rev": 2},
+        {"type": "spec_update", "product": "plug", "rev": 3},
+    ]
+    subscription, items = _publish_all("coalesce", 10, messages)
+    # plug는 처음 도착한 자리에 최신 rev로 하나만 남음
+    assert items == [
+        {"type": "spec_update", "product": "plug", "rev": 3},
+        {"type": "task", "id": "t1"},
+        {"type": "spec_update", "product": "hub", "rev": 1},
+    ]
+    assert subscription.coalesced == 2
+    assert subscription.dropped == 0
+
+
+def test_coalesce_key_released_after_delivery_or_drop():
+    async def scenario():
+        transport = FakeTransport(FakeBroker())
+        subscription = transport.subscribe(["events"], maxsize=2, policy="coalesce")
+        transport.publish("events", {"type": "spec_update", "product": "plug", "rev": 1})
+        await transport.flush()
+        assert _drain(subscription)[0][1]["rev"] == 1
+        # 꺼낸 뒤에 온 같은 키 알림은 새 항목
+        transport.publish("events", {"type": "spec_update", "product": "plug", "rev": 2})
+        transport.publish("events", {"type": "task", "id": "t1"})
+        transport.publish("events", {"type": "task", "id": "t2"})  # 가득 참 → plug rev 2 버림
+        transport.publish("events", {"type": "spec_update", "product": "plug", "rev": 3})
+        await transport.flush()
+        items = [message for _, message in _drain(subscription)]
+        await transport.close()
+        return subscription, items
+
+    subscription, items = asyncio.run(scenario())
+    assert items == [{"type": "task", "id": "t2"}, {"type": "spec_update", "product": "plug", "rev": 3}]
+    assert subscription.coalesced == 0
+    assert subscription.dropped == 2
+
+
+def test_publishes_in_one_tick_sent_as_single_batch():
+    async def scenario():
+        broker = FakeBroker()
+        sender, receiver = FakeTransport(broker), FakeTransport(broker)
+        subscription = receiver.subscribe(["events"], policy="drop_oldest")
+        for n in range(5):
+            sender.publish("events", {"n": n})
+        assert sender.batches == 0 and subscription.depth == 0  # tick이 끝나기 전에는 전송 안 함
+        await sender.flush()
+        first = (sender.batches, sender.sent)
+
+        for n in (5, 6):  # 전송이 끝난 뒤의 publish → 별도 배치
+            sender.publish("events", {"n": n})
+            await sender.flush()
+        items = [message["n"] for _, message in _drain(subscription)]
+        await sender.close()
+        await receiver.close()
+        return first, (sender.batches, sender.sent), items
+
+    first, second, items = asyncio.run(scenario())
+    assert first == (1, 5)
+    assert second == (3, 7)
+    assert items == list(range(7))